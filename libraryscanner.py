@@ -6,6 +6,7 @@ from abc import ABC, abstractmethod
 from typing import List, Tuple
 from pathlib import Path
 import os
+import time
 from collections import Counter
 from colorama import Fore, Style
 from mutagen.flac import FLAC
@@ -512,6 +513,8 @@ class FlacLibraryScanner(MusicLibraryScanner):
 class ProgressTrackingFlacScanner(FlacLibraryScanner):
     """Extended FlacLibraryScanner with detailed progress tracking."""
     
+    progress_interval = 0.1  # Minimum seconds between progress lines (at most ~10 per second)
+    
     def __init__(self, music_dir: str, min_artist_count: int = 1):
         """
         Initialize the FLAC library scanner with progress tracking.
@@ -524,6 +527,22 @@ class ProgressTrackingFlacScanner(FlacLibraryScanner):
         self.total_subdirs = 0
         self.processed_subdirs = 0
         self.total_artist_dirs = 0
+        self.last_progress_time = 0.0
+    
+    def report_progress(self) -> None:
+        """
+        Print the directory progress line, throttled to progress_interval.
+        
+        Directories are often processed far faster than the launcher can usefully redraw,
+        so intermediate updates are skipped; the last directory is always reported.
+        """
+        now = time.monotonic()
+        if self.processed_subdirs < self.total_subdirs and now - self.last_progress_time < self.progress_interval:
+            return
+        self.last_progress_time = now
+        
+        progress_percent = (self.processed_subdirs / self.total_subdirs) * 100
+        print(f"Progress: {progress_percent:.1f}% ({self.processed_subdirs}/{self.total_subdirs} directories)")
     
     def count_artist_directories(self) -> int:
         """
@@ -595,8 +614,7 @@ class ProgressTrackingFlacScanner(FlacLibraryScanner):
                         self.processed_subdirs += 1
                         
                         # Report progress as percentage
-                        progress_percent = (self.processed_subdirs / self.total_subdirs) * 100
-                        print(f"Progress: {progress_percent:.1f}% ({self.processed_subdirs}/{self.total_subdirs} directories)")
+                        self.report_progress()
                 
                 for file in flac_files:
                     try:
@@ -627,8 +645,7 @@ class ProgressTrackingFlacScanner(FlacLibraryScanner):
                         self.processed_subdirs += 1
                         
                         # Report progress as percentage
-                        progress_percent = (self.processed_subdirs / self.total_subdirs) * 100
-                        print(f"Progress: {progress_percent:.1f}% ({self.processed_subdirs}/{self.total_subdirs} directories)")
+                        self.report_progress()
                 
                 for file in files:
                     if file.lower().endswith('.flac'):
@@ -4,6 +4,7 @@ MusicBrainz API module for accessing music metadata.
 
 import random
 import time
+import threading
 from typing import Dict, List, Optional, Set
 import requests
 from abc import ABC, abstractmethod
@@ -122,8 +123,29 @@ class MusicBrainzAPI(MusicDatabase):
         # Keep track of consecutive failures for adaptive backoff
         self.consecutive_failures = 0
         self.current_delay = BASE_REQUEST_DELAY
-        # Track the time of the last API request to ensure rate limiting
-        self.last_request_time = 0
+        # Track the (monotonic) time of the last API request to ensure rate limiting
+        self.last_request_time = float('-inf')
+        # Guards last_request_time so concurrent callers still respect the rate limit
+        self.rate_limit_lock = threading.Lock()
+
+    def _wait_for_rate_limit(self) -> None:
+        """
+        Block until this caller may send the next MusicBrainz request.
+        
+        Each caller reserves the next free slot under the lock, then sleeps outside it,
+        so concurrent callers queue up behind each other instead of all firing at once.
+        Uses time.monotonic() so system clock changes can't break the spacing.
+        """
+        with self.rate_limit_lock:
+            current_time = time.monotonic()
+            next_slot = max(current_time, self.last_request_time + BASE_REQUEST_DELAY)
+            self.last_request_time = next_slot
+        
+        sleep_time = next_slot - current_time
+        if sleep_time > 0:
+            # Only sleep for the remaining time needed to respect the 2-second limit
+            print(f"{Fore.YELLOW}Pausing for {sleep_time:.2f} seconds to respect rate limit{Style.RESET_ALL}")
+            time.sleep(sleep_time)
 
     def _make_api_request(self, url: str, params: Dict, context: str) -> Optional[Dict]:
         """
@@ -161,21 +183,11 @@ class MusicBrainzAPI(MusicDatabase):
                 print(f"Request Params: {sanitized_params}{Style.RESET_ALL}")
                 
                 # Ensure rate limiting - respect 2 seconds between API calls
-                current_time = time.time()
-                time_since_last_request = current_time - self.last_request_time
-                
-                if time_since_last_request < BASE_REQUEST_DELAY:
-                    # Only sleep for the remaining time needed to respect the 2-second limit
-                    sleep_time = BASE_REQUEST_DELAY - time_since_last_request
-                    print(f"{Fore.YELLOW}Pausing for {sleep_time:.2f} seconds to respect rate limit{Style.RESET_ALL}")
-                    time.sleep(sleep_time)
+                self._wait_for_rate_limit()
                 
                 # Make the request
                 response = requests.get(url, headers=self.headers, params=params)
                 
-                # Update the last request time
-                self.last_request_time = time.time()
-                
                 # Successful response
                 if response.status_code == 200:
                     print(f"{Fore.GREEN}SUCCESS: {context} completed successfully{Style.RESET_ALL}")
@@ -9,8 +9,6 @@ import time
 import os
 import sys
 import random
-import tkinter as tk
-from tkinter import filedialog
 from pathlib import Path
 from colorama import Fore, Style, init
 from typing import Dict, List, Optional, Set, Tuple
@@ -964,9 +962,14 @@ def browse_directory() -> Optional[str]:
     Returns:
         Optional[str]: Selected directory path or None if canceled
     """
-    # Hide the main tkinter window
+    # Tk is only loaded when no directory was given on the command line
+    import tkinter as tk
+    from tkinter import filedialog
+    
+    # Hide the main tkinter window, flushing the withdraw so it doesn't flash up
     root = tk.Tk()
     root.withdraw()
+    root.update_idletasks()
     
     # Open the file dialog
     directory = filedialog.askdirectory(
@@ -1239,6 +1242,7 @@ def main():
     """Main entry point for the Music Discovery script."""
     # Set up argument parser
     parser = argparse.ArgumentParser(description="Music Discovery script to find similar artists in FLAC collection")
+    parser.add_argument('music_dir_arg', nargs='?', metavar='MUSIC_DIR', help='Path to FLAC music directory (same as --dir)')
     parser.add_argument('--dir', dest='music_dir', help='Path to FLAC music directory')
     parser.add_argument('--save-in-music-dir', action='store_true', help='Save recommendations.json in music directory')
     parser.add_argument('--email', dest='mb_email', default=DEFAULT_EMAIL, 
@@ -1247,9 +1251,9 @@ def main():
     args = parser.parse_args()
     
     # Get music directory from command line or prompt user
-    music_dir = args.music_dir
+    music_dir = args.music_dir or args.music_dir_arg
     if not music_dir:
-        music_dir = select_directory()
+        music_dir = browse_directory()
         if not music_dir:
             print("No directory selected. Exiting.")
             return
@@ -1261,9 +1265,9 @@ def main():
     
     # Process the library and generate recommendations
     try:
-        start_time = time.time()
+        start_time = time.perf_counter()  # Monotonic, so clock adjustments can't skew the duration
         recommendations = process_music_library(music_dir, mb_email=args.mb_email)
-        process_time = time.time() - start_time
+        process_time = time.perf_counter() - start_time
         print(f"Music discovery completed in {process_time:.2f} seconds")
 
         # Determine output path
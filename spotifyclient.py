@@ -11,19 +11,186 @@ import socket
 import logging
 import io
 import random
+import heapq
+import sqlite3
 import traceback
+import threading
+import unicodedata
 import backoff
 import argparse
-from tkinter import Tk
-from tkinter.filedialog import askopenfilename
+import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any, Tuple
-from collections import defaultdict
+from collections import defaultdict, deque
+from functools import lru_cache
+from types import MappingProxyType
 from spotipy import SpotifyOAuth, Spotify
 from spotipy.exceptions import SpotifyException
 from colorama import init, Fore, Style
 
 from musicbrainz import MusicBrainzAPI, normalize_artist_name
 
+# orjson is optional - it decodes the cached Spotify payloads much faster than the stdlib
+try:
+    import orjson
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:
+    json_loads = json.loads
+    json_dumps = lambda value: json.dumps(value, ensure_ascii=False)
+
+# ijson is optional - it streams the recommendations file instead of loading it whole
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Persistent cache for Spotify lookups that rarely change between runs
+SPOTIFY_CACHE_FILE = "spotify_cache.db"
+SPOTIFY_CACHE_TTL = 7 * 24 * 60 * 60  # Seconds before a cached lookup expires (7 days)
+# Longer lifetimes for lookups that change less often, keyed by cache key prefix
+SPOTIFY_CACHE_TTLS = {
+    "id": 365 * 24 * 60 * 60,  # Artist name to Spotify ID (1 year)
+    "top": 30 * 24 * 60 * 60,  # Artist top tracks (30 days)
+}
+
+# Genre family roots used for conflict resolution when generating playlists
+GENRE_FAMILIES = MappingProxyType({
+    'Rock': ('Rock', 'Rock - Alternative', 'Rock - Classic', 'Rock - Indie', 'Rock - Progressive'),
+    'Metal': ('Metal', 'Metal - Heavy', 'Metal - Thrash', 'Metal - Death/Black', 'Metal - Progressive'),
+    'Pop': ('Pop', 'Pop - Dance', 'Pop - Synth', 'Pop - Indie'),
+    'Electronic': ('Electronic', 'Electronic - House', 'Electronic - Techno', 'Electronic - Ambient', 
+                  'Electronic - Drum & Bass', 'Electronic - Trance'),
+    'Hip Hop': ('Hip Hop', 'Hip Hop - Old School', 'Hip Hop - Trap', 'Hip Hop - Alternative'),
+    'R&B & Soul': ('R&B & Soul', 'R&B', 'Soul', 'Funk'),
+    'Jazz': ('Jazz', 'Jazz - Fusion', 'Jazz - Bebop', 'Jazz - Contemporary'),
+    'Folk & Country': ('Folk & Country', 'Folk', 'Country', 'Americana', 'Singer-Songwriter'),
+    'Classical': ('Classical', 'Orchestral', 'Chamber', 'Piano'),
+    'World': ('World', 'Latin', 'Reggae', 'African', 'Asian')
+})
+
+# Reverse lookup to find which family a genre belongs to
+GENRE_TO_FAMILY = MappingProxyType({
+    genre: family for family, genres in GENRE_FAMILIES.items() for genre in genres
+})
+
+# Genre families that shouldn't share artists
+FAMILY_CONFLICTS = MappingProxyType({
+    'Rock': ('Classical', 'Jazz', 'Electronic', 'Hip Hop', 'World'),
+    'Metal': ('Classical', 'Jazz', 'Electronic', 'Pop', 'Hip Hop', 'R&B & Soul', 'Folk & Country', 'World'),
+    'Electronic': ('Rock', 'Metal', 'Classical', 'Folk & Country', 'Blues'),
+    'Hip Hop': ('Rock', 'Metal', 'Classical', 'Folk & Country', 'Blues'),
+    'Pop': ('Metal', 'Classical', 'Blues'),
+    'Classical': ('Rock', 'Metal', 'Electronic', 'Hip Hop', 'Pop', 'Punk'),
+    'Folk & Country': ('Electronic', 'Hip Hop', 'Metal'),
+    'Jazz': ('Metal', 'Punk')
+})
+
+# Related genres used when matching an artist against a target genre
+RELATED_GENRES = MappingProxyType({
+    # Rock family
+    'rock': ('alternative', 'indie', 'punk', 'metal', 'hard rock', 'classic rock', 
+            'progressive rock', 'art rock', 'industrial rock', 'industrial', 
+            'alternative rock', 'post-punk', 'grunge', 'new wave', 'garage'),
+
+    # Metal family - added as separate category
+    'metal': ('heavy metal', 'thrash metal', 'death metal', 'black metal', 'doom metal', 
+             'progressive metal', 'power metal', 'folk metal', 'gothic metal', 'alternative metal'),
+
+    # Electronic music family
+    'electronic': ('techno', 'house', 'trance', 'edm', 'dance', 'ambient', 'dubstep',
+                  'electronica', 'downtempo', 'idm', 'drum and bass', 'electro', 
+                  'breakbeat', 'jungle', 'trip hop'),
+
+    # Pop music family
+    'pop': ('dance pop', 'synth pop', 'indie pop', 'electropop', 'pop rock', 'europop',
+           'power pop', 'chamber pop', 'baroque pop', 'dream pop', 'sophisti-pop'),
+
+    # Hip hop family
+    'hip hop': ('rap', 'trap', 'gangsta rap', 'conscious hip hop', 'old school hip hop',
+               'alternative hip hop', 'southern hip hop', 'east coast hip hop', 'west coast hip hop'),
+
+    # R&B and Soul family
+    'r&b': ('soul', 'funk', 'contemporary r&b', 'neo soul', 'rhythm and blues', 'gospel'),
+
+    # Jazz family
+    'jazz': ('bebop', 'swing', 'fusion', 'blues', 'smooth jazz', 'free jazz', 'modal jazz', 
+           'cool jazz', 'hard bop', 'avant-garde jazz', 'big band'),
+
+    # Classical music family
+    'classical': ('baroque', 'romantic', 'contemporary classical', 'orchestral', 'chamber music',
+                 'opera', 'symphony', 'concerto', 'sonata', 'piano'),
+
+    # Folk and Country family
+    'folk': ('acoustic', 'singer-songwriter', 'americana', 'country', 'bluegrass',
+           'traditional folk', 'folk rock', 'british folk', 'celtic'),
+
+    'country': ('country rock', 'outlaw country', 'country pop', 'alternative country',
+               'traditional country', 'honky tonk', 'americana', 'bluegrass'),
+
+    # World music family
+    'world': ('reggae', 'latin', 'afrobeat', 'afro-pop', 'bossa nova', 'salsa', 'samba',
+             'flamenco', 'celtic', 'traditional'),
+
+    # Additional categories for better matching
+    'indie': ('indie rock', 'indie pop', 'alternative', 'lo-fi', 'post-rock', 'shoegaze'),
+
+    'alternative': ('alternative rock', 'indie', 'post-punk', 'grunge', 'new wave',
+                   'college rock', 'experimental rock'),
+
+    'punk': ('hardcore', 'post-punk', 'pop punk', 'skate punk', 'anarcho-punk',
+            'garage punk', 'punk rock', 'oi!'),
+
+    'ambient': ('downtempo', 'chillout', 'drone', 'ambient electronic', 'dark ambient'),
+
+    'experimental': ('avant-garde', 'noise', 'industrial', 'experimental rock', 
+                   'experimental electronic', 'musique concrète'),
+
+    # Genre refinements for more accurate matching
+    # House music variants
+    'house': ('deep house', 'tech house', 'progressive house', 'acid house', 'electro house'),
+
+    # Trance music variants
+    'trance': ('progressive trance', 'uplifting trance', 'psychedelic trance', 'goa trance'),
+
+    # Techno music variants
+    'techno': ('minimal techno', 'detroit techno', 'hard techno', 'acid techno'),
+})
+
+# RELATED_GENRES as frozensets, so membership and overlap checks are hash lookups
+RELATED_GENRE_SETS = MappingProxyType({
+    family: frozenset(genres) for family, genres in RELATED_GENRES.items()
+})
+
+# Inverse of RELATED_GENRES: for each genre, the families it is the root of or listed under,
+# and the families that list it as a related genre (both in table order)
+GENRE_MEMBER_FAMILIES = defaultdict(list)
+GENRE_PARENT_FAMILIES = defaultdict(list)
+for family, genres in RELATED_GENRES.items():
+    GENRE_MEMBER_FAMILIES[family].append(family)
+    for genre in genres:
+        if family not in GENRE_MEMBER_FAMILIES[genre]:
+            GENRE_MEMBER_FAMILIES[genre].append(family)
+        GENRE_PARENT_FAMILIES[genre].append(family)
+GENRE_MEMBER_FAMILIES = MappingProxyType({genre: tuple(families) for genre, families in GENRE_MEMBER_FAMILIES.items()})
+GENRE_PARENT_FAMILIES = MappingProxyType({genre: tuple(families) for genre, families in GENRE_PARENT_FAMILIES.items()})
+
+# Lowercase genre families that conflict with each other, to prevent cross-genre contamination
+CONFLICTING_GENRES = MappingProxyType({
+    'rock': ('electronic', 'pop', 'hip hop', 'jazz', 'classical', 'r&b', 'world', 'country'),
+    'metal': ('electronic', 'pop', 'hip hop', 'jazz', 'classical', 'r&b', 'world', 'country', 'folk'),
+    'electronic': ('rock', 'metal', 'country', 'folk', 'classical', 'blues'),
+    'pop': ('metal', 'hardcore', 'classical', 'blues', 'experimental'),
+    'hip hop': ('rock', 'metal', 'folk', 'classical', 'blues', 'country', 'world'),
+    'jazz': ('metal', 'electronic', 'hip hop', 'rock', 'punk'),
+    'classical': ('rock', 'electronic', 'hip hop', 'pop', 'metal', 'punk', 'industrial'),
+    'folk': ('electronic', 'hip hop', 'metal', 'industrial', 'techno'),
+    'country': ('electronic', 'hip hop', 'metal', 'industrial', 'techno', 'punk'),
+    'blues': ('electronic', 'hip hop', 'pop', 'techno', 'metal'),
+    'world': ('metal', 'punk', 'industrial', 'hip hop')
+})
+
 
 def get_config_path(filename: str = "config.json") -> str:
     """Get the absolute path to a config or data file, using the EXE location if frozen."""
@@ -102,37 +269,68 @@ if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
+# Only colour output for a terminal; when piped (the launcher, log files) colorama's
+# stream wrapper and the escape codes are pure overhead
+IS_TTY = sys.stdout.isatty()
+
 # Initialize Colorama
-init(autoreset=True)
+if IS_TTY:
+    init(autoreset=True)
 
 
 class CustomLogFormatter(logging.Formatter):
     """Custom formatter to add colors to log messages."""
     
+    # Colour templates per level, built once rather than re-assembled for every record
+    LEVEL_TEMPLATES = {
+        'INFO': f"{Fore.CYAN}%s{Style.RESET_ALL}",
+        'WARNING': f"{Fore.YELLOW}WARNING: {Fore.RED}%s{Style.RESET_ALL}",
+        'ERROR': f"{Fore.YELLOW}ERROR: {Fore.RED}%s{Style.RESET_ALL}",
+    }
+    # Same prefixes without escape codes, for output that isn't a terminal
+    PLAIN_TEMPLATES = {
+        'INFO': "%s",
+        'WARNING': "WARNING: %s",
+        'ERROR': "ERROR: %s",
+    }
+    
+    def __init__(self, use_colour: bool = True):
+        """
+        Initialize the formatter.
+        
+        Args:
+            use_colour (bool): Wrap messages in colour codes; plain prefixes are kept either way
+        """
+        super().__init__()
+        self.templates = self.LEVEL_TEMPLATES if use_colour else self.PLAIN_TEMPLATES
+    
     def format(self, record):
         """Format log messages with colors."""
         levelname = record.levelname
         message = record.getMessage()
         
-        if levelname == 'INFO':
-            return f"{Fore.CYAN}{message}{Style.RESET_ALL}"
-        elif levelname == 'WARNING':
-            return f"{Fore.YELLOW}WARNING: {Fore.RED}{message}{Style.RESET_ALL}"
-        elif levelname == 'ERROR':
-            if "Failed to resolve 'api.spotify.com'" in message:
-                # Mark DNS errors for special handling
-                return f"{Fore.YELLOW}ERROR: {Fore.RED}{message}{Style.RESET_ALL} [DNS_ERROR]"
-            return f"{Fore.YELLOW}ERROR: {Fore.RED}{message}{Style.RESET_ALL}"
-        else:
+        template = self.templates.get(levelname)
+        if template is None:
             return message
+        
+        formatted = template % message
+        if levelname == 'ERROR' and "Failed to resolve 'api.spotify.com'" in message:
+            # Mark DNS errors for special handling
+            formatted += " [DNS_ERROR]"
+        return formatted
 
 
 # Set up logging
-def setup_logging():
-    """Configure logging with custom formatter."""
+def setup_logging(verbose: bool = False):
+    """
+    Configure logging with custom formatter.
+    
+    Args:
+        verbose (bool): Also show debug messages such as individual API calls
+    """
     # Create console handler
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(CustomLogFormatter())
+    console_handler.setFormatter(CustomLogFormatter(use_colour=IS_TTY))
     
     # Configure root logger
     root_logger = logging.getLogger()
@@ -140,7 +338,7 @@ def setup_logging():
         root_logger.removeHandler(handler)
     
     root_logger.addHandler(console_handler)
-    root_logger.setLevel(logging.INFO)
+    root_logger.setLevel(logging.DEBUG if verbose else logging.INFO)
 
 
 # Define backoff handler
@@ -151,20 +349,276 @@ def backoff_hdlr(details):
         f"calling {details['target'].__name__}")
 
 
-def dns_resolve_backoff(exception):
-    """Return True if this is a DNS resolution error."""
-    if isinstance(exception, socket.gaierror):
-        return True
-    if isinstance(exception, Exception) and "getaddrinfo failed" in str(exception):
-        return True
-    return False
+def fold_artist_name(name: str) -> str:
+    """
+    Lowercase an artist name and strip accents so near-identical names compare equal.
+    
+    Args:
+        name (str): Artist name
+        
+    Returns:
+        str: Folded artist name
+    """
+    decomposed = unicodedata.normalize('NFKD', name.lower().strip())
+    return ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def artist_cache_key(name: str) -> str:
+    """
+    Build the key artist-name caches are stored under.
+    
+    Folds case and accents and applies normalize_artist_name, so variants such as
+    "Beyoncé" / "Beyonce" or "The Cure" / "Cure" share one cache entry. Names made
+    only of symbols would normalize to nothing, so they fall back to the folded name.
+    
+    Args:
+        name (str): Artist name
+        
+    Returns:
+        str: Cache key for the artist
+    """
+    folded = fold_artist_name(name)
+    return normalize_artist_name(folded) or folded
+
+
+def artist_id_cache_key(name: str, target_genre: str) -> str:
+    """
+    Build the lookup-cache key a resolved Spotify artist ID is stored under.
+    
+    The ID comes from a genre-aware search, so the key keeps the unfolded name and
+    the target's primary genre: "The X" and "X", or one name searched under two
+    genres, can resolve to different Spotify artists.
+    
+    Args:
+        name (str): Artist name
+        target_genre (str): Genre the artist was searched for
+        
+    Returns:
+        str: Cache key for the artist's Spotify ID
+    """
+    primary_target = target_genre.lower().split(' - ')[0]
+    return f"id:{name.lower()}:{primary_target}"
+
+
+def sift3_distance(s1: str, s2: str, max_offset: int = 5) -> float:
+    """
+    Approximate edit distance between two strings using the Sift3 algorithm.
+    
+    Sift3 walks both strings once, looking up to max_offset characters ahead to
+    resynchronise after a mismatch, which makes it far cheaper than Levenshtein
+    while still tolerating small typos and punctuation differences.
+    
+    Args:
+        s1 (str): First string
+        s2 (str): Second string
+        max_offset (int): How far ahead to search for a matching character
+        
+    Returns:
+        float: Approximate distance (0 means identical)
+    """
+    if not s1:
+        return float(len(s2))
+    if not s2:
+        return float(len(s1))
+    
+    c = 0
+    offset1 = 0
+    offset2 = 0
+    lcs = 0
+    
+    while c + offset1 < len(s1) and c + offset2 < len(s2):
+        if s1[c + offset1] == s2[c + offset2]:
+            lcs += 1
+        else:
+            offset1 = 0
+            offset2 = 0
+            for i in range(max_offset):
+                if c + i < len(s1) and s1[c + i] == s2[c]:
+                    offset1 = i
+                    break
+                if c + i < len(s2) and s1[c] == s2[c + i]:
+                    offset2 = i
+                    break
+        c += 1
+    
+    return (len(s1) + len(s2)) / 2 - lcs
+
+
+# Network errors worth retrying with backoff - DNS failures and dropped connections
+RETRIABLE_NETWORK_ERRORS = (socket.gaierror, requests.exceptions.ConnectionError)
+
+# Shared retry decorator for Spotify calls; full jitter keeps concurrent workers from retrying in lockstep
+retry_on_network_error = backoff.on_exception(
+    backoff.expo,
+    RETRIABLE_NETWORK_ERRORS,
+    max_tries=5,
+    jitter=backoff.full_jitter,
+    on_backoff=backoff_hdlr
+)
+
+
+class SpotifyLookupCache:
+    """
+    SQLite-backed cache for Spotify search, top-tracks and artist genre lookups.
+    
+    Values are stored as JSON with an expiry timestamp, so repeated runs over the
+    same recommendations can skip the network for artists seen within the TTL.
+    Keys are prefixed by lookup type ("id:", "top:", ...), which selects the TTL
+    from SPOTIFY_CACHE_TTLS.
+    """
+    
+    def __init__(self, db_path: str, ttl: float = SPOTIFY_CACHE_TTL):
+        """
+        Open (or create) the cache database.
+        
+        Args:
+            db_path (str): Path to the SQLite database file
+            ttl (float): Number of seconds a cached value stays valid, unless its key
+                prefix has its own entry in SPOTIFY_CACHE_TTLS
+        """
+        self.ttl = ttl
+        self.lock = threading.Lock()  # sqlite3 connections are shared between worker threads
+        
+        try:
+            self.conn = sqlite3.connect(db_path, check_same_thread=False)
+            # WAL keeps commits cheap and lets another process read while we write
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB, expires REAL)")
+            self.conn.commit()
+            logging.info(f"Using Spotify lookup cache: {db_path}")
+        except sqlite3.Error as e:
+            # Fall back to an in-memory cache so lookups still work for this run
+            logging.warning(f"Could not open Spotify lookup cache at {db_path}: {e}")
+            self.conn = sqlite3.connect(":memory:", check_same_thread=False)
+            self.conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB, expires REAL)")
+    
+    def get(self, key: str) -> Any:
+        """
+        Get a cached value if present and not expired.
+        
+        Args:
+            key (str): Cache key
+            
+        Returns:
+            Any: Cached value or None if missing or expired
+        """
+        try:
+            with self.lock:
+                row = self.conn.execute(
+                    "SELECT value FROM cache WHERE key = ? AND expires > ?", (key, time.time())
+                ).fetchone()
+            return json_loads(row[0]) if row else None
+        except (sqlite3.Error, ValueError) as e:
+            logging.warning(f"Error reading Spotify lookup cache for {key}: {e}")
+            return None
+    
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value in the cache.
+        
+        Args:
+            key (str): Cache key
+            value (Any): JSON-serializable value to store
+        """
+        try:
+            payload = json_dumps(value)
+            ttl = SPOTIFY_CACHE_TTLS.get(key.partition(":")[0], self.ttl)
+            with self.lock:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, value, expires) VALUES (?, ?, ?)",
+                    (key, payload, time.time() + ttl)
+                )
+                self.conn.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logging.warning(f"Error writing Spotify lookup cache for {key}: {e}")
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket used to pace Spotify API requests.
+    
+    Requests only wait once the burst budget is spent, rather than after every call,
+    and a rate-limit response can drain the bucket for the server's Retry-After period.
+    Each rate-limit response also halves the refill rate, which climbs back towards
+    the configured rate as requests keep succeeding.
+    """
+    
+    recovery_successes = 20  # Successful requests needed before the rate is raised again
+    recovery_factor = 1.25  # Rate multiplier applied on each recovery step
+    
+    def __init__(self, rate_per_sec: float, burst: int):
+        """
+        Create a full bucket.
+        
+        Args:
+            rate_per_sec (float): Tokens added per second
+            burst (int): Maximum number of tokens the bucket holds
+        """
+        self.rate = rate_per_sec
+        self.max_rate = rate_per_sec
+        self.min_rate = rate_per_sec / 8  # Never slow down beyond this, however many 429s we see
+        self.successes = 0
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Take one token, blocking until one is available."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                # Refill for the time elapsed; tokens can go negative after a penalty
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                
+                wait_time = (1 - self.tokens) / self.rate
+            
+            time.sleep(wait_time)
+    
+    def penalize(self, seconds: float) -> None:
+        """
+        Empty the bucket so no request goes out for the given number of seconds, and
+        halve the refill rate.
+        
+        Args:
+            seconds (float): How long the server asked us to back off
+        """
+        with self.lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self.successes = 0
+            self.tokens = min(self.tokens, -seconds * self.rate)
+            self.updated = time.monotonic()
+    
+    def record_success(self) -> None:
+        """Count a successful request, raising a reduced rate after enough in a row."""
+        with self.lock:
+            if self.rate >= self.max_rate:
+                return
+            
+            self.successes += 1
+            if self.successes >= self.recovery_successes:
+                self.rate = min(self.max_rate, self.rate * self.recovery_factor)
+                self.successes = 0
 
 
 class SpotifyPlaylistManager:
     """Manager for creating Spotify playlists."""
     
-    request_delay = 1.2  # Minimum delay between consecutive Spotify API requests
-    musicbrainz_delay = 2.0  # Minimum delay between consecutive MusicBrainz API requests
+    request_rate = 3.0  # Sustained Spotify API requests per second in total, across all endpoints and threads
+    request_burst = 10  # Requests allowed back-to-back before pacing kicks in
+    endpoint_request_rate = 2.0  # Most of the total rate any one endpoint may use
+    endpoint_request_burst = 6  # Most of the burst any one endpoint may use
+    max_workers = 12  # Maximum number of concurrent Spotify requests when fetching artist tracks
+    musicbrainz_workers = 4  # Concurrent MusicBrainz genre lookups (requests are still spaced by the client)
+    min_playlist_tracks = 10  # Genres with fewer matched tracks don't get a playlist
+    min_playlist_artists = 3  # Genres with fewer contributing artists don't get a playlist
+    playlist_chunk_size = 100  # Most tracks Spotify accepts in one add-items request
+    max_artists_per_genre = 50  # Most artists whose tracks are looked up for one genre
 
     def __init__(self, client_id=None, client_secret=None, mb_email=None):
         """
@@ -194,21 +648,26 @@ class SpotifyPlaylistManager:
         # Initialize MusicBrainz API client with custom email if provided
         self.mb = MusicBrainzAPI(user_email=self.mb_email)
         
-        self.last_mb_request_time = 0  # Track time of last MusicBrainz API request
         self.artist_genre_cache = {}  # Cache to store artist genre mappings
+        self.genre_lookups_in_flight = {}  # Cache key -> Event set once a worker's genre lookup finishes
+        self.genre_lookups_lock = threading.Lock()
+        self.api_semaphore = threading.BoundedSemaphore(self.max_workers)  # Caps in-flight Spotify requests across threads
+        self.request_bucket = TokenBucket(self.request_rate, self.request_burst)  # Caps total Spotify traffic across threads
+        self.request_buckets = {}  # One TokenBucket per Spotify endpoint, pacing requests across threads
+        self.request_buckets_lock = threading.Lock()
+        self.token_refresh_lock = threading.Lock()  # Only one worker refreshes an expired token at a time
+        self.token_generation = 0  # Bumped on every token refresh, so workers can tell theirs was replaced
+        self.lookup_cache = SpotifyLookupCache(os.path.join(get_executable_directory(), SPOTIFY_CACHE_FILE))
+        self.artist_tracks_cache = {}  # Candidate tracks per Spotify artist ID, reused across genres
+        self.user_playlists = None  # The user's playlists, fetched on first use
+        self.source_artists = None  # Library artists from the recommendations file, set by read_artist_genres
         self.total_keys = 0
         self.processed_keys = 0
         self.total_to_process = 0
         self.processed_count = 0
         logging.info("Spotify Authentication Successful!")
 
-    @backoff.on_exception(
-        backoff.expo, 
-        (socket.gaierror, Exception),
-        max_tries=5,
-        giveup=lambda e: not dns_resolve_backoff(e),
-        on_backoff=backoff_hdlr
-    )
+    @retry_on_network_error
     def create_spotify_client(self) -> Spotify:
         """
         Create and authenticate the Spotify client.
@@ -235,11 +694,20 @@ class SpotifyPlaylistManager:
                 cache_path=".spotify_token_cache"  # Cache token to avoid repeated auth
             )
             
+            # One pooled session for all API calls, with a connection per concurrent worker
+            # so keep-alive connections aren't discarded (requests pools only 10 by default).
+            # Status retries are left to retry_on_rate_limit, which shares 429 back-off
+            # across threads; spotipy's built-in retries would hide them from it
+            pool_size = self.max_workers
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0))
+            
             # Test the connection and token
-            client = Spotify(auth_manager=auth_manager)
+            client = Spotify(auth_manager=auth_manager, requests_session=session)
             
             # Verify token works by making a simple API call
             user = client.current_user()
+            self.user = user  # Reused wherever the user's ID or name is needed, saving a round trip
             logging.info(f"Successfully authenticated as: {user.get('display_name', user.get('id', 'Unknown'))}")
             
             # Check if we have the correct scopes
@@ -421,7 +889,7 @@ class SpotifyPlaylistManager:
                 
                 # Accept if there's at least one common word
                 if len(artist_words.intersection(result_words)) == 0:
-                    logging.warning(f"Fuzzy match weak for '{artist_name}' → '{artist['name']}', skipping.")
+                    logging.warning("Fuzzy match weak for '%s' → '%s', skipping.", artist_name, artist['name'])
                     return []
 
             
@@ -435,29 +903,37 @@ class SpotifyPlaylistManager:
             logging.error(f"Error getting Spotify genres for '{artist_name}': {e}")
             return []
 
-    def batch_get_artist_genres(self, artists: List[str], batch_size: int = 25) -> Dict[str, Tuple[str, List[str]]]:
+    def batch_get_artist_genres(self, artists: List[str], batch_size: int = 25) -> Dict[str, Tuple[str, List[str], Tuple[str, ...]]]:
         """
         Comprehensively retrieve genres for a batch of artists using multiple strategies.
         
+        Genres are lowercased once here, when they enter the cache, so that the
+        scoring code can use the lowered tuple directly.
+        
         Args:
             artists (List[str]): List of artist names to get genres for
             batch_size (int): Number of artists to process in each batch
         
         Returns:
-            Dict[str, Tuple[str, List[str]]]: Dictionary mapping artist names to (primary_genre, genre_list)
+            Dict[str, Tuple[str, List[str], Tuple[str, ...]]]: Dictionary mapping artist names to
+                (primary_genre, genre_list, lowercased_genres)
         """
         # Results dictionary to store genre information
         results = {}
         
         # First, filter out cached and duplicate artists
         unique_artists = []
+        seen_names = set()
         for artist in artists:
-            normalized_name = artist.lower().strip()
+            normalized_name = artist_cache_key(artist)
             
-            # Check cache first
+            # Check cache first, then genres persisted by a previous run
             if normalized_name in self.artist_genre_cache:
                 results[artist] = self.artist_genre_cache[normalized_name]
-            elif normalized_name not in [u.lower().strip() for u in unique_artists]:
+            elif self.load_cached_genres(normalized_name):
+                results[artist] = self.artist_genre_cache[normalized_name]
+            elif normalized_name not in seen_names:
+                seen_names.add(normalized_name)
                 unique_artists.append(artist)
         
         # If no new artists to look up, return cached results
@@ -467,83 +943,24 @@ class SpotifyPlaylistManager:
         # Process artists in batches
         for i in range(0, len(unique_artists), batch_size):
             batch = unique_artists[i:i+batch_size]
-            logging.info(f"Processing batch of {len(batch)} artists")
+            logging.info("Processing batch of %s artists", len(batch))
             
             try:
-                # Batch search artists to get their MusicBrainz IDs first
-                batch_artist_ids = {}
-                for artist_name in batch:
-                    try:
-                        # Search for the artist to get the ID
-                        artist_info = self.mb.search_artist(artist_name)
-                        if artist_info:
-                            batch_artist_ids[artist_name] = artist_info['id']
-                        else:
-                            logging.warning(f"No MusicBrainz ID found for artist: {artist_name}")
-                    except Exception as e:
-                        logging.error(f"Error searching for artist {artist_name}: {e}")
+                # Look up the batch concurrently - the MusicBrainz client spaces the requests
+                # itself, so the workers only overlap each request's latency with that spacing
+                with ThreadPoolExecutor(max_workers=self.musicbrainz_workers) as executor:
+                    batch_results = list(executor.map(self.lookup_artist_genres, batch))
                 
-                # If no artists found, skip this batch
-                if not batch_artist_ids:
+                if not any(batch_results):
                     logging.warning("No artists found in this batch")
                     continue
                 
-                # Process each artist individually for maximum robustness
-                for artist_name, artist_id in batch_artist_ids.items():
-                    try:
-                        # Detailed genre lookup for each artist
-                        genre_params = {
-                            'inc': 'genres',
-                            'fmt': 'json'
-                        }
-                        
-                        # First, try MusicBrainz direct artist lookup
-                        artist_result = self.mb._make_api_request(
-                            f"{self.mb.base_url}artist/{artist_id}", 
-                            genre_params, 
-                            f"Detailed genre lookup for {artist_name}"
-                        )
-                        
-                        # Extract genres from MusicBrainz
-                        artist_genres = []
-                        if artist_result and 'genres' in artist_result:
-                            artist_genres = [genre['name'] for genre in artist_result['genres']]
-                            logging.info(f"MusicBrainz genres for {artist_name}: {artist_genres}")
-                        
-                        # If no genres from MusicBrainz, try Spotify
-                        if not artist_genres:
-                            logging.info(f"No MusicBrainz genres for {artist_name}, trying Spotify")
-                            artist_genres = self.get_spotify_artist_genres(artist_name)
-                            logging.info(f"Spotify genres for {artist_name}: {artist_genres}")
-                        
-                        # Normalize and process genres
-                        if artist_genres:
-                            cleaned_genres = self.normalize_genres(artist_genres)
-                            primary_genre = cleaned_genres[0] if cleaned_genres else "Miscellaneous"
-                            
-                            # Cache and store results
-                            genre_result = (primary_genre, cleaned_genres)
-                            results[artist_name] = genre_result
-                            self.artist_genre_cache[artist_name.lower().strip()] = genre_result
-                            
-                            logging.info(f"Processed {artist_name}: Primary Genre = {primary_genre}, All Genres = {cleaned_genres}")
-                        else:
-                            # Default to Miscellaneous if no genres found
-                            results[artist_name] = ("Miscellaneous", [])
-                            self.artist_genre_cache[artist_name.lower().strip()] = ("Miscellaneous", [])
-                            logging.warning(f"No genres found for {artist_name}")
-                    
-                    except Exception as e:
-                        # Comprehensive error handling for individual artist
-                        logging.error(f"Complete error processing genres for {artist_name}: {e}")
-                        logging.error(traceback.format_exc())
-                        
-                        # Fallback to Miscellaneous on complete failure
-                        results[artist_name] = ("Miscellaneous", [])
-                        self.artist_genre_cache[artist_name.lower().strip()] = ("Miscellaneous", [])
-                
-                # Pause to respect rate limits
-                time.sleep(self.musicbrainz_delay)
+                # Single dict assignments are atomic, so the shared cache needs no lock here;
+                # get_artist_genre stops concurrent workers looking up the same artist twice
+                for artist_name, genre_result in zip(batch, batch_results):
+                    if genre_result:
+                        results[artist_name] = genre_result
+                        self.artist_genre_cache[artist_cache_key(artist_name)] = genre_result
             
             except Exception as e:
                 # Catch any unexpected batch-level errors
@@ -556,25 +973,118 @@ class SpotifyPlaylistManager:
             final_results[original_artist] = results.get(
                 original_artist, 
                 self.artist_genre_cache.get(
-                    original_artist.lower().strip(), 
-                    ("Miscellaneous", [])
+                    artist_cache_key(original_artist), 
+                    ("Miscellaneous", [], ())
                 )
             )
         
-        # Log final results summary
-        logging.info("Genre Lookup Summary:")
-        genre_distribution = {}
-        for artist, (primary_genre, _) in final_results.items():
-            genre_distribution[primary_genre] = genre_distribution.get(primary_genre, 0) + 1
-        
-        logging.info("Genre Lookup Summary:")
-        for genre, count in sorted(genre_distribution.items(), key=lambda x: x[1], reverse=True):
-            logging.info(f"  {genre}: {count} artists")
-
+        # Log final results summary - only build the distribution if INFO is actually logged
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            genre_distribution = {}
+            for artist, (primary_genre, _, _) in final_results.items():
+                genre_distribution[primary_genre] = genre_distribution.get(primary_genre, 0) + 1
+            
+            logging.info("Genre Lookup Summary:")
+            for genre, count in sorted(genre_distribution.items(), key=lambda x: x[1], reverse=True):
+                logging.info("  %s: %s artists", genre, count)
         
         return final_results
 
-    def get_artist_genre(self, artist_name: str) -> Tuple[str, List[str]]:
+    def lookup_artist_genres(self, artist_name: str) -> Optional[Tuple[str, List[str], Tuple[str, ...]]]:
+        """
+        Look up an artist's genres on MusicBrainz, falling back to Spotify.
+        
+        Safe to call from worker threads: it doesn't touch the in-memory genre cache.
+        
+        Args:
+            artist_name (str): Name of the artist
+            
+        Returns:
+            Optional[Tuple[str, List[str], Tuple[str, ...]]]: (Primary genre, All genres, All genres lowercased),
+                or None if the artist couldn't be found on MusicBrainz
+        """
+        try:
+            # Search for the artist to get the ID
+            artist_info = self.mb.search_artist(artist_name)
+            if not artist_info:
+                logging.warning("No MusicBrainz ID found for artist: %s", artist_name)
+                return None
+            artist_id = artist_info['id']
+        except Exception as e:
+            logging.error(f"Error searching for artist {artist_name}: {e}")
+            return None
+        
+        try:
+            # Detailed genre lookup for each artist
+            genre_params = {
+                'inc': 'genres',
+                'fmt': 'json'
+            }
+            
+            # First, try MusicBrainz direct artist lookup
+            artist_result = self.mb._make_api_request(
+                f"{self.mb.base_url}artist/{artist_id}", 
+                genre_params, 
+                f"Detailed genre lookup for {artist_name}"
+            )
+            
+            # Extract genres from MusicBrainz
+            artist_genres = []
+            if artist_result and 'genres' in artist_result:
+                artist_genres = [genre['name'] for genre in artist_result['genres']]
+                logging.info("MusicBrainz genres for %s: %s", artist_name, artist_genres)
+            
+            # If no genres from MusicBrainz, try Spotify
+            if not artist_genres:
+                logging.info("No MusicBrainz genres for %s, trying Spotify", artist_name)
+                artist_genres = self.get_spotify_artist_genres(artist_name)
+                logging.info("Spotify genres for %s: %s", artist_name, artist_genres)
+            
+            # Normalize and process genres
+            if artist_genres:
+                cleaned_genres = self.normalize_genres(artist_genres)
+                primary_genre = cleaned_genres[0] if cleaned_genres else "Miscellaneous"
+                
+                # Lowercase once at cache-insertion time for the scoring code
+                lowered = tuple(g.lower() for g in cleaned_genres)
+                
+                # Persist found genres so later runs skip MusicBrainz for this artist
+                self.lookup_cache.set(f"genre:{artist_cache_key(artist_name)}", [primary_genre, cleaned_genres])
+                
+                logging.info("Processed %s: Primary Genre = %s, All Genres = %s", artist_name, primary_genre, cleaned_genres)
+                return (primary_genre, cleaned_genres, lowered)
+            
+            # Default to Miscellaneous if no genres found
+            logging.warning("No genres found for %s", artist_name)
+            return ("Miscellaneous", [], ())
+        
+        except Exception as e:
+            # Comprehensive error handling for individual artist
+            logging.error(f"Complete error processing genres for {artist_name}: {e}")
+            logging.error(traceback.format_exc())
+            
+            # Fallback to Miscellaneous on complete failure
+            return ("Miscellaneous", [], ())
+    
+    def load_cached_genres(self, cache_key: str) -> bool:
+        """
+        Load an artist's genres from the persistent lookup cache into the in-memory cache.
+        
+        Args:
+            cache_key (str): The artist's cache key (see artist_cache_key)
+            
+        Returns:
+            bool: True if genres were found in the persistent cache
+        """
+        cached = self.lookup_cache.get(f"genre:{cache_key}")
+        if not cached:
+            return False
+        
+        primary_genre, cleaned_genres = cached
+        self.artist_genre_cache[cache_key] = (primary_genre, cleaned_genres, tuple(g.lower() for g in cleaned_genres))
+        return True
+    
+    def get_artist_genre(self, artist_name: str) -> Tuple[str, List[str], Tuple[str, ...]]:
         """
         Wrapper for batch genre lookup that works with single artist.
         
@@ -582,10 +1092,37 @@ class SpotifyPlaylistManager:
             artist_name (str): Name of the artist
             
         Returns:
-            Tuple[str, List[str]]: (Primary genre, All genres)
+            Tuple[str, List[str], Tuple[str, ...]]: (Primary genre, All genres, All genres lowercased)
         """
-        results = self.batch_get_artist_genres([artist_name])
-        return results.get(artist_name, ("Miscellaneous", []))
+        # Serve cached artists directly - organise_artist_tracks asks once per artist and genre,
+        # and going through the batch path would rebuild and log a lookup summary every time
+        cache_key = artist_cache_key(artist_name)
+        cached = self.artist_genre_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        # organise_artist_tracks runs on several workers, so the same artist can miss the
+        # cache on two threads at once; only the first looks it up, the rest wait for it
+        with self.genre_lookups_lock:
+            cached = self.artist_genre_cache.get(cache_key)
+            if cached is not None:
+                return cached
+            lookup_done = self.genre_lookups_in_flight.get(cache_key)
+            is_owner = lookup_done is None
+            if is_owner:
+                lookup_done = self.genre_lookups_in_flight[cache_key] = threading.Event()
+        
+        if not is_owner:
+            lookup_done.wait()
+            return self.artist_genre_cache.get(cache_key, ("Miscellaneous", [], ()))
+        
+        try:
+            results = self.batch_get_artist_genres([artist_name])
+        finally:
+            with self.genre_lookups_lock:
+                del self.genre_lookups_in_flight[cache_key]
+            lookup_done.set()
+        return results.get(artist_name, ("Miscellaneous", [], ()))
     
     def calculate_genre_similarity(self, genre1: str, genre2: str) -> float:
         """
@@ -678,11 +1215,27 @@ class SpotifyPlaylistManager:
             defaultdict: Dictionary mapping genres to lists of artists
         """
         try:
-            with open(filename, 'r', encoding='utf-8') as file:
-                data = json.load(file)
+            # Collect all unique artists to process (both keys and values)
+            all_artists = set()
+            source_artists = set()
             
-            # Dictionary to map genres to artists
-            genre_artists = defaultdict(list)
+            # Only the artist names are needed, so stream the (artist, recommendations)
+            # pairs when ijson is available rather than building the whole dict first;
+            # otherwise parse in one go (with orjson when installed)
+            with open(filename, 'rb') as file:
+                pairs = ijson.kvitems(file, '') if ijson else json_loads(file.read()).items()
+                for key_artist, inspired_artists in pairs:
+                    # Add the source artist and EVERY recommended artist, not just the default 10
+                    source_artists.add(key_artist)
+                    all_artists.add(key_artist)
+                    all_artists.update(inspired_artists)
+            
+            # Kept so playlist generation can exclude source artists without re-reading the file
+            self.source_artists = source_artists
+            
+            # Dictionary to map genres to artists; each value is an insertion-ordered
+            # dict used as a set so duplicate checks are O(1) while we build it
+            genre_artists = defaultdict(dict)
             
             # Define our primary genre categories with improved organization
             # This more detailed mapping helps prevent cross-contamination
@@ -736,27 +1289,18 @@ class SpotifyPlaylistManager:
                 'Jazz': ['Metal', 'Punk']
             }
             
-            # Collect all unique artists to process (both keys and values)
-            all_artists = set()
-            source_artists = set(data.keys())
-            
-            # Add all source artists
-            all_artists.update(source_artists)
-            
-            # Add all recommended artists
-            for key_artist, inspired_artists in data.items():
-                # Add EVERY recommended artist, not just the default 10
-                all_artists.update(inspired_artists)
-            
-            # Remove duplicates and ensure we have a list
-            unique_artists = sorted(list(all_artists))
+            # The set has already removed duplicates; sort for a stable processing order
+            unique_artists = sorted(all_artists)
             
             # Store total count for progress tracking
             self.total_keys = len(unique_artists)
             self.processed_keys = 0
             
+            # Report progress roughly every 1% (but no more often than every 10 artists)
+            progress_interval = max(10, self.total_keys // 100)
+            
             # Log total artists for progress tracking
-            logging.info(f"JSON file contains {self.total_keys} total unique artists to process")
+            logging.info("JSON file contains %s total unique artists to process", self.total_keys)
             
             # Process in smaller batches for better progress updates
             batch_size = 10
@@ -767,8 +1311,12 @@ class SpotifyPlaylistManager:
                 batch_genres = self.batch_get_artist_genres(batch)
                 
                 for artist in batch:
-                    # Get genre for each artist from batch result
-                    primary_genre, all_genres = batch_genres.get(artist, self.get_artist_genre(artist))
+                    # Get genre for each artist from batch result; only fall back to a single
+                    # lookup when it's missing (a .get() default would run it for every artist)
+                    genre_result = batch_genres.get(artist)
+                    if genre_result is None:
+                        genre_result = self.get_artist_genre(artist)
+                    primary_genre, all_genres, all_genres_lower = genre_result
                     
                     # Skip adding if we couldn't determine a genre
                     if primary_genre == "Miscellaneous" and not all_genres:
@@ -779,10 +1327,10 @@ class SpotifyPlaylistManager:
                             if cleaned_genres:
                                 primary_genre = cleaned_genres[0]
                                 all_genres = cleaned_genres
+                                all_genres_lower = tuple(g.lower() for g in cleaned_genres)
                     
-                    # Convert genres to lowercase for matching
+                    # Convert primary genre to lowercase for matching
                     primary_genre_lower = primary_genre.lower()
-                    all_genres_lower = [g.lower() for g in all_genres]
                     
                     # Track mapped genres for this artist
                     mapped_genres = []
@@ -850,15 +1398,18 @@ class SpotifyPlaylistManager:
                     # Add the artist to each mapped genre
                     for genre_category in mapped_genres:
                         if artist not in genre_artists[genre_category]:
-                            genre_artists[genre_category].append(artist)
+                            genre_artists[genre_category][artist] = None
                             if len(mapped_genres) > 1:
-                                logging.info(f"Added '{artist}' to genre '{genre_category}'")
+                                logging.info("Added '%s' to genre '%s'", artist, genre_category)
                     
                     # Update processed count and log progress
                     self.processed_keys += 1
-                    progress_percent = (self.processed_keys / self.total_keys) * 100
-                    if self.processed_keys % 10 == 0 or self.processed_keys == self.total_keys:
-                        logging.info(f"Progress: {progress_percent:.1f}% ({self.processed_keys}/{self.total_keys} artists)")
+                    if self.processed_keys % progress_interval == 0 or self.processed_keys == self.total_keys:
+                        progress_percent = (self.processed_keys / self.total_keys) * 100
+                        logging.info("Progress: %.1f%% (%s/%s artists)", progress_percent, self.processed_keys, self.total_keys)
+            
+            # Convert the per-genre artist sets back to lists, preserving order
+            genre_artists = defaultdict(list, {genre: list(artists) for genre, artists in genre_artists.items()})
             
             # Add subgenres for major categories to improve playlist organization
             expanded_genres = defaultdict(list)
@@ -881,9 +1432,9 @@ class SpotifyPlaylistManager:
                     
                     # Process each artist for subgenre classification
                     for artist in parent_artists:
-                        # Get artist genres
-                        _, artist_genres = batch_genres.get(artist, self.get_artist_genre(artist))
-                        artist_genres_lower = [g.lower() for g in artist_genres]
+                        # Get artist genres; every artist was looked up above, so this is served
+                        # from the in-memory cache (batch_genres only holds the last batch)
+                        _, _, artist_genres_lower = self.get_artist_genre(artist)
                         
                         # Map to appropriate subgenres based on detailed genre info
                         assigned_to_subgenre = False
@@ -929,9 +1480,9 @@ class SpotifyPlaylistManager:
             
             # Log summary of genres and artists
             total_artists_in_genres = sum(len(artists) for artists in genre_artists.values())
-            logging.info(f"Found {len(genre_artists)} genres with {total_artists_in_genres} total artist assignments")
+            logging.info("Found %s genres with %s total artist assignments", len(genre_artists), total_artists_in_genres)
             for genre, artists in sorted(genre_artists.items(), key=lambda x: len(x[1]), reverse=True):
-                logging.info(f"Genre '{genre}': {len(artists)} artists")
+                logging.info("Genre '%s': %s artists", genre, len(artists))
             
             return genre_artists
         except Exception as e:
@@ -940,13 +1491,52 @@ class SpotifyPlaylistManager:
             logging.error(traceback.format_exc())
             return defaultdict(list)
 
-    @backoff.on_exception(
-        backoff.expo, 
-        (socket.gaierror, Exception),
-        max_tries=5,
-        giveup=lambda e: not dns_resolve_backoff(e),
-        on_backoff=backoff_hdlr
-    )
+    def get_request_bucket(self, endpoint: str) -> TokenBucket:
+        """
+        Get the token bucket pacing requests to a Spotify endpoint, creating it on first use.
+        
+        Endpoint buckets are sub-limits of the shared request_bucket: every request takes
+        a token from both, so the total rate never exceeds request_rate. Keeping each
+        endpoint below the total means a burst of searches can't use up the whole budget
+        and hold up unrelated calls such as adding tracks to a playlist.
+        
+        Args:
+            endpoint (str): Name of the spotipy method being called
+            
+        Returns:
+            TokenBucket: The endpoint's token bucket
+        """
+        with self.request_buckets_lock:
+            bucket = self.request_buckets.get(endpoint)
+            if bucket is None:
+                bucket = self.request_buckets[endpoint] = TokenBucket(self.endpoint_request_rate, self.endpoint_request_burst)
+            return bucket
+
+    def refresh_spotify_token(self, stale_generation: int) -> None:
+        """
+        Refresh the OAuth access token in place after a 401 response.
+        
+        The existing client keeps its auth manager, so calls already bound to it pick up
+        the new token. When several workers hit a 401 together only the first refreshes;
+        the rest see token_generation has moved on and just retry.
+        
+        Args:
+            stale_generation (int): token_generation when the rejected request was made
+        """
+        with self.token_refresh_lock:
+            if self.token_generation != stale_generation:
+                return  # Another worker has already refreshed it
+            
+            auth_manager = self.sp.auth_manager
+            token_info = auth_manager.get_cached_token()
+            if token_info and token_info.get('refresh_token'):
+                auth_manager.refresh_access_token(token_info['refresh_token'])
+            else:
+                # No refresh token cached; fall back to a full re-authentication
+                self.sp = self.create_spotify_client()
+            self.token_generation += 1
+
+    @retry_on_network_error
     def retry_on_rate_limit(self, func, *args, **kwargs) -> Any:
         """
         Retry a function call with backoff for rate limits.
@@ -963,25 +1553,41 @@ class SpotifyPlaylistManager:
         retry_count = 0
         
         while retry_count < max_retries:
+            # Only a counter read - the cached token itself is read if a 401 comes back
+            token_generation = self.token_generation
             try:
-                # Log API call
-                logging.info(f"API Call: {func.__name__}")
-                result = func(*args, **kwargs)
-                time.sleep(self.request_delay)  # Always pause to respect rate limits
+                # Log API call (debug only - this runs for every request)
+                logging.debug("API Call: %s", func.__name__)
+                bucket = self.get_request_bucket(func.__name__)
+                bucket.acquire()  # Only waits once this endpoint's burst budget is spent
+                self.request_bucket.acquire()  # Every endpoint draws on the same overall budget
+                with self.api_semaphore:
+                    result = func(*args, **kwargs)
+                bucket.record_success()
+                self.request_bucket.record_success()
                 return result
             except SpotifyException as e:
                 if e.http_status == 429:  # Rate limit error
-                    retry_after = int(e.headers.get("Retry-After", 5))
-                    logging.warning(f"Rate limit hit. Retrying after {retry_after} seconds.")
-                    time.sleep(retry_after + 1)  # Add 1 second buffer
                     retry_count += 1
+                    # Honour Retry-After exactly when present, otherwise back off exponentially
+                    try:
+                        retry_after = float((e.headers or {}).get("Retry-After"))
+                    except (TypeError, ValueError):
+                        retry_after = min(30, 2 ** retry_count)
+                    # Hold back every other thread for the Retry-After period too; Spotify's
+                    # limit applies to the whole app, not just this endpoint
+                    self.get_request_bucket(func.__name__).penalize(retry_after)
+                    self.request_bucket.penalize(retry_after)
+                    # Random jitter so parallel workers don't all retry at the same instant
+                    wait_time = retry_after + random.uniform(0, 1)
+                    logging.warning("Rate limit hit. Retrying after %.1f seconds.", wait_time)
+                    time.sleep(wait_time)
                     continue
                 elif e.http_status == 401:
                     logging.error(f"Authentication error (401). Token may have expired.")
                     logging.info("Attempting to refresh token...")
-                    # Try refreshing token by recreating the client
                     try:
-                        self.sp = self.create_spotify_client()
+                        self.refresh_spotify_token(token_generation)
                         logging.info("Token refreshed successfully")
                         retry_count += 1
                         continue
@@ -991,15 +1597,15 @@ class SpotifyPlaylistManager:
                 else:
                     logging.error(f"Spotify API error: {e} (Status: {e.http_status})")
                     retry_count += 1
-                    wait_time = min(30, 2 ** retry_count)  # Exponential backoff with cap
-                    logging.info(f"Retrying in {wait_time} seconds...")
+                    wait_time = min(30, 2 ** retry_count) + random.uniform(0, 1)  # Exponential backoff with cap and jitter
+                    logging.info("Retrying in %.1f seconds...", wait_time)
                     time.sleep(wait_time)
                     continue
             except socket.gaierror as e:
                 logging.error(f"Network error: {e}")
                 retry_count += 1
                 wait_time = min(30, 2 ** retry_count)
-                logging.warning(f"Network issue, retrying in {wait_time}s ({retry_count}/{max_retries})")
+                logging.warning("Network issue, retrying in %ss (%s/%s)", wait_time, retry_count, max_retries)
                 time.sleep(wait_time)
                 continue
             except Exception as e:
@@ -1007,14 +1613,14 @@ class SpotifyPlaylistManager:
                     logging.error(f"Failed to resolve 'api.spotify.com': {e}")
                     retry_count += 1
                     wait_time = min(30, 2 ** retry_count) 
-                    logging.warning(f"DNS issue, retrying in {wait_time}s ({retry_count}/{max_retries})")
+                    logging.warning("DNS issue, retrying in %ss (%s/%s)", wait_time, retry_count, max_retries)
                     time.sleep(wait_time)
                     continue
                 logging.error(f"General error in {func.__name__}: {e}")
                 retry_count += 1
                 if retry_count < max_retries:
                     wait_time = min(30, 2 ** retry_count)
-                    logging.info(f"Retrying in {wait_time} seconds...")
+                    logging.info("Retrying in %s seconds...", wait_time)
                     time.sleep(wait_time)
                 else:
                     break
@@ -1044,10 +1650,10 @@ class SpotifyPlaylistManager:
                 continue
                 
             # Get cached or new genre info for this artist
-            primary_genre_name, artist_genres = self.get_artist_genre(artist_name)
+            primary_genre_name, _, artist_genres_lower = self.get_artist_genre(artist_name)
             
-            # Add normalized genres to our set
-            all_genres.update([g.lower() for g in artist_genres])
+            # Add normalized genres to our set (already lowercased in the cache)
+            all_genres.update(artist_genres_lower)
             
             # Also add the primary genre from MusicBrainz - this is important
             if primary_genre_name:
@@ -1161,27 +1767,32 @@ class SpotifyPlaylistManager:
         # Default case - low match score  
         return (False, 0.15, genre_list)
 
-    def get_simplified_track_match(self, artist_tuple: Tuple[str, List[str]], target_genre: str) -> Tuple[bool, float]:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def get_simplified_track_match(artist_tuple: Tuple[str, Tuple[str, ...]], target_genre: str) -> Tuple[bool, float]:
         """
         Improved method to match an artist against a target genre using cached genre info.
         Implements stricter genre matching to avoid cross-genre contamination.
         
+        The result depends only on the artist's genres and the target, so it is
+        memoized; artist_tuple must therefore be hashable.
+        
         Args:
-            artist_tuple (Tuple[str, List[str]]): Tuple containing (artist_name, artist_genres)
+            artist_tuple (Tuple[str, Tuple[str, ...]]): Tuple containing (artist_name, lowercased artist_genres)
             target_genre (str): Target genre to match against
             
         Returns:
             Tuple[bool, float]: (Matches target, Match score)
         """
-        artist_name, artist_genres = artist_tuple
+        artist_name, artist_genres_lower = artist_tuple
         
         # If the artist has no genre info, give it a low score to avoid misclassification
-        if not artist_genres:
+        if not artist_genres_lower:
             return (False, 0.3)  # Lower score for unknown genres to prevent false matches
         
-        # Convert everything to lowercase for comparison
-        artist_genres_lower = [g.lower() for g in artist_genres]
+        # Artist genres arrive lowercased from the cache, only the target needs it
         target_lower = target_genre.lower()
+        artist_genre_set = frozenset(artist_genres_lower)
         
         # Extract primary and secondary parts of the target genre
         target_parts = target_lower.split(' - ')
@@ -1189,11 +1800,11 @@ class SpotifyPlaylistManager:
         secondary_target = target_parts[1] if len(target_parts) > 1 else None
         
         # Direct match case - highest score
-        if target_lower in artist_genres_lower:
+        if target_lower in artist_genre_set:
             return (True, 1.0)
         
         # Primary genre match - high score
-        if primary_target in artist_genres_lower:
+        if primary_target in artist_genre_set:
             return (True, 0.9)
         
         # Check if any artist genre contains the primary target
@@ -1207,126 +1818,36 @@ class SpotifyPlaylistManager:
                 if secondary_target in genre:
                     return (True, 0.8)
         
-        # Check for related genres with comprehensive mapping - USE STRICTER THRESHOLDS
-        related_genres = {
-            # Rock family
-            'rock': ['alternative', 'indie', 'punk', 'metal', 'hard rock', 'classic rock', 
-                    'progressive rock', 'art rock', 'industrial rock', 'industrial', 
-                    'alternative rock', 'post-punk', 'grunge', 'new wave', 'garage'],
-            
-            # Metal family - added as separate category
-            'metal': ['heavy metal', 'thrash metal', 'death metal', 'black metal', 'doom metal', 
-                     'progressive metal', 'power metal', 'folk metal', 'gothic metal', 'alternative metal'],
-            
-            # Electronic music family
-            'electronic': ['techno', 'house', 'trance', 'edm', 'dance', 'ambient', 'dubstep',
-                          'electronica', 'downtempo', 'idm', 'drum and bass', 'electro', 
-                          'breakbeat', 'jungle', 'trip hop'],
-            
-            # Pop music family
-            'pop': ['dance pop', 'synth pop', 'indie pop', 'electropop', 'pop rock', 'europop',
-                   'power pop', 'chamber pop', 'baroque pop', 'dream pop', 'sophisti-pop'],
-            
-            # Hip hop family
-            'hip hop': ['rap', 'trap', 'gangsta rap', 'conscious hip hop', 'old school hip hop',
-                       'alternative hip hop', 'southern hip hop', 'east coast hip hop', 'west coast hip hop'],
-            
-            # R&B and Soul family
-            'r&b': ['soul', 'funk', 'contemporary r&b', 'neo soul', 'rhythm and blues', 'gospel'],
-            
-            # Jazz family
-            'jazz': ['bebop', 'swing', 'fusion', 'blues', 'smooth jazz', 'free jazz', 'modal jazz', 
-                   'cool jazz', 'hard bop', 'avant-garde jazz', 'big band'],
-            
-            # Classical music family
-            'classical': ['baroque', 'romantic', 'contemporary classical', 'orchestral', 'chamber music',
-                         'opera', 'symphony', 'concerto', 'sonata', 'piano'],
-            
-            # Folk and Country family
-            'folk': ['acoustic', 'singer-songwriter', 'americana', 'country', 'bluegrass',
-                   'traditional folk', 'folk rock', 'british folk', 'celtic'],
-            
-            'country': ['country rock', 'outlaw country', 'country pop', 'alternative country',
-                       'traditional country', 'honky tonk', 'americana', 'bluegrass'],
-                       
-            # World music family
-            'world': ['reggae', 'latin', 'afrobeat', 'afro-pop', 'bossa nova', 'salsa', 'samba',
-                     'flamenco', 'celtic', 'traditional'],
-                     
-            # Additional categories for better matching
-            'indie': ['indie rock', 'indie pop', 'alternative', 'lo-fi', 'post-rock', 'shoegaze'],
-            
-            'alternative': ['alternative rock', 'indie', 'post-punk', 'grunge', 'new wave',
-                           'college rock', 'experimental rock'],
-                           
-            'punk': ['hardcore', 'post-punk', 'pop punk', 'skate punk', 'anarcho-punk',
-                    'garage punk', 'punk rock', 'oi!'],
-                    
-            'ambient': ['downtempo', 'chillout', 'drone', 'ambient electronic', 'dark ambient'],
-            
-            'experimental': ['avant-garde', 'noise', 'industrial', 'experimental rock', 
-                           'experimental electronic', 'musique concrète'],
-                           
-            # Genre refinements for more accurate matching
-            # House music variants
-            'house': ['deep house', 'tech house', 'progressive house', 'acid house', 'electro house'],
-            
-            # Trance music variants
-            'trance': ['progressive trance', 'uplifting trance', 'psychedelic trance', 'goa trance'],
-            
-            # Techno music variants
-            'techno': ['minimal techno', 'detroit techno', 'hard techno', 'acid techno'],
-        }
-        
-        # Define conflicting genre families to prevent cross-contamination
-        # This prevents artists from appearing in playlists where they don't belong
-        conflicting_genres = {
-            'rock': ['electronic', 'pop', 'hip hop', 'jazz', 'classical', 'r&b', 'world', 'country'],
-            'metal': ['electronic', 'pop', 'hip hop', 'jazz', 'classical', 'r&b', 'world', 'country', 'folk'],
-            'electronic': ['rock', 'metal', 'country', 'folk', 'classical', 'blues'],
-            'pop': ['metal', 'hardcore', 'classical', 'blues', 'experimental'],
-            'hip hop': ['rock', 'metal', 'folk', 'classical', 'blues', 'country', 'world'],
-            'jazz': ['metal', 'electronic', 'hip hop', 'rock', 'punk'],
-            'classical': ['rock', 'electronic', 'hip hop', 'pop', 'metal', 'punk', 'industrial'],
-            'folk': ['electronic', 'hip hop', 'metal', 'industrial', 'techno'],
-            'country': ['electronic', 'hip hop', 'metal', 'industrial', 'techno', 'punk'],
-            'blues': ['electronic', 'hip hop', 'pop', 'techno', 'metal'],
-            'world': ['metal', 'punk', 'industrial', 'hip hop']
-        }
-        
         # Check if the artist has genres that directly conflict with the target genre
         # This is a key improvement to prevent genre contamination
         for artist_genre in artist_genres_lower:
-            # Get the "family" of this artist genre 
-            for family, genres in related_genres.items():
-                if artist_genre == family or artist_genre in genres:
-                    # If this artist belongs to a conflicting genre family, reject the match
-                    if primary_target in conflicting_genres.get(family, []):
-                        return (False, 0.1)  # Very low score for conflicting genres
+            # Get the "families" of this artist genre from the precomputed inverse lookup
+            for family in GENRE_MEMBER_FAMILIES.get(artist_genre, ()):
+                # If this artist belongs to a conflicting genre family, reject the match
+                if primary_target in CONFLICTING_GENRES.get(family, ()):
+                    return (False, 0.1)  # Very low score for conflicting genres
         
         # Check for related genres
-        if primary_target in related_genres:
-            related = related_genres[primary_target]
+        if primary_target in RELATED_GENRE_SETS:
             # Check if any of artist's genres are in the related genres for target
-            matches = [g for g in artist_genres_lower if g in related]
+            matches = artist_genre_set & RELATED_GENRE_SETS[primary_target]
             if matches:
                 # Score is higher when more related genres match - but be more strict
                 match_score = min(0.8, 0.5 + (len(matches) * 0.1))
                 return (True, match_score)
         
         # Check if target might be a subgenre
-        for category, related in related_genres.items():
-            if primary_target in related:
-                # Check if the artist has the parent category
-                if category in artist_genres_lower:
-                    return (True, 0.7)  # Lower score than previous version
-                
-                # Check if artist has other related genres in the same category
-                related_matches = [g for g in artist_genres_lower if g in related]
-                if related_matches:
-                    # More conservative scoring
-                    match_score = min(0.65, 0.5 + (len(related_matches) * 0.05))
-                    return (True, match_score)
+        for category in GENRE_PARENT_FAMILIES.get(primary_target, ()):
+            # Check if the artist has the parent category
+            if category in artist_genre_set:
+                return (True, 0.7)  # Lower score than previous version
+            
+            # Check if artist has other related genres in the same category
+            related_matches = artist_genre_set & RELATED_GENRE_SETS[category]
+            if related_matches:
+                # More conservative scoring
+                match_score = min(0.65, 0.5 + (len(related_matches) * 0.05))
+                return (True, match_score)
         
         # Check if any of artist's genres have the target as a substring or vice versa
         partial_matches = []
@@ -1356,63 +1877,35 @@ class SpotifyPlaylistManager:
         # By default, return false with a low score - this prevents most cross-genre contamination
         return (False, 0.2)
 
-    def organise_artist_tracks(self, artist: str, target_genre: str) -> List[Tuple[str, float]]:
+    def find_spotify_artist(self, artist: str, artist_lower: str, target_parts: List[str],
+                            artist_genres_lower: Tuple[str, ...]) -> Optional[Dict]:
         """
-        Get genre-appropriate tracks for an artist with stricter genre matching.
-        Provides more reliable track selection and better genre integrity.
+        Search Spotify for an artist, using the target genre to disambiguate, and pick the best match.
         
         Args:
             artist (str): Artist name
-            target_genre (str): Target genre for filtering
+            artist_lower (str): Folded artist name used for name comparisons
+            target_parts (List[str]): Lowercased target genre split into primary and secondary terms
+            artist_genres_lower (Tuple[str, ...]): The artist's lowercased genres
             
         Returns:
-            List[Tuple[str, float]]: List of (track_id, match_score) tuples
+            Optional[Dict]: Best matching Spotify artist, or None if no good match was found
         """
-        # First, get the genres for this artist from MusicBrainz
-        primary_genre, artist_genres = self.get_artist_genre(artist)
-        artist_genres_lower = [g.lower() for g in artist_genres]
-        target_lower = target_genre.lower()
-        
-        # Check if this artist's primary genre conflicts with the target genre
-        # Define main genre families and their conflicts
-        conflicting_genres = {
-            'rock': ['electronic', 'pop', 'hip hop', 'jazz', 'classical', 'r&b', 'world', 'country'],
-            'metal': ['electronic', 'pop', 'hip hop', 'jazz', 'classical', 'r&b', 'world', 'country', 'folk'],
-            'electronic': ['rock', 'metal', 'country', 'folk', 'classical', 'blues'],
-            'pop': ['metal', 'hardcore', 'classical', 'blues', 'experimental'],
-            'hip hop': ['rock', 'metal', 'folk', 'classical', 'blues', 'country', 'world'],
-            'jazz': ['metal', 'electronic', 'hip hop', 'rock', 'punk'],
-            'classical': ['rock', 'electronic', 'hip hop', 'pop', 'metal', 'punk', 'industrial'],
-            'folk': ['electronic', 'hip hop', 'metal', 'industrial', 'techno'],
-            'country': ['electronic', 'hip hop', 'metal', 'industrial', 'techno', 'punk'],
-            'blues': ['electronic', 'hip hop', 'pop', 'techno', 'metal'],
-            'world': ['metal', 'punk', 'industrial', 'hip hop']
-        }
-        
-        # Extract primary genre terms
-        target_parts = target_lower.split(' - ')
         primary_target = target_parts[0]
         
-        # Check if artist's primary genre conflicts with target genre
-        # This is a new strict check to prevent cross-genre contamination
-        for artist_genre in artist_genres_lower:
-            # Find which family this genre belongs to
-            for family, genres in conflicting_genres.items():
-                if artist_genre == family or family in artist_genre:
-                    # If this artist's genre family conflicts with the target genre, skip
-                    if primary_target in genres:
-                        logging.info(f"Skipping '{artist}' for '{target_genre}': Genre conflict - '{artist_genre}' conflicts with '{primary_target}'")
-                        return []
-        
         # Check if this is a major artist (has genre information in MusicBrainz)
-        is_major_artist = len(artist_genres) > 0
+        is_major_artist = len(artist_genres_lower) > 0
+        
+        # Reuse search results from a previous run if we have them
+        search_cache_key = f"search:{artist.lower()}:{primary_target}"
+        cached_search_results = self.lookup_cache.get(search_cache_key)
         
         # Perform more specific genre search to get better matches
-        search_results = []
+        search_results = cached_search_results or []
         quoted_artist = f'artist:"{artist}"'
         
         # For major artists, use genre to help with search
-        if is_major_artist:
+        if is_major_artist and not search_results:
             # Extract genre terms from target_genre that might help with search
             secondary_genre = target_parts[1] if len(target_parts) > 1 else None
             
@@ -1437,43 +1930,46 @@ class SpotifyPlaylistManager:
                 # Try up to 3 matching genres for search
                 for search_genre in matching_genres[:3]:
                     genre_query = f'{quoted_artist} genre:"{search_genre}"'
-                    logging.info(f"Searching with specific genre context: {genre_query}")
+                    logging.info("Searching with specific genre context: %s", genre_query)
                     genre_results = self.retry_on_rate_limit(self.sp.search, q=genre_query, type='artist', limit=10)
                     
                     if genre_results and 'artists' in genre_results and genre_results['artists']['items']:
                         search_results = genre_results['artists']['items']
-                        logging.info(f"Found {len(search_results)} results using genre-based search")
+                        logging.info("Found %s results using genre-based search", len(search_results))
                         break  # Use the first successful genre search
             
             # If no results with specific genres, try the primary genre
             if not search_results and primary_target:
                 genre_query = f'{quoted_artist} genre:"{primary_target}"'
-                logging.info(f"Searching with primary genre: {genre_query}")
+                logging.info("Searching with primary genre: %s", genre_query)
                 genre_results = self.retry_on_rate_limit(self.sp.search, q=genre_query, type='artist', limit=10)
                 
                 if genre_results and 'artists' in genre_results and genre_results['artists']['items']:
                     search_results = genre_results['artists']['items']
-                    logging.info(f"Found {len(search_results)} results using primary genre search")
+                    logging.info("Found %s results using primary genre search", len(search_results))
         
         # If still no results, fall back to just the artist name
         if not search_results:
-            logging.info(f"Using standard artist search: {quoted_artist}")
+            logging.info("Using standard artist search: %s", quoted_artist)
             quoted_results = self.retry_on_rate_limit(self.sp.search, q=quoted_artist, type='artist', limit=15)
             search_results = quoted_results.get('artists', {}).get('items', []) if quoted_results else []
         
         # If still no results, try a broader search
         if not search_results:
             broader_query = artist  # Just the artist name without quotes
-            logging.info(f"Using broader artist search: {broader_query}")
+            logging.info("Using broader artist search: %s", broader_query)
             broader_results = self.retry_on_rate_limit(self.sp.search, q=broader_query, type='artist', limit=20)
             search_results = broader_results.get('artists', {}).get('items', []) if broader_results else []
         
         if not search_results:
-            logging.warning(f"No Spotify artists found for '{artist}'")
-            return []
+            logging.warning("No Spotify artists found for '%s'", artist)
+            return None
+        
+        # Store fresh search results for the next run
+        if not cached_search_results:
+            self.lookup_cache.set(search_cache_key, search_results)
         
         # Find the best match using multiple criteria
-        artist_lower = artist.lower()
         best_match = None
         exact_matches = []
         name_contains_matches = []
@@ -1481,7 +1977,7 @@ class SpotifyPlaylistManager:
         
         for result in search_results:
             result_name = result.get('name', '')
-            result_lower = result_name.lower()
+            result_lower = fold_artist_name(result_name)
             popularity = result.get('popularity', 0)
             
             # Exact name match - highest priority
@@ -1498,45 +1994,95 @@ class SpotifyPlaylistManager:
         
         # Select the best match by priority and popularity
         if exact_matches:
-            # Prefer exact name matches sorted by popularity
-            exact_matches.sort(key=lambda x: x[1], reverse=True)
-            best_match = exact_matches[0][0]
-            logging.info(f"Using exact name match: '{best_match['name']}' (Popularity: {best_match.get('popularity', 0)})")
+            # Prefer the most popular exact name match
+            best_match = max(exact_matches, key=lambda x: x[1])[0]
+            logging.info("Using exact name match: '%s' (Popularity: %s)", best_match['name'], best_match.get('popularity', 0))
         elif name_contains_matches:
             # Next prefer contained name matches
-            name_contains_matches.sort(key=lambda x: x[1], reverse=True)
-            best_match = name_contains_matches[0][0]
-            logging.info(f"Using name contains match: '{best_match['name']}' (Popularity: {best_match.get('popularity', 0)})")
+            best_match = max(name_contains_matches, key=lambda x: x[1])[0]
+            logging.info("Using name contains match: '%s' (Popularity: %s)", best_match['name'], best_match.get('popularity', 0))
         elif fuzzy_matches:
             # Last resort fuzzy matches
-            fuzzy_matches.sort(key=lambda x: x[1], reverse=True)
-            best_match = fuzzy_matches[0][0]
-            logging.warning(f"Using fuzzy name match: '{best_match['name']}' (Popularity: {best_match.get('popularity', 0)})")
+            best_match = max(fuzzy_matches, key=lambda x: x[1])[0]
+            logging.warning("Using fuzzy name match: '%s' (Popularity: %s)", best_match['name'], best_match.get('popularity', 0))
         else:
             # If nothing else, use the most popular result
-            search_results.sort(key=lambda x: x.get('popularity', 0), reverse=True)
-            best_match = search_results[0]
-            logging.warning(f"Using most popular result as fallback: '{best_match['name']}' (Popularity: {best_match.get('popularity', 0)})")
+            best_match = max(search_results, key=lambda x: x.get('popularity', 0))
+            logging.warning("Using most popular result as fallback: '%s' (Popularity: %s)", best_match['name'], best_match.get('popularity', 0))
         
         # NEW CHECK: Only proceed if the match is reasonably good
-        selected_name = best_match['name'].lower()
-        if selected_name != artist_lower and not (artist_lower in selected_name or selected_name in artist_lower):
+        # Names within a small Sift3 distance (punctuation, typos, accents) count as the same artist
+        selected_name = fold_artist_name(best_match['name'])
+        if sift3_distance(selected_name, artist_lower) > 2.0 and not (artist_lower in selected_name or selected_name in artist_lower):
             # Only skip if the names are completely different
             if not any(part in selected_name for part in artist_lower.split()) and not any(part in artist_lower for part in selected_name.split()):
-                logging.warning(f"Skipping '{artist}' because Spotify matched name '{best_match['name']}' is too different.")
-                return []
+                logging.warning("Skipping '%s' because Spotify matched name '%s' is too different.", artist, best_match['name'])
+                return None
+        
+        return best_match
+    
+    def organise_artist_tracks(self, artist: str, target_genre: str) -> List[Tuple[str, float]]:
+        """
+        Get genre-appropriate tracks for an artist with stricter genre matching.
+        Provides more reliable track selection and better genre integrity.
+        
+        Args:
+            artist (str): Artist name
+            target_genre (str): Target genre for filtering
+            
+        Returns:
+            List[Tuple[str, float]]: List of (track_id, match_score) tuples
+        """
+        # First, get the genres for this artist from MusicBrainz
+        primary_genre, artist_genres, artist_genres_lower = self.get_artist_genre(artist)
+        target_lower = target_genre.lower()
+        
+        # Extract primary genre terms
+        target_parts = target_lower.split(' - ')
+        primary_target = target_parts[0]
+        
+        # Check if artist's primary genre conflicts with target genre
+        # This is a new strict check to prevent cross-genre contamination
+        for artist_genre in artist_genres_lower:
+            # Find which family this genre belongs to
+            for family, genres in CONFLICTING_GENRES.items():
+                if artist_genre == family or family in artist_genre:
+                    # If this artist's genre family conflicts with the target genre, skip
+                    if primary_target in genres:
+                        logging.info("Skipping '%s' for '%s': Genre conflict - '%s' conflicts with '%s'", artist, target_genre, artist_genre, primary_target)
+                        return []
+        
+        # Artists already resolved for this genre in an earlier run skip the search chain
+        artist_lower = fold_artist_name(artist)
+        id_cache_key = artist_id_cache_key(artist, target_genre)
+        artist_id = self.lookup_cache.get(id_cache_key)
+        artist_name = artist
         
-        artist_id = best_match['id']
-        artist_name = best_match['name']
+        if not artist_id:
+            best_match = self.find_spotify_artist(artist, artist_lower, target_parts, artist_genres_lower)
+            if not best_match:
+                return []
+            
+            artist_id = best_match['id']
+            artist_name = best_match['name']
+            
+            # Remember the Spotify ID so later runs can reuse it
+            self.lookup_cache.set(id_cache_key, artist_id)
         
         # Now get the artist's Spotify genres to use as an additional check
         artist_spotify_genres = []
         try:
-            # Get the artist details including genres from Spotify
-            artist_details = self.retry_on_rate_limit(self.sp.artist, artist_id)
+            # Get the artist details including genres from Spotify, preferring the disk cache
+            artist_details = self.lookup_cache.get(f"artist:{artist_id}")
+            if not artist_details:
+                artist_details = self.retry_on_rate_limit(self.sp.artist, artist_id)
+                if artist_details:
+                    self.lookup_cache.set(f"artist:{artist_id}", artist_details)
+            if artist_details:
+                artist_name = artist_details.get('name', artist_name)
             if artist_details and 'genres' in artist_details:
                 artist_spotify_genres = [g.lower() for g in artist_details['genres']]
-                logging.info(f"Artist '{artist_name}' Spotify genres: {artist_spotify_genres}")
+                logging.info("Artist '%s' Spotify genres: %s", artist_name, artist_spotify_genres)
         except Exception as e:
             logging.error(f"Error getting artist details: {e}")
         
@@ -1544,123 +2090,194 @@ class SpotifyPlaylistManager:
         if artist_spotify_genres:
             # Check if any of the artist's Spotify genres conflict with the target genre
             for spotify_genre in artist_spotify_genres:
-                for family, conflicts in conflicting_genres.items():
+                for family, conflicts in CONFLICTING_GENRES.items():
                     if family in spotify_genre:
                         if primary_target in conflicts:
-                            logging.info(f"Skipping '{artist}' for '{target_genre}': Spotify genre '{spotify_genre}' conflicts with '{primary_target}'")
+                            logging.info("Skipping '%s' for '%s': Spotify genre '%s' conflicts with '%s'", artist, target_genre, spotify_genre, primary_target)
                             return []
         
-        # MODIFIED: Get more tracks using multiple methods to get more than 10
-        matching_tracks = []
-        all_tracks = []
+        # Apply a minimum score threshold to ensure genre integrity
+        min_score_threshold = 0.4  # This threshold ensures only relevant tracks are included
+        
+        # The genre match only depends on the artist, not the individual track,
+        # so score it once here rather than for every track below
+        artist_tup = (artist, artist_genres_lower)
+        artist_matches, artist_score = self.get_simplified_track_match(artist_tup, target_genre)
+        
+        # If the artist can't match, no track can - skip the track lookups entirely
+        if not artist_matches:
+            logging.warning("No genre-matching tracks found for '%s' in genre '%s'", artist_name, target_genre)
+            # Don't return fallback tracks if no genre matches - this ensures genre purity
+            return []
+        if artist_score < min_score_threshold:
+            logging.warning("All tracks for '%s' had scores below threshold for genre '%s'", artist_name, target_genre)
+            return []
+        
+        # Fetch candidate tracks once per Spotify artist. Every track by this artist shares
+        # the artist's score, with a 30% penalty where they are not the primary artist, so
+        # the tracks only need partitioning - primary tracks first is the descending order
+        candidate_tracks = self.get_artist_candidate_tracks(artist_id, artist_name)
+        featured_score = artist_score * 0.7
+        primary_tracks = [(track_id, artist_score) for track_id, _, is_primary in candidate_tracks if is_primary]
+        featured_tracks = [(track_id, featured_score) for track_id, _, is_primary in candidate_tracks if not is_primary]
+        
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            for track_id, track_name, is_primary in candidate_tracks:
+                logging.info("Found matching track for '%s': '%s' (Score: %.2f)", artist_name, track_name,
+                             artist_score if is_primary else featured_score)
+        
+        # If we have matches, great; otherwise don't force inclusion
+        if candidate_tracks:
+            logging.info("Found %s genre-matching tracks for '%s' in genre '%s'", len(candidate_tracks), artist_name, target_genre)
+        else:
+            logging.warning("No genre-matching tracks found for '%s' in genre '%s'", artist_name, target_genre)
+            return []
+        
+        # Featured tracks drop out when the penalty takes them below the threshold
+        filtered_tracks = primary_tracks + featured_tracks if featured_score >= min_score_threshold else primary_tracks
+        
+        if not filtered_tracks:
+            logging.warning("All tracks for '%s' had scores below threshold for genre '%s'", artist_name, target_genre)
+            return []
+        
+        # Return top 15 or whatever we have if less
+        return filtered_tracks[:15]
+
+    def fetch_artists_bulk(self, artist_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Fetch Spotify artist details in batches of 50 using the several-artists endpoint.
+        
+        Artists already in the lookup cache are skipped; fetched details are stored
+        there so organise_artist_tracks finds them without a per-artist request.
+        
+        Args:
+            artist_ids (List[str]): Spotify artist IDs
+            
+        Returns:
+            Dict[str, Dict]: Dictionary mapping artist IDs to artist details
+        """
+        results = {}
+        missing_ids = []
+        
+        for artist_id in dict.fromkeys(artist_ids):
+            cached_details = self.lookup_cache.get(f"artist:{artist_id}")
+            if cached_details:
+                results[artist_id] = cached_details
+            else:
+                missing_ids.append(artist_id)
+        
+        # Spotify accepts up to 50 IDs per request
+        for i in range(0, len(missing_ids), 50):
+            chunk = missing_ids[i:i+50]
+            try:
+                response = self.retry_on_rate_limit(self.sp.artists, chunk)
+                for artist_details in (response or {}).get('artists', []):
+                    if artist_details:
+                        results[artist_details['id']] = artist_details
+                        self.lookup_cache.set(f"artist:{artist_details['id']}", artist_details)
+                logging.info("Fetched details for %s artists in one request", len(chunk))
+            except Exception as e:
+                logging.error(f"Error fetching artist details in bulk: {e}")
+        
+        return results
+
+    def prefetch_artist_details(self, artists: List[str], target_genre: str) -> None:
+        """
+        Refresh Spotify details for artists whose IDs are known from a previous run.
+        
+        Args:
+            artists (List[str]): Artist names about to be processed
+            target_genre (str): Genre the artists are being processed for
+        """
+        known_ids = []
+        for artist in artists:
+            artist_id = self.lookup_cache.get(artist_id_cache_key(artist, target_genre))
+            if artist_id:
+                known_ids.append(artist_id)
+        
+        if known_ids:
+            self.fetch_artists_bulk(known_ids)
+
+    def get_artist_candidate_tracks(self, artist_id: str, artist_name: str) -> List[Tuple[str, str, bool]]:
+        """
+        Get candidate tracks for a Spotify artist, fetching them at most once per run.
+        
+        The same artist can be considered for several genres; the candidate tracks
+        don't depend on the genre, so they are memoized by artist ID and only the
+        scoring is repeated.
+        
+        Args:
+            artist_id (str): Spotify artist ID
+            artist_name (str): Spotify artist name (for logging)
+            
+        Returns:
+            List[Tuple[str, str, bool]]: List of (track_id, track_name, is_primary_artist) tuples
+        """
+        if artist_id in self.artist_tracks_cache:
+            return self.artist_tracks_cache[artist_id]
+        
+        candidates = []
+        seen_track_ids = set()
         
         # Method 1: Get top tracks (up to 10 from Spotify API)
         try:
-            top_tracks = self.retry_on_rate_limit(self.sp.artist_top_tracks, artist_id)
+            top_tracks = self.lookup_cache.get(f"top:{artist_id}")
+            if not top_tracks:
+                top_tracks = self.retry_on_rate_limit(self.sp.artist_top_tracks, artist_id)
+                if top_tracks:
+                    self.lookup_cache.set(f"top:{artist_id}", top_tracks)
             
             if top_tracks and 'tracks' in top_tracks:
                 for track in top_tracks['tracks']:
-                    track_id = track['id']
-                    track_name = track['name']
-                    
                     # Prioritize tracks where this artist is the primary artist
                     primary_artist = track['artists'][0] if track['artists'] else None
-                    is_primary = primary_artist and primary_artist['id'] == artist_id
-                    
-                    # Check match score against target genre
-                    # First use the simplified track match for speed
-                    artist_tup = (artist, artist_genres)
-                    matches, score = self.get_simplified_track_match(artist_tup, target_genre)
-                    
-                    # If the artist is not the primary artist, reduce the score
-                    if not is_primary:
-                        score *= 0.7  # 30% penalty for not being primary artist
+                    is_primary = bool(primary_artist and primary_artist['id'] == artist_id)
                     
-                    track_info = (track_id, score)
-                    
-                    # Keep all tracks in a separate list
-                    all_tracks.append(track_info)
-                    
-                    # Add matching tracks to our results list
-                    if matches:
-                        matching_tracks.append(track_info)
-                        logging.info(f"Found matching track for '{artist_name}': '{track_name}' (Score: {score:.2f})")
+                    seen_track_ids.add(track['id'])
+                    candidates.append((track['id'], track['name'], is_primary))
         except Exception as e:
             logging.error(f"Error getting top tracks for {artist_name}: {e}")
         
         # Method 2: Get additional tracks from albums if needed
-        if len(all_tracks) < 15:
+        if len(candidates) < 15:
             try:
                 # Get the artist's albums
                 albums_result = self.retry_on_rate_limit(self.sp.artist_albums, artist_id, album_type='album,single', limit=3)
                 
+                album_ids = []
                 if albums_result and 'items' in albums_result:
-                    for album in albums_result['items'][:3]:  # Limit to 3 albums to avoid too many requests
-                        if len(all_tracks) >= 15:
+                    album_ids = [album['id'] for album in albums_result['items'][:3]]  # Limit to 3 albums to avoid too many requests
+                
+                # Fetch the albums with their track listings in one request, rather than one
+                # album_tracks request per album
+                albums = self.retry_on_rate_limit(self.sp.albums, album_ids) if album_ids else None
+                
+                for album in (albums or {}).get('albums') or []:
+                    if len(candidates) >= 15:
+                        break
+                    
+                    # Take the first 10 tracks of each album, as album_tracks(limit=10) did
+                    for track in ((album or {}).get('tracks') or {}).get('items', [])[:10]:
+                        # Skip if we have enough tracks
+                        if len(candidates) >= 15:
                             break
-                            
-                        album_id = album['id']
                         
-                        # Get tracks from this album
-                        album_tracks = self.retry_on_rate_limit(self.sp.album_tracks, album_id, limit=10)
+                        # Skip if we already have this track
+                        if track['id'] in seen_track_ids:
+                            continue
                         
-                        if album_tracks and 'items' in album_tracks:
-                            for track in album_tracks['items']:
-                                # Skip if we have enough tracks
-                                if len(all_tracks) >= 15:
-                                    break
-                                    
-                                track_id = track['id']
-                                track_name = track['name']
-                                
-                                # Skip if we already have this track
-                                if any(tid == track_id for tid, _ in all_tracks):
-                                    continue
-                                
-                                # Prioritize tracks where this artist is the primary artist
-                                primary_artist = track['artists'][0] if track['artists'] else None
-                                is_primary = primary_artist and primary_artist['id'] == artist_id
-                                
-                                if not is_primary:
-                                    continue  # Skip tracks where the artist isn't primary
-                                
-                                # Check match score against target genre
-                                artist_tup = (artist, artist_genres)
-                                matches, score = self.get_simplified_track_match(artist_tup, target_genre)
-                                
-                                track_info = (track_id, score)
-                                
-                                # Keep all tracks in a separate list
-                                all_tracks.append(track_info)
-                                
-                                # Add matching tracks to our results list
-                                if matches:
-                                    matching_tracks.append(track_info)
-                                    logging.info(f"Found additional album track for '{artist_name}': '{track_name}' (Score: {score:.2f})")
+                        # Only use album tracks where this artist is the primary artist
+                        primary_artist = track['artists'][0] if track['artists'] else None
+                        if not (primary_artist and primary_artist['id'] == artist_id):
+                            continue
+                        
+                        seen_track_ids.add(track['id'])
+                        candidates.append((track['id'], track['name'], True))
             except Exception as e:
                 logging.error(f"Error getting album tracks for {artist_name}: {e}")
         
-        # If we have matches, great; otherwise don't force inclusion
-        if matching_tracks:
-            logging.info(f"Found {len(matching_tracks)} genre-matching tracks out of {len(all_tracks)} for '{artist_name}' in genre '{target_genre}'")
-        else:
-            logging.warning(f"No genre-matching tracks found for '{artist_name}' in genre '{target_genre}'")
-            # Don't return fallback tracks if no genre matches - this ensures genre purity
-            return []
-        
-        # Sort final results by match score, descending
-        matching_tracks.sort(key=lambda x: x[1], reverse=True)
-        
-        # Apply a minimum score threshold to ensure genre integrity
-        min_score_threshold = 0.4  # This threshold ensures only relevant tracks are included
-        filtered_tracks = [(tid, score) for tid, score in matching_tracks if score >= min_score_threshold]
-        
-        if not filtered_tracks:
-            logging.warning(f"All tracks for '{artist_name}' had scores below threshold for genre '{target_genre}'")
-            return []
-        
-        # Return top 15 or whatever we have if less
-        return filtered_tracks[:15]
+        self.artist_tracks_cache[artist_id] = candidates
+        return candidates
 
     def classify_unmapped_genre(self, genre: str) -> str:
         """
@@ -1794,6 +2411,70 @@ class SpotifyPlaylistManager:
             # For single word genres, just capitalize
             return genre.capitalize()
 
+    def get_user_playlists(self, user_id: str) -> List[Dict]:
+        """
+        Get all of the user's playlists, paging through them only once per run.
+        
+        The list is only kept once every page has been fetched; after a failed page
+        the playlists fetched so far are returned and the next call tries again.
+        
+        Args:
+            user_id (str): Spotify user ID
+            
+        Returns:
+            List[Dict]: The user's playlists
+        """
+        if self.user_playlists is not None:
+            return self.user_playlists
+        
+        playlists = []
+        offset = 0
+        limit = 50
+        
+        # Paginate through all playlists
+        while True:
+            results = self.retry_on_rate_limit(
+                self.sp.user_playlists,
+                user_id,
+                limit=limit,
+                offset=offset
+            )
+            
+            if not results:
+                # A failed page leaves the list incomplete; don't keep it for the rest of
+                # the run, or existing playlists and taken numbers would be missed
+                logging.warning("Could not fetch all playlists for user %s; not caching the partial list", user_id)
+                return playlists
+            
+            playlists.extend(results['items'])
+            
+            if len(results['items']) < limit:
+                break
+                
+            offset += limit
+        
+        self.user_playlists = playlists
+        return playlists
+
+    def find_existing_playlist(self, playlist_name: str, user_id: str) -> Optional[Dict]:
+        """
+        Find a playlist the user already owns with exactly this name.
+        
+        Args:
+            playlist_name (str): Name of the playlist
+            user_id (str): Spotify user ID
+            
+        Returns:
+            Optional[Dict]: The existing playlist, or None if there isn't one
+        """
+        try:
+            for playlist in self.get_user_playlists(user_id):
+                if playlist.get('name') == playlist_name and (playlist.get('owner') or {}).get('id') == user_id:
+                    return playlist
+        except Exception as e:
+            logging.error(f"Error checking for existing playlist '{playlist_name}': {e}")
+        return None
+
     def get_next_playlist_number(self, genre, user_id):
         """
         Get the next available playlist number for a genre by checking existing playlists.
@@ -1806,29 +2487,8 @@ class SpotifyPlaylistManager:
             int: Next available playlist number (starts at 1)
         """
         try:
-            # Get all user's playlists
-            playlists = []
-            offset = 0
-            limit = 50
-            
-            # Paginate through all playlists
-            while True:
-                results = self.retry_on_rate_limit(
-                    self.sp.user_playlists,
-                    user_id,
-                    limit=limit,
-                    offset=offset
-                )
-                
-                if not results or not results['items']:
-                    break
-                    
-                playlists.extend(results['items'])
-                
-                if len(results['items']) < limit:
-                    break
-                    
-                offset += limit
+            # Get all user's playlists (fetched once per run)
+            playlists = self.get_user_playlists(user_id)
                 
             # Find highest existing number for this genre
             highest_number = 0
@@ -1859,57 +2519,26 @@ class SpotifyPlaylistManager:
         - Diverse artist representation
         - Exclusion of source artists
         """
-        # Load source artists to exclude
-        try:
-            recommendations_path = get_recommendations_path_from_config()
-            with open(recommendations_path, 'r', encoding='utf-8') as f:
-                recommendations_data = json.load(f)
-                source_artists = set(recommendations_data.keys())
-        except Exception as e:
-            logging.error(f"Error reading recommendations file: {e}")
-            source_artists = set()
+        # Load source artists to exclude; read_artist_genres has normally collected them already
+        source_artists = self.source_artists
+        if source_artists is None:
+            try:
+                recommendations_path = get_recommendations_path_from_config()
+                with open(recommendations_path, 'rb') as f:
+                    source_artists = set(json_loads(f.read()).keys())
+            except Exception as e:
+                logging.error(f"Error reading recommendations file: {e}")
+                source_artists = set()
 
-        # Define genre family roots for conflict resolution
-        genre_families = {
-            'Rock': ['Rock', 'Rock - Alternative', 'Rock - Classic', 'Rock - Indie', 'Rock - Progressive'],
-            'Metal': ['Metal', 'Metal - Heavy', 'Metal - Thrash', 'Metal - Death/Black', 'Metal - Progressive'],
-            'Pop': ['Pop', 'Pop - Dance', 'Pop - Synth', 'Pop - Indie'],
-            'Electronic': ['Electronic', 'Electronic - House', 'Electronic - Techno', 'Electronic - Ambient', 
-                          'Electronic - Drum & Bass', 'Electronic - Trance'],
-            'Hip Hop': ['Hip Hop', 'Hip Hop - Old School', 'Hip Hop - Trap', 'Hip Hop - Alternative'],
-            'R&B & Soul': ['R&B & Soul', 'R&B', 'Soul', 'Funk'],
-            'Jazz': ['Jazz', 'Jazz - Fusion', 'Jazz - Bebop', 'Jazz - Contemporary'],
-            'Folk & Country': ['Folk & Country', 'Folk', 'Country', 'Americana', 'Singer-Songwriter'],
-            'Classical': ['Classical', 'Orchestral', 'Chamber', 'Piano'],
-            'World': ['World', 'Latin', 'Reggae', 'African', 'Asian']
-        }
-        
-        # Create a reverse lookup to find which family a genre belongs to
-        genre_to_family = {}
-        for family, genres in genre_families.items():
-            for genre in genres:
-                genre_to_family[genre] = family
-        
-        # Define conflicting genre families that shouldn't share artists
-        family_conflicts = {
-            'Rock': ['Classical', 'Jazz', 'Electronic', 'Hip Hop', 'World'],
-            'Metal': ['Classical', 'Jazz', 'Electronic', 'Pop', 'Hip Hop', 'R&B & Soul', 'Folk & Country', 'World'],
-            'Electronic': ['Rock', 'Metal', 'Classical', 'Folk & Country', 'Blues'],
-            'Hip Hop': ['Rock', 'Metal', 'Classical', 'Folk & Country', 'Blues'],
-            'Pop': ['Metal', 'Classical', 'Blues'],
-            'Classical': ['Rock', 'Metal', 'Electronic', 'Hip Hop', 'Pop', 'Punk'],
-            'Folk & Country': ['Electronic', 'Hip Hop', 'Metal'],
-            'Jazz': ['Metal', 'Punk']
-        }
-        
-        # Track artists used in each genre family to enforce boundaries
-        family_artists = defaultdict(set)
+        # Track artists used in each genre family to enforce boundaries; a plain dict, so
+        # conflict checks against families with no artists yet don't create empty sets
+        family_artists = {}
         
         # Track playlist creation results
         playlist_targets = {}
 
         # Get user ID once for playlist number checking
-        user_id = self.sp.me()['id']
+        user_id = self.user['id']
 
         # Collect all tracks for each genre to assess total counts
         genre_tracks_collection = {}
@@ -1920,15 +2549,31 @@ class SpotifyPlaylistManager:
         # Total genres for progress tracking
         total_genres = len(sorted_genres)
         
+        # Genres are processed largest first (so main genres claim artists before conflicting
+        # families do), which made a genre-count percentage crawl through the big genres and
+        # race through the small ones. Weight progress by the lookups each genre can need instead
+        genre_work = [min(self.max_artists_per_genre, len(artists)) for _, artists in sorted_genres]
+        total_work = sum(genre_work) or 1
+        completed_work = 0
+        
         for i, (genre, genre_specific_artists) in enumerate(sorted_genres, 1):
             # Update progress tracking
-            progress_percentage = int((i / total_genres) * 100)
-            logging.info(f"Processing: {progress_percentage}% ({i}/{total_genres} genres)")
+            completed_work += genre_work[i - 1]
+            progress_percentage = int((completed_work / total_work) * 100)
+            logging.info("Processing: %s%% (%s/%s genres)", progress_percentage, i, total_genres)
             
-            logging.info(f"Processing genre: {genre} with {len(genre_specific_artists)} artists")
+            logging.info("Processing genre: %s with %s artists", genre, len(genre_specific_artists))
             
             # Determine which genre family this belongs to
-            current_family = genre_to_family.get(genre, genre)
+            current_family = GENRE_TO_FAMILY.get(genre, genre)
+            
+            # Resolve the conflicting families' artist sets once per genre, leaving out
+            # families that have no artists yet
+            conflict_sets = [
+                (conflict_family, family_artists[conflict_family])
+                for conflict_family in FAMILY_CONFLICTS.get(current_family, ())
+                if family_artists.get(conflict_family)
+            ]
             
             # Filter out source and previously used artists from conflicting genres
             available_artists = []
@@ -1941,12 +2586,12 @@ class SpotifyPlaylistManager:
                 has_conflict = False
                 
                 # If this genre has conflicts defined
-                if current_family in family_conflicts:
+                if conflict_sets:
                     # Check each conflicting family
-                    for conflict_family in family_conflicts[current_family]:
+                    for conflict_family, conflict_artists in conflict_sets:
                         # If artist is already in a conflicting family, skip
-                        if artist in family_artists[conflict_family]:
-                            logging.info(f"Skipping '{artist}' for '{genre}' - already in conflicting genre family '{conflict_family}'")
+                        if artist in conflict_artists:
+                            logging.info("Skipping '%s' for '%s' - already in conflicting genre family '%s'", artist, genre, conflict_family)
                             has_conflict = True
                             break
                 
@@ -1954,85 +2599,120 @@ class SpotifyPlaylistManager:
                     available_artists.append(artist)
             
             # Log how many available artists we have
-            logging.info(f"After filtering, {len(available_artists)} artists available for genre: {genre}")
+            logging.info("After filtering, %s artists available for genre: %s", len(available_artists), genre)
             
             # Skip if no artists are available
             if not available_artists:
-                logging.warning(f"No available artists for genre: {genre}. Skipping.")
+                logging.warning("No available artists for genre: %s. Skipping.", genre)
                 continue
-
-            # Randomize artist order for variety but keep deterministic seed for consistency
-            random.seed(genre)  # Use genre name as seed for deterministic shuffling
-            random.shuffle(available_artists)
             
-            # Reset the seed to ensure other random operations are truly random
-            random.seed(None)
+            # Too few artists can never produce a playlist - don't spend API calls on their tracks
+            if len(available_artists) < self.min_playlist_artists:
+                logging.warning("Only %s artists available for genre '%s'. Skipping track lookups.", len(available_artists), genre)
+                continue
+
+            # Randomize artist order for variety but keep deterministic seed for consistency.
+            # A private generator seeded with the genre name gives the same order as seeding
+            # the global one, without re-seeding it from the OS afterwards
+            random.Random(genre).shuffle(available_artists)
 
             # Track found artists and their tracks
             artist_track_mapping = {}
+            genre_track_ids = set()  # Every track ID already taken for this genre
 
             # Process a reasonable number of artists
             artist_count = 0
-            max_artists = min(50, len(available_artists))  # Process more artists to account for filtering
-            
-            logging.info(f"Processing up to {max_artists} artists for genre: {genre}")
-
-            for artist in available_artists:
-                # Stop if we've processed enough artists
-                if artist_count >= max_artists:
-                    break
-
-                try:
-                    # Get tracks that match the genre for this artist
-                    tracks = self.organise_artist_tracks(artist, genre)
+            max_artists = min(self.max_artists_per_genre, len(available_artists))  # Process more artists to account for filtering
+            
+            logging.info("Processing up to %s artists for genre: %s", max_artists, genre)
+
+            # Look up artists concurrently - each lookup is an independent chain of
+            # Spotify round-trips. A sliding window keeps up to max_workers lookups in
+            # flight, never more than the number of artists still needed, and tops it
+            # up as soon as the oldest lookup finishes rather than waiting for a whole
+            # batch. Results are consumed in submission order so the seeded shuffle
+            # above still decides which artists make the cut.
+            # Refresh details for the artists most likely to be used in one bulk request
+            # (sp.artists takes up to 50 IDs); artists we have no Spotify ID for yet are
+            # resolved by search in their own worker
+            self.prefetch_artist_details(available_artists[:max_artists], genre)
+            
+            next_index = 0
+            pending = deque()
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                while True:
+                    # Top up the window with the next artists in shuffled order
+                    free_slots = min(self.max_workers - len(pending), max_artists - artist_count - len(pending))
+                    if free_slots > 0 and next_index < len(available_artists):
+                        batch = available_artists[next_index:next_index + free_slots]
+                        
+                        # Artists past the prefetched ones are refreshed in bulk too; a single
+                        # artist is cheaper to leave to its worker than to fetch here
+                        unfetched = batch[max(0, max_artists - next_index):]
+                        if len(unfetched) > 1:
+                            self.prefetch_artist_details(unfetched, genre)
+                        next_index += len(batch)
+                        
+                        # Get tracks that match the genre for each artist
+                        pending.extend((artist, executor.submit(self.organise_artist_tracks, artist, genre)) for artist in batch)
                     
-                    # Skip if no tracks found
-                    if not tracks:
-                        continue
+                    if not pending:
+                        break
                     
-                    # Convert to track URIs
-                    track_uris = [f"spotify:track:{track_id}" for track_id, _ in tracks]
+                    artist, future = pending.popleft()
+                    try:
+                        tracks = future.result()
+                        
+                        # Skip if no tracks found
+                        if not tracks:
+                            continue
+                        
+                        # Convert to track URIs, dropping tracks this genre already has - name
+                        # variants resolving to the same Spotify artist, and collaborations,
+                        # would otherwise put the same track in the playlist twice
+                        track_uris = []
+                        for track_id, _ in tracks:
+                            if track_id not in genre_track_ids:
+                                genre_track_ids.add(track_id)
+                                track_uris.append(f"spotify:track:{track_id}")
+                        
+                        # Store tracks and mark artist as used in this genre family
+                        if track_uris:
+                            artist_track_mapping[artist] = track_uris
+                            family_artists.setdefault(current_family, set()).add(artist)
+                            artist_count += 1
+                            logging.info("Added %s track(s) from %s (%s/%s)", len(track_uris), artist, artist_count, max_artists)
                     
-                    # Store tracks and mark artist as used in this genre family
-                    if track_uris:
-                        artist_track_mapping[artist] = track_uris
-                        family_artists[current_family].add(artist)
-                        artist_count += 1
-                        logging.info(f"Added {len(track_uris)} track(s) from {artist} ({artist_count}/{max_artists})")
-
-                    # Add a small delay to avoid hitting rate limits
-                    time.sleep(self.request_delay)
-
-                except Exception as e:
-                    logging.error(f"Failed to process artist '{artist}': {e}")
+                    except Exception as e:
+                        logging.error(f"Failed to process artist '{artist}': {e}")
 
             # Skip if no tracks found
             if not artist_track_mapping:
-                logging.warning(f"No tracks found for genre: {genre}")
+                logging.warning("No tracks found for genre: %s", genre)
                 continue
 
-            # Create balanced playlist
-            balanced_tracks = self.create_balanced_playlist(artist_track_mapping)
-            
-            # Store in the collection for later playlist creation
+            # Store in the collection for later playlist creation - balancing waits
+            # until the second pass so genres that get skipped are never balanced
             genre_tracks_collection[genre] = {
-                'tracks': balanced_tracks,
+                'artist_tracks': artist_track_mapping,
                 'artists_count': len(artist_track_mapping),
-                'tracks_count': len(balanced_tracks)
+                'tracks_count': sum(len(tracks) for tracks in artist_track_mapping.values())
             }
         
         # Second pass: Create playlists based on collected track counts
         for genre, collection_data in genre_tracks_collection.items():
             total_tracks = collection_data['tracks_count']
             total_artists = collection_data['artists_count']
-            balanced_tracks = collection_data['tracks']
             
             # Skip if we don't have enough tracks or artists
-            if total_tracks < 10 or total_artists < 3:
-                logging.warning(f"Insufficient content for genre '{genre}': {total_artists} artists, {total_tracks} tracks. Skipping.")
+            if total_tracks < self.min_playlist_tracks or total_artists < self.min_playlist_artists:
+                logging.warning("Insufficient content for genre '%s': %s artists, %s tracks. Skipping.", genre, total_artists, total_tracks)
                 continue
+            
+            # Create balanced playlist once, shared by every playlist split below
+            balanced_tracks = self.create_balanced_playlist(collection_data['artist_tracks'])
                 
-            logging.info(f"Creating playlists for genre '{genre}' with {total_tracks} tracks from {total_artists} artists")
+            logging.info("Creating playlists for genre '%s' with %s tracks from %s artists", genre, total_tracks, total_artists)
 
             # For small playlists (less than 20 artists), create just 1 playlist without numbering
             if total_artists < 20:
@@ -2040,26 +2720,42 @@ class SpotifyPlaylistManager:
                     # Use a clean genre name without numbering for small playlists
                     playlist_name = genre
                     
-                    # Create playlist
-                    playlist = self.sp.user_playlist_create(
-                        user=user_id,
-                        name=playlist_name,
-                        public=True,
-                        description=f"Top {genre} tracks from {total_artists} unique artists - Created by GenreGenius"
-                    )
-
-                    # Add tracks in chunks of 100 maximum (Spotify API limit)
-                    for j in range(0, total_tracks, 100):
-                        chunk = balanced_tracks[j:min(j + 100, total_tracks)]
-                        self.sp.playlist_add_items(
-                            playlist['id'], 
-                            chunk
+                    # Refresh the playlist from an earlier run rather than creating a duplicate
+                    chunk_size = self.playlist_chunk_size
+                    first_chunk = []
+                    playlist = self.find_existing_playlist(playlist_name, user_id)
+                    reused_playlist = playlist is not None
+                    if playlist:
+                        logging.info("Replacing tracks in existing playlist '%s'", playlist_name)
+                        # The replace request carries the first chunk itself, saving an add request
+                        first_chunk = balanced_tracks[:chunk_size]
+                        if not self.retry_on_rate_limit(self.sp.playlist_replace_items, playlist['id'], first_chunk):
+                            # Adding the rest would append it to the old contents
+                            logging.error(f"Failed to replace tracks in playlist '{playlist_name}'")
+                            continue
+                    else:
+                        # Create playlist, paced and retried like every other Spotify request
+                        playlist = self.retry_on_rate_limit(
+                            self.sp.user_playlist_create,
+                            user=user_id,
+                            name=playlist_name,
+                            public=True,
+                            description=f"Top {genre} tracks from {total_artists} unique artists - Created by GenreGenius"
                         )
-                        logging.info(f"Added {len(chunk)} tracks to playlist '{playlist_name}' (chunk {j//100 + 1})")
+                        if not playlist:
+                            logging.error(f"Failed to create playlist for genre '{playlist_name}'")
+                            continue
+
+                    # Add the remaining tracks in chunks of 100 maximum (Spotify API limit)
+                    for j in range(len(first_chunk), total_tracks, chunk_size):
+                        chunk = balanced_tracks[j:j + chunk_size]
+                        self.retry_on_rate_limit(self.sp.playlist_add_items, playlist['id'], chunk)
+                        logging.info("Added %s tracks to playlist '%s' (chunk %s)", len(chunk), playlist_name, j // chunk_size + 1)
 
                     # Log playlist details
-                    logging.info(f"Created playlist '{playlist_name}' with {total_tracks} tracks from {total_artists} artists")
-                    logging.info(f"Playlist URL: {playlist['external_urls']['spotify']}")
+                    logging.info("%s playlist '%s' with %s tracks from %s artists",
+                                 "Replaced tracks in" if reused_playlist else "Created", playlist_name, total_tracks, total_artists)
+                    logging.info("Playlist URL: %s", playlist['external_urls']['spotify'])
 
                     # Track playlist creation
                     playlist_targets[playlist_name] = {
@@ -2081,7 +2777,7 @@ class SpotifyPlaylistManager:
                 else:
                     # Calculate number of playlists, aiming for 80-100 tracks each
                     num_playlists = (total_tracks + 79) // 80
-                    logging.info(f"Creating {num_playlists} playlists for {total_tracks} tracks in genre '{genre}'")
+                    logging.info("Creating %s playlists for %s tracks in genre '%s'", num_playlists, total_tracks, genre)
 
                 # Get the next available playlist number for this genre
                 next_number = self.get_next_playlist_number(genre, user_id)
@@ -2103,26 +2799,28 @@ class SpotifyPlaylistManager:
                     playlist_name = f"{genre} #{next_number + i}"
 
                     try:
-                        # Create playlist
-                        playlist = self.sp.user_playlist_create(
+                        # Create playlist, paced and retried like every other Spotify request
+                        playlist = self.retry_on_rate_limit(
+                            self.sp.user_playlist_create,
                             user=user_id,
                             name=playlist_name,
                             public=True,
                             description=f"Top {genre} tracks from {total_artists} unique artists - Created by GenreGenius"
                         )
+                        if not playlist:
+                            logging.error(f"Failed to create playlist for genre '{playlist_name}'")
+                            continue
 
                         # Add tracks in chunks of 100 maximum (Spotify API limit)
-                        for j in range(0, len(playlist_tracks), 100):
-                            chunk = playlist_tracks[j:min(j + 100, len(playlist_tracks))]
-                            self.sp.playlist_add_items(
-                                playlist['id'], 
-                                chunk
-                            )
-                            logging.info(f"Added {len(chunk)} tracks to playlist '{playlist_name}' (chunk {j//100 + 1})")
+                        chunk_size = self.playlist_chunk_size
+                        for j in range(0, len(playlist_tracks), chunk_size):
+                            chunk = playlist_tracks[j:j + chunk_size]
+                            self.retry_on_rate_limit(self.sp.playlist_add_items, playlist['id'], chunk)
+                            logging.info("Added %s tracks to playlist '%s' (chunk %s)", len(chunk), playlist_name, j // chunk_size + 1)
 
                         # Log playlist details
-                        logging.info(f"Created playlist '{playlist_name}' with {len(playlist_tracks)} tracks")
-                        logging.info(f"Playlist URL: {playlist['external_urls']['spotify']}")
+                        logging.info("Created playlist '%s' with %s tracks", playlist_name, len(playlist_tracks))
+                        logging.info("Playlist URL: %s", playlist['external_urls']['spotify'])
 
                         # Track playlist creation
                         playlist_targets[playlist_name] = {
@@ -2155,41 +2853,44 @@ class SpotifyPlaylistManager:
         Returns:
             List[str]: A balanced list of track IDs
         """
-        # First, get all tracks for initial shuffle
-        all_artists = list(artist_track_mapping.keys())
-        
-        # No need to balance if we have 0 or 1 artist
-        if len(all_artists) <= 1:
-            all_tracks = []
-            for tracks in artist_track_mapping.values():
-                all_tracks.extend(tracks)
-            random.shuffle(all_tracks)
-            return all_tracks
-        
-        # Shuffle the artists first
-        random.shuffle(all_artists)
+        # No need to balance if we have 0 or 1 artist - just return a shuffled copy
+        if len(artist_track_mapping) <= 1:
+            all_tracks = [track for tracks in artist_track_mapping.values() for track in tracks]
+            return random.sample(all_tracks, len(all_tracks))
+        
+        # Create a queue for each artist's tracks; sample() gives a shuffled copy in one
+        # pass and leaves the caller's list untouched
+        artist_queues = {
+            artist: deque(random.sample(tracks, len(tracks)))
+            for artist, tracks in artist_track_mapping.items()
+        }
         
-        # Create a queue for each artist's tracks
-        artist_queues = {}
-        for artist in all_artists:
-            tracks = artist_track_mapping[artist].copy()
-            random.shuffle(tracks)  # Shuffle each artist's tracks
-            artist_queues[artist] = tracks
+        # Max-heap keyed by remaining track count; the random second element breaks ties
+        heap = [(-len(queue), random.random(), artist) for artist, queue in artist_queues.items() if queue]
+        heapq.heapify(heap)
         
-        # Build the balanced playlist by rotating through artists
+        # Build the balanced playlist by always taking from the artist with the most
+        # tracks left, holding back the artist we just used so tracks never repeat
+        # back-to-back while another artist is available
         balanced_playlist = []
+        held_back = None
         
-        # Continue until all tracks are used
-        while any(len(queue) > 0 for queue in artist_queues.values()):
-            # Reshuffle artist order for each rotation to further randomize
-            random.shuffle(all_artists)
+        while heap:
+            remaining, _, artist = heapq.heappop(heap)
+            track = artist_queues[artist].popleft()
+            balanced_playlist.append(track)
             
-            # Add one track from each artist that still has tracks
-            for artist in all_artists:
-                if artist_queues[artist]:
-                    # Add the next track for this artist
-                    track = artist_queues[artist].pop(0)
-                    balanced_playlist.append(track)
+            # Return the previously used artist to the heap now that someone else played
+            if held_back:
+                heapq.heappush(heap, held_back)
+                held_back = None
+            
+            if artist_queues[artist]:
+                held_back = (remaining + 1, random.random(), artist)
+        
+        # Only one artist can be left over; append whatever it still has
+        if held_back:
+            balanced_playlist.extend(artist_queues[held_back[2]])
         
         return balanced_playlist
 
@@ -2203,15 +2904,15 @@ class SpotifyPlaylistManager:
         """
         try:
             # Get user details and log them for debugging
-            user_details = self.sp.current_user()
+            user_details = self.user
             user_id = user_details['id']
             display_name = user_details.get('display_name', 'Unknown')
-            logging.info(f"Creating playlists for Spotify user: {user_id} ({display_name})")
+            logging.info("Creating playlists for Spotify user: %s (%s)", user_id, display_name)
             
             # Log the playlists we're about to create
-            logging.info(f"Attempting to create {len(all_playlists)} playlists")
+            logging.info("Attempting to create %s playlists", len(all_playlists))
             for playlist_name, tracks in all_playlists.items():
-                logging.info(f"  - '{playlist_name}': {len(tracks)} tracks")
+                logging.info("  - '%s': %s tracks", playlist_name, len(tracks))
             
             # Sort playlists by name for consistent ordering
             sorted_playlists = sorted(all_playlists.items(), key=lambda x: x[0])
@@ -2224,7 +2925,7 @@ class SpotifyPlaylistManager:
             # Process playlists in sorted order
             for playlist_index, (original_name, tracks) in enumerate(sorted_playlists, start=1):
                 if not tracks:
-                    logging.warning(f"No tracks found for '{original_name}'. Skipping.")
+                    logging.warning("No tracks found for '%s'. Skipping.", original_name)
                     failed_playlists.append((original_name, "No tracks"))
                     continue
                 
@@ -2253,13 +2954,13 @@ class SpotifyPlaylistManager:
                 
                 # Try to create and populate the playlist with proper error handling
                 try:
-                    logging.info(f"Creating playlist '{playlist_name}' with {len(tracks)} tracks")
+                    logging.info("Creating playlist '%s' with %s tracks", playlist_name, len(tracks))
                     playlist_result = self.create_playlist(playlist_name, tracks, user_id, description)
                     
                     if playlist_result:
                         playlist_url = f"https://open.spotify.com/playlist/{playlist_result}"
-                        logging.info(f"SUCCESS: Created playlist: {playlist_name}")
-                        logging.info(f"Playlist URL: {playlist_url}")
+                        logging.info("SUCCESS: Created playlist: %s", playlist_name)
+                        logging.info("Playlist URL: %s", playlist_url)
                         successful_playlists.append((playlist_name, len(tracks), playlist_url))
                         total_tracks_added += len(tracks)
                     else:
@@ -2272,18 +2973,18 @@ class SpotifyPlaylistManager:
             # Print summary of results
             logging.info("\n" + "="*60)
             logging.info(f"PLAYLIST CREATION SUMMARY:")
-            logging.info(f"Successfully created {len(successful_playlists)} out of {len(sorted_playlists)} playlists")
-            logging.info(f"Total tracks added: {total_tracks_added}")
+            logging.info("Successfully created %s out of %s playlists", len(successful_playlists), len(sorted_playlists))
+            logging.info("Total tracks added: %s", total_tracks_added)
             
             if successful_playlists:
                 logging.info("\nSuccessful playlists:")
                 for name, track_count, url in successful_playlists:
-                    logging.info(f"  - {name} ({track_count} tracks): {url}")
+                    logging.info("  - %s (%s tracks): %s", name, track_count, url)
             
             if failed_playlists:
                 logging.info("\nFailed playlists:")
                 for name, reason in failed_playlists:
-                    logging.info(f"  - {name}: {reason}")
+                    logging.info("  - %s: %s", name, reason)
             
             logging.info("="*60)
                     
@@ -2292,13 +2993,7 @@ class SpotifyPlaylistManager:
             import traceback
             logging.error(traceback.format_exc())
 
-    @backoff.on_exception(
-        backoff.expo, 
-        (socket.gaierror, Exception),
-        max_tries=5,
-        giveup=lambda e: not dns_resolve_backoff(e),
-        on_backoff=backoff_hdlr
-    )
+    @retry_on_network_error
     def create_playlist(self, playlist_name: str, track_ids: List[str], user_id: str, description: str = None) -> Optional[str]:
         """
         Create a playlist and add tracks to it with improved error handling.
@@ -2314,38 +3009,49 @@ class SpotifyPlaylistManager:
         """
         try:
             # First create an empty playlist
-            logging.info(f"Creating empty playlist '{playlist_name}'")
+            logging.debug("Creating empty playlist '%s'", playlist_name)
             
             # If no description provided, create a generic one
             if not description:
                 description = f"Playlist created by GenreGenius discovery tool"
             
-            playlist = self.sp.user_playlist_create(
-                user_id, 
-                playlist_name, 
-                public=True,
-                description=description
-            )
-            playlist_id = playlist['id']
+            # Tracks are added in chunks of 100 (the maximum Spotify accepts per request)
+            chunk_size = self.playlist_chunk_size
+            tracks_added = 0
             
-            # Log playlist details
-            logging.info(f"Empty playlist created with ID: {playlist_id}")
+            # Refresh the playlist from an earlier run rather than creating a duplicate; the
+            # replace request carries the first chunk itself, saving an add request
+            existing_playlist = self.find_existing_playlist(playlist_name, user_id)
+            if existing_playlist:
+                playlist_id = existing_playlist['id']
+                first_chunk = track_ids[:chunk_size]
+                self.sp.playlist_replace_items(playlist_id, first_chunk)
+                tracks_added = len(first_chunk)
+                logging.debug("Replaced tracks in existing playlist with ID: %s", playlist_id)
+            else:
+                playlist = self.sp.user_playlist_create(
+                    user_id, 
+                    playlist_name, 
+                    public=True,
+                    description=description
+                )
+                playlist_id = playlist['id']
+                
+                # Log playlist details
+                logging.debug("Empty playlist created with ID: %s", playlist_id)
             
             # Then add tracks to it in chunks to avoid API limits
             total_tracks = len(track_ids)
-            logging.info(f"Adding {total_tracks} tracks to playlist")
+            logging.info("Adding %s tracks to playlist", total_tracks)
             
-            # Add tracks in chunks of 50
-            chunk_size = 50
-            tracks_added = 0
             failed_chunks = 0
             
-            for i in range(0, total_tracks, chunk_size):
+            for i in range(tracks_added, total_tracks, chunk_size):
                 chunk = track_ids[i:i+chunk_size]
                 chunk_num = (i // chunk_size) + 1
                 total_chunks = (total_tracks + chunk_size - 1) // chunk_size
                 
-                logging.info(f"Adding chunk {chunk_num}/{total_chunks} ({len(chunk)} tracks)")
+                logging.debug("Adding chunk %s/%s (%s tracks)", chunk_num, total_chunks, len(chunk))
                 
                 # Try to add the tracks with specific error handling
                 retry_count = 0
@@ -2353,9 +3059,9 @@ class SpotifyPlaylistManager:
                 
                 while retry_count < max_retries:
                     try:
-                        self.sp.user_playlist_add_tracks(user_id, playlist_id, chunk)
+                        self.sp.playlist_add_items(playlist_id, chunk)
                         tracks_added += len(chunk)
-                        logging.info(f"Successfully added chunk {chunk_num}/{total_chunks} to playlist")
+                        logging.debug("Successfully added chunk %s/%s to playlist", chunk_num, total_chunks)
                         break  # Success, exit retry loop
                         
                     except SpotifyException as e:
@@ -2363,7 +3069,7 @@ class SpotifyPlaylistManager:
                         
                         if e.http_status == 429:  # Rate limiting
                             retry_after = int(e.headers.get("Retry-After", 5))
-                            logging.warning(f"Rate limit hit. Waiting {retry_after}s before retry {retry_count}/{max_retries}")
+                            logging.warning("Rate limit hit. Waiting %ss before retry %s/%s", retry_after, retry_count, max_retries)
                             time.sleep(retry_after + 1)  # Add buffer
                         elif e.http_status == 401:  # Auth error
                             logging.error(f"Authentication error adding tracks. Attempting to refresh token.")
@@ -2378,7 +3084,7 @@ class SpotifyPlaylistManager:
                             logging.error(f"Spotify API error adding tracks: {e} (Status: {e.http_status})")
                             if retry_count < max_retries:
                                 wait_time = 2 ** retry_count  # Exponential backoff
-                                logging.info(f"Retrying in {wait_time}s...")
+                                logging.info("Retrying in %ss...", wait_time)
                                 time.sleep(wait_time)
                             else:
                                 logging.error(f"Failed to add chunk after {max_retries} retries")
@@ -2390,7 +3096,7 @@ class SpotifyPlaylistManager:
                         logging.error(f"General error adding tracks: {e}")
                         if retry_count < max_retries:
                             wait_time = 2 ** retry_count  # Exponential backoff
-                            logging.info(f"Retrying in {wait_time}s...")
+                            logging.info("Retrying in %ss...", wait_time)
                             time.sleep(wait_time)
                         else:
                             logging.error(f"Failed to add chunk after {max_retries} retries")
@@ -2399,9 +3105,9 @@ class SpotifyPlaylistManager:
             
             # Log summary of track addition
             if failed_chunks > 0:
-                logging.warning(f"Added {tracks_added}/{total_tracks} tracks to playlist. {failed_chunks} chunks failed.")
+                logging.warning("Added %s/%s tracks to playlist. %s chunks failed.", tracks_added, total_tracks, failed_chunks)
             else:
-                logging.info(f"Successfully added all {tracks_added} tracks to playlist!")
+                logging.info("Successfully added all %s tracks to playlist!", tracks_added)
             
             # For playlists with artwork capability, we could add custom artwork here
             # (Spotify doesn't currently support custom artwork via API)
@@ -2429,12 +3135,14 @@ def main() -> None:
     parser.add_argument('--client-id', dest='client_id', help='Spotify API Client ID')
     parser.add_argument('--client-secret', dest='client_secret', help='Spotify API Client Secret')
     parser.add_argument('--mb-email', dest='mb_email', help='MusicBrainz Email Address')
+    parser.add_argument('--input', dest='input_file', help='Path to recommendations.json (skips the config lookup)')
+    parser.add_argument('--verbose', action='store_true', help='Log every API call and playlist chunk')
     
     # Parse arguments
     args = parser.parse_args()
     
     # Setup logging
-    setup_logging()
+    setup_logging(verbose=args.verbose)
 
     try:
         # Initialize with custom settings if provided
@@ -2444,7 +3152,14 @@ def main() -> None:
             mb_email=args.mb_email
         )
 
-        file_path = get_recommendations_path_from_config()
+        # An explicit --input path (e.g. automated re-runs) skips the config lookup entirely
+        if args.input_file:
+            if not os.path.exists(args.input_file):
+                logging.error(f"Recommendations file not found: {args.input_file}")
+                return
+            file_path = args.input_file
+        else:
+            file_path = get_recommendations_path_from_config()
         logging.info(f"Using recommendations file: {file_path}")
 
         genre_artists = manager.read_artist_genres(file_path)
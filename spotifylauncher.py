@@ -5,27 +5,30 @@ Spotify Launcher - GUI Application for Music Discovery and Spotify Playlist Crea
 import sys
 import os
 import argparse
-import subprocess
 import webbrowser
 import logging
 import time
-import threading
 import traceback
-import queue
 import re
 import json
+from collections import deque
+from functools import lru_cache
 from typing import List, Optional, Dict
 import ctypes
-from ctypes import windll, byref, sizeof, c_int
+from ctypes import byref, sizeof, c_int
+if sys.platform == 'win32':
+    from ctypes import windll
+else:
+    windll = None  # Title bar styling is Windows-only; its callers already catch the failure
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QDialog, QPushButton, QVBoxLayout, QHBoxLayout, QWidget, QLabel, QLineEdit,
-    QTextEdit, QMenuBar, QMenu, QAction, QMessageBox, QProgressBar, QTabWidget, QWIDGETSIZE_MAX, QPushButton,
+    QPlainTextEdit, QMenuBar, QMenu, QAction, QMessageBox, QProgressBar, QTabWidget, QWIDGETSIZE_MAX, QPushButton,
     QFileDialog, QCheckBox, QGroupBox
 )
 from PyQt5.QtGui import QIcon, QFont, QColor, QPalette, QPainter, QPainterPath
 from PyQt5.QtCore import ( 
-    Qt, QThread, pyqtSignal, QObject, QMutex, QMutexLocker, pyqtSlot, QEvent, QRect,
+    Qt, QThread, QTimer, QProcess, QEventLoop, QMetaObject, pyqtSignal, QObject, pyqtSlot, QEvent, QRect,
     QPropertyAnimation, QEasingCurve, pyqtProperty, QSize, QPointF, QRectF
 )
 
@@ -42,6 +45,55 @@ class GuiLogHandler(logging.Handler):
 
 DEFAULT_EMAIL = "your email"  # Use the same email as in musicdiscovery.py
 
+LOG_MAX_BLOCKS = 5000  # Lines kept in each output tab; older lines are trimmed automatically
+
+# Last formatted log timestamp as (whole seconds, "HH:MM:SS"); it only changes once a second
+TIMESTAMP_CACHE = (0, "")
+
+
+def log_timestamp() -> str:
+    """
+    Return the current time formatted for the output tabs, reformatting at most once a second.
+    
+    Returns:
+        str: Current local time as HH:MM:SS
+    """
+    global TIMESTAMP_CACHE
+    now = int(time.time())
+    if now != TIMESTAMP_CACHE[0]:
+        # Replace the whole tuple so other threads never see a half-updated cache
+        TIMESTAMP_CACHE = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+    return TIMESTAMP_CACHE[1]
+
+
+@lru_cache(maxsize=8)
+def locate_venv_python(script_dir: str) -> str:
+    """
+    Find the Python executable of a virtual environment next to the scripts.
+    
+    Cached per directory, so launching several scripts from the same place only
+    checks the filesystem once.
+    
+    Args:
+        script_dir (str): Script directory to search for venv
+        
+    Returns:
+        str: Path to Python executable or "python" if not found
+    """
+    # Common virtual environment folder names, in order of preference
+    if os.name == 'nt':  # Windows
+        relative_exe = ('Scripts', 'python.exe')
+    else:  # Linux/Mac
+        relative_exe = ('bin', 'python')
+    venv_paths = tuple(
+        os.path.join(script_dir, venv_name, *relative_exe)
+        for venv_name in ('venv', '.venv', 'env', '.env')
+    )
+    
+    # Use the first one that exists, otherwise fall back to system Python
+    return next((path for path in venv_paths if os.path.exists(path)), "python")
+
+
 # Global dictionary to track last update times for different phases
 STATUS_UPDATE_THROTTLE: Dict[str, float] = {
     'discovery': 0,
@@ -52,12 +104,81 @@ STATUS_UPDATE_THROTTLE: Dict[str, float] = {
 
 # Thread-safe logger class to handle log operations safely
 class ThreadSafeLogger(QObject):
-    """Thread-safe logging mechanism to prevent UI crashes during log updates."""
+    """
+    Thread-safe logging mechanism to prevent UI crashes during log updates.
+    
+    Messages are buffered and written to their widgets in batches on a short timer,
+    so a chatty subprocess costs one append (and one relayout) per widget per flush
+    rather than one per line.
+    """
+    
+    FLUSH_INTERVAL_MS = 50  # How long messages are collected before being written out
+    VERBOSE = False  # Also echo every message to the console; follows the debug tab toggle
     
     def __init__(self):
         """Initialize the thread-safe logger."""
         super().__init__()
-        self.mutex = QMutex()
+        # (text_edit, formatted_message, message, status_label) awaiting a flush. No lock
+        # is needed: deque append/popleft are atomic, and postEvent is thread-safe
+        self.pending = deque()
+        self.flush_scheduled = False
+        
+        # Single-shot timer owned by the main thread; worker threads can't start it
+        # directly, so the first message of a batch posts a LogEvent that does
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self.flush_timer.timeout.connect(self._flush_logs)
+        
+        # Formats text for the status labels; set once by bind_parent
+        self.truncate_status_fn = None
+    
+    def bind_parent(self, parent):
+        """
+        Use the main window's truncate_status to format status label text.
+        
+        Args:
+            parent (QObject): Window providing a truncate_status method
+        """
+        self.truncate_status_fn = getattr(parent, 'truncate_status', None)
+    
+    def event(self, event):
+        """
+        Run queued log callbacks in the main thread.
+        
+        Args:
+            event (QEvent): Event to process
+            
+        Returns:
+            bool: True if event was handled, otherwise result of parent implementation
+        """
+        if event.type() == LogEvent.EVENT_TYPE:
+            event.callback()
+            return True
+        return super().event(event)
+    
+    def _queue_message(self, message, text_edit, status_label=None):
+        """
+        Buffer a message for the next flush, scheduling one if needed.
+        
+        Args:
+            message (str): Message to log
+            text_edit (QPlainTextEdit): Text edit widget to update
+            status_label (QLabel, optional): Status label to update
+        """
+        # Timestamp when the message arrives, not when it is flushed
+        # Workers emit whole chunks of output, so stamp every line and use the last one for the status
+        timestamp = log_timestamp()
+        formatted_message = "\n".join(f"[{timestamp}] {line}" for line in message.split("\n"))
+        self.pending.append((text_edit, formatted_message, message.rsplit("\n", 1)[-1], status_label))
+        
+        # The flag is cleared before a flush drains the buffer, so a message appended
+        # after it was cleared always schedules another flush. At worst two threads both
+        # schedule one, and the second flush finds nothing to do
+        if not self.flush_scheduled:
+            self.flush_scheduled = True
+            # Queue the timer start to the main thread
+            QApplication.instance().postEvent(self, LogEvent(self.flush_timer.start))
     
     def log_discovery(self, message, text_edit, status_label=None):
         """
@@ -65,17 +186,13 @@ class ThreadSafeLogger(QObject):
         
         Args:
             message (str): Message to log
-            text_edit (QTextEdit): Text edit widget to update
+            text_edit (QPlainTextEdit): Text edit widget to update
             status_label (QLabel, optional): Status label to update
         """
-        with QMutexLocker(self.mutex):
-            # Queue this operation to the main thread
-            QApplication.instance().postEvent(
-                self,
-                LogEvent(lambda: self._update_log(text_edit, message, status_label))
-            )
-            # Also print to console as a backup
-            print(f"DISCOVERY: {message}")
+        self._queue_message(message, text_edit, status_label)
+        # Also print to console as a backup when debugging
+        if self.VERBOSE:
+            print("DISCOVERY:", message)
     
     def log_spotify(self, message, text_edit, status_label=None):
         """
@@ -83,17 +200,13 @@ class ThreadSafeLogger(QObject):
         
         Args:
             message (str): Message to log
-            text_edit (QTextEdit): Text edit widget to update
+            text_edit (QPlainTextEdit): Text edit widget to update
             status_label (QLabel, optional): Status label to update
         """
-        with QMutexLocker(self.mutex):
-            # Queue this operation to the main thread
-            QApplication.instance().postEvent(
-                self,
-                LogEvent(lambda: self._update_log(text_edit, message, status_label))
-            )
-            # Also print to console as a backup
-            print(f"SPOTIFY: {message}")
+        self._queue_message(message, text_edit, status_label)
+        # Also print to console as a backup when debugging
+        if self.VERBOSE:
+            print("SPOTIFY:", message)
     
     def log_debug(self, message, text_edit):
         """
@@ -101,45 +214,61 @@ class ThreadSafeLogger(QObject):
         
         Args:
             message (str): Message to log
-            text_edit (QTextEdit): Text edit widget to update
+            text_edit (QPlainTextEdit): Text edit widget to update
         """
-        with QMutexLocker(self.mutex):
-            # Queue this operation to the main thread
-            QApplication.instance().postEvent(
-                self,
-                LogEvent(lambda: self._update_log(text_edit, message))
-            )
-            # Always print to console
-            print(f"DEBUG: {message}")
+        self._queue_message(message, text_edit)
+        # Also print to console as a backup when debugging
+        if self.VERBOSE:
+            print("DEBUG:", message)
     
-    def _update_log(self, text_edit, message, status_label=None):
+    def _flush_logs(self):
+        """Write all buffered messages to their widgets, one append per widget."""
+        self.flush_scheduled = False
+        batch = []
+        while self.pending:
+            batch.append(self.pending.popleft())
+        
+        # Group by widget, keeping message order and the latest message per status label
+        widget_lines = {}
+        latest_status = {}
+        for text_edit, formatted_message, message, status_label in batch:
+            widget_lines.setdefault(text_edit, []).append(formatted_message)
+            if status_label:
+                latest_status[status_label] = message
+        
+        for text_edit, lines in widget_lines.items():
+            self._update_log(text_edit, "\n".join(lines))
+        
+        # Update status labels if a window has provided its truncate_status method
+        if latest_status and self.truncate_status_fn is not None:
+            for status_label, message in latest_status.items():
+                try:
+                    status_label.setText(self.truncate_status_fn(message))
+                except Exception as e:
+                    print(f"Error updating status label: {e} - Message was: {message}")
+    
+    def _update_log(self, text_edit, text):
         """
-        Update log text edit with the message.
+        Append a block of already timestamped lines to a log text edit.
         
         Args:
-            text_edit (QTextEdit): Text edit widget to update
-            message (str): Message to log
-            status_label (QLabel, optional): Status label to update
+            text_edit (QPlainTextEdit): Text edit widget to update
+            text (str): Lines to append, separated by newlines
         """
         try:
             if text_edit and not text_edit.isHidden():
-                # Add timestamp
-                timestamp = time.strftime("%H:%M:%S", time.localtime())
-                formatted_message = f"[{timestamp}] {message}"
-                
-                # Append message directly
-                text_edit.append(formatted_message)
+                # Suspend repaints so the whole block lays out and paints once
+                text_edit.setUpdatesEnabled(False)
+                try:
+                    text_edit.appendPlainText(text)
+                finally:
+                    text_edit.setUpdatesEnabled(True)
                 
                 # Ensure latest message is visible
                 text_edit.ensureCursorVisible()
-                
-                # Update status label if provided and has truncate_status method
-                if status_label and hasattr(self.parent(), 'truncate_status'):
-                    truncated = self.parent().truncate_status(message)
-                    status_label.setText(truncated)
         except Exception as e:
             # Print any errors to console
-            print(f"Error in _update_log: {e} - Message was: {message}")
+            print(f"Error in _update_log: {e} - Message was: {text}")
 
 
 # Custom event for handling logging operations
@@ -163,10 +292,30 @@ class LogEvent(QEvent):
 class ColourProgressBar(QProgressBar):
     """Progress bar with color transitions based on progress percentage."""
     
+    # Define colors for each 10% segment
+    SEGMENT_COLOURS = [
+        "#8B2E2E",    # Deep red (0-10%)
+        "#AB4F2C",    # Dark reddish-orange (10-20%)
+        "#C16E2A",    # Reddish-orange (20-30%)
+        "#D98D28",    # Burnt orange (30-40%)
+        "#E6A426",    # Dark yellow-orange (40-50%)
+        "#EDBA24",    # Yellow-orange (50-60%)
+        "#C4D122",    # Olive yellow (60-70%)
+        "#8AC425",    # Yellow-green (70-80%)
+        "#45B927",    # Bright green (80-90%)
+        "#1DB954"     # Spotify green (90-100%)
+    ]
+    
     def __init__(self, parent=None):
         """Initialize the colored progress bar."""
         super().__init__(parent)
         self.setMinimumHeight(25)
+        
+        # Only ten stylesheets are possible, so build them once; setValue only applies
+        # one when the colour segment changes, sparing Qt a CSS re-parse on every tick
+        self.segment_stylesheets = [self.build_stylesheet(colour) for colour in self.SEGMENT_COLOURS]
+        self.style_index = None  # Segment whose stylesheet is currently applied
+        
         # Initialize with empty/gray styling
         self.setStyleSheet("""
             QProgressBar {
@@ -186,42 +335,24 @@ class ColourProgressBar(QProgressBar):
             }
         """)
         self.setValue(0)  # Explicitly set initial value
-        
-    def updateStyleSheet(self, value):
+    
+    @staticmethod
+    def build_stylesheet(current_color):
         """
-        Update the progress bar stylesheet to show individual colored chunks
-        based on their position in the progress bar. Each chunk gets the color
-        corresponding to its position in the overall progress range.
+        Build the stylesheet for one colour segment.
         
         Args:
-            value (int): Progress value (0-100)
+            current_color (str): Colour for the progress chunks
+            
+        Returns:
+            str: Stylesheet for the progress bar
         """
         progress_bg = "#282828"        # Dark background
         border_color = "#333333"       # Border color
         
-        # Define colors for each 10% segment
-        colors = [
-            "#8B2E2E",    # Deep red (0-10%)
-            "#AB4F2C",    # Dark reddish-orange (10-20%)
-            "#C16E2A",    # Reddish-orange (20-30%)
-            "#D98D28",    # Burnt orange (30-40%)
-            "#E6A426",    # Dark yellow-orange (40-50%)
-            "#EDBA24",    # Yellow-orange (50-60%)
-            "#C4D122",    # Olive yellow (60-70%)
-            "#8AC425",    # Yellow-green (70-80%)
-            "#45B927",    # Bright green (80-90%)
-            "#1DB954"     # Spotify green (90-100%)
-        ]
-        
-        # Get current color index based on progress
-        color_index = min(int(value / 10), 9)
-        
-        # Set the color for new chunks (most recent in progress)
-        current_color = colors[color_index]
-        
         # Set alternating color pattern to create visual separation between chunks
         # This creates a slightly varied pattern for the chunks
-        self.setStyleSheet(f"""
+        return f"""
             QProgressBar {{
                 border: 1px solid {border_color};
                 border-radius: 5px;
@@ -238,7 +369,36 @@ class ColourProgressBar(QProgressBar):
                 margin: 0.5px;
                 border-radius: 2px;
             }}
-        """)
+        """
+    
+    def setStyleSheet(self, stylesheet):
+        """
+        Apply a stylesheet, forgetting which segment stylesheet was applied.
+        
+        Args:
+            stylesheet (str): Stylesheet to apply
+        """
+        self.style_index = None
+        super().setStyleSheet(stylesheet)
+        
+    def updateStyleSheet(self, value):
+        """
+        Update the progress bar stylesheet to show individual colored chunks
+        based on their position in the progress bar. Each chunk gets the color
+        corresponding to its position in the overall progress range.
+        
+        Args:
+            value (int): Progress value (0-100)
+        """
+        # Get current color index based on progress
+        color_index = min(int(value / 10), 9)
+        
+        # Nothing to do while we stay within the same segment
+        if color_index == self.style_index:
+            return
+        
+        super().setStyleSheet(self.segment_stylesheets[color_index])
+        self.style_index = color_index
         
     def setValue(self, value):
         """
@@ -251,14 +411,11 @@ class ColourProgressBar(QProgressBar):
         if isinstance(value, float):
             value = int(value)
         
-        # Force a repaint at the correct value
+        # Switch colour segment if needed
         self.updateStyleSheet(value)
         
-        # Call the parent implementation to update the actual value
+        # Call the parent implementation to update the actual value (which repaints)
         super().setValue(value)
-        
-        # Force an update to ensure the UI reflects the change
-        self.update()
 
 
 # Add this class to your spotifylauncher.py file, before the SpotifyLauncher class
@@ -276,15 +433,27 @@ class ToggleSwitch(QCheckBox):
         # Remove text
         self.setText("")
         
-        # Set animation details
+        # Set animation details - one animation is reused for every state change
         self.animation_duration = 120
-        self.animation = None
+        self.animation = QPropertyAnimation(self, b"thumb_position")
+        self.animation.setDuration(self.animation_duration)
+        self.animation.setEasingCurve(QEasingCurve.InOutExpo)
         
         # Track state for custom drawing
         self._enabled = False
         self._margin = 2
         self._thumb_position = 0  # 0 for off, 1 for on (will be animated)
         
+        # The size is fixed, so build the track path and thumb geometry once
+        # rather than on every repaint of the animation
+        width, height = self.width(), self.height()
+        self._track_path = QPainterPath()
+        self._track_path.addRoundedRect(QRectF(0, 0, width, height), height / 2, height / 2)
+        self._thumb_radius = (height - 2 * self._margin) / 2
+        self._thumb_x_min = self._margin
+        self._thumb_x_max = width - self._margin - 2 * self._thumb_radius
+        self._thumb_y = height / 2
+        
         # Colors
         self.track_color_off = QColor("#4c4c4c")
         self.track_color_on = QColor("#1DB954")  # Spotify green
@@ -305,16 +474,11 @@ class ToggleSwitch(QCheckBox):
         """Handle state changes and trigger animation."""
         self._enabled = state == Qt.Checked
         
-        # Clean up existing animation
-        if self.animation and self.animation.state() == self.animation.Running:
-            self.animation.stop()
-        
-        # Create and start animation
-        self.animation = QPropertyAnimation(self, b"thumb_position")
-        self.animation.setDuration(self.animation_duration)
-        self.animation.setStartValue(0 if not self._enabled else 1)
-        self.animation.setEndValue(1 if self._enabled else 0)
-        self.animation.setEasingCurve(QEasingCurve.InOutExpo)
+        # Restart the animation from wherever the thumb is now, so toggling
+        # mid-animation reverses smoothly
+        self.animation.stop()
+        self.animation.setStartValue(float(self._thumb_position))
+        self.animation.setEndValue(1.0 if self._enabled else 0.0)
         self.animation.start()
     
     def get_thumb_position(self):
@@ -334,34 +498,25 @@ class ToggleSwitch(QCheckBox):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
-        # Calculate rect and radius
-        rect = self.rect()
-        thumb_radius = (rect.height() - 2 * self._margin) / 2
-        track_radius = rect.height() / 2
-        
-        # Calculate thumb position
-        thumb_x = self._margin + self._thumb_position * (rect.width() - 2 * self._margin - 2 * thumb_radius)
+        # Calculate thumb position between its precomputed end points
+        thumb_x = self._thumb_x_min + self._thumb_position * (self._thumb_x_max - self._thumb_x_min)
         
         # Draw the track with appropriate color based on state and animation
         if self._enabled:
             track_color = self.track_color_on
         else:
             track_color = self.track_color_off
-            
-        # Create track path
-        track_path = QPainterPath()
-        track_path.addRoundedRect(QRectF(0, 0, rect.width(), rect.height()), track_radius, track_radius)
         
-        # Fill track
-        painter.fillPath(track_path, track_color)
+        # Fill the cached track path
+        painter.fillPath(self._track_path, track_color)
         
         # Draw thumb
         painter.setPen(Qt.NoPen)
         painter.setBrush(self.thumb_color)
         painter.drawEllipse(
-            QPointF(thumb_x + thumb_radius, rect.height() / 2),
-            thumb_radius,
-            thumb_radius
+            QPointF(thumb_x + self._thumb_radius, self._thumb_y),
+            self._thumb_radius,
+            self._thumb_radius
         )
 
 
@@ -370,8 +525,46 @@ class ScriptWorker(QThread):
     
     update_progress = pyqtSignal(int, str)  # Progress value, status message
     script_finished = pyqtSignal(bool)  # Success/failure
-    output_text = pyqtSignal(str)  # Output text for debug log
-    console_output = pyqtSignal(str)  # Console output for display
+    output_text = pyqtSignal(str)  # Output text for the debug log and the script's output tab
+    
+    VERBOSE = False  # Also echo every output line to the console; follows the debug tab toggle
+    PROGRESS_EMIT_INTERVAL = 0.033  # Minimum seconds between routine progress updates (~30 per second)
+    
+    # Line patterns used by update_progress_from_line, compiled once for all workers
+    LINE_PATTERNS = {
+        # Phase 1 reaching 100%
+        'progress_100': re.compile(r'Progress: 100(?:\.0+)?% \((\d+)/(\d+)'),
+        # Compilation album progress: (N/M compilation albums)
+        'compilation_progress': re.compile(r'Progress: (\d+(?:\.\d+)?)% \((\d+)/(\d+) compilation albums\)'),
+        # Any percentage progress line
+        'generic_progress': re.compile(r'Progress: (\d+\.\d+)%'),
+        # Genre progress: Processing: X% (Y/Z genres)
+        'genre_progress': re.compile(r'Processing: (\d+)% \((\d+)/(\d+) genres\)'),
+        # Total artists to process in the Spotify client
+        'total_artists': re.compile(r'JSON file contains (\d+) total unique artists to process'),
+        # Artist count found in FLAC files
+        'flac_artists': re.compile(r'Found (\d+) unique artists in (\d+) valid FLAC files'),
+        # Detailed artist progress
+        'artist_progress': re.compile(r'Progress: (\d+\.\d+)% \((\d+)/(\d+) artists\)'),
+        # Artist directory counting
+        'artist_directories': re.compile(r'Found (\d+) artist directories with (\d+) potential album directories'),
+        # Additional artists found in metadata
+        'additional_artists': re.compile(r'Processing (\d+) additional artists'),
+    }
+
+    # Messages that indicate completed artist processing - one case-insensitive search
+    # instead of lowercasing every line and scanning it once per phrase
+    PHASE1_COMPLETE_PATTERN = re.compile(
+        r'finished processing all artists|primary artists phase complete|completed primary artist discovery|'
+        r'phase 1 complete|artist processing complete|processed all artists successfully',
+        re.IGNORECASE
+    )
+    
+    # Every line update_progress_from_line acts on (besides the phase 1 completion phrases)
+    # contains one of these, so other lines are rejected with plain substring checks
+    PROGRESS_KEYWORDS = ('Progress', 'Processing', 'PROCESSING', 'Found', 'JSON file contains',
+                         'Scanning music library', 'Saving recommendations', 'Music discovery complete')
+    MIN_PROGRESS_LINE_LENGTH = 14  # Shortest line any of them can match ("Progress: 1.0%")
 
     def __init__(self, script_path, script_name):
         """
@@ -387,11 +580,19 @@ class ScriptWorker(QThread):
         self.process = None
         self.running = False
         self.start_time = None
-        self.current_value = 0
+        self.current_value = 0  # Current progress value
         self.total_value = 100
         self.total_artists = 0
         self.processed_artists = 0
+        self.original_total_artists = 0  # Total artists reported initially
+        self.max_artist_count = 0  # Maximum artist count seen
+        self.various_artists_phase = False  # Track if we're in various artists phase
         self.extra_args = []  # Additional command line arguments
+        self.last_progress_emit = 0.0  # Monotonic time of the last progress update
+        self.last_progress_sent = (-1, "")  # Last (value, status) emitted, to drop exact repeats
+        self.batching_progress = False  # True while a chunk of output is being parsed
+        self.pending_progress = None  # Latest routine progress update not yet emitted
+        self.progress_timer = None  # Sends a held-back update once the interval is up
         
         # Add these variables for cumulative genre tracking
         self.total_genres = 0
@@ -405,46 +606,17 @@ class ScriptWorker(QThread):
         # Log the initialization
         print(f"Initializing {script_name} worker for: {script_path}")
         
-        # Progress tracking patterns - add patterns for genre processing
-        self.progress_patterns = [
-            # For ProgressBar updates (match percentage complete)
-            re.compile(r'Progress.*?(\d+\.\d+)%'),
-            # Look for "x/y artists" patterns to extract progress
-            re.compile(r'Processed: (\d+)/(\d+) artists'),
-            # Spotify playlist creation progress
-            re.compile(r'Creating playlist \'(.+?)\' with (\d+) tracks'),
-            # MusicBrainz related progress - detect starting to process an artist
-            re.compile(r'=== PROCESSING: (.+?) ==='),
-            # Progress bar with percentage
-            re.compile(r'Progress: \|.+?\| (\d+\.\d+)% Complete'),
-            # Genre progress pattern
-            re.compile(r'Processing: (\d+)% \((\d+)/(\d+) genres\)'),
-            # Processing genre with X artists
-            re.compile(r'Processing genre: (.+?) with (\d+) artists'),
-            # Processing up to X artists for genre
-            re.compile(r'Processing up to (\d+) artists for genre: (.+)'),
-            # Added tracks from artist X/Y
-            re.compile(r'Added .+ track\(s\) from .+ \((\d+)/(\d+)\)')
-        ]
-        
-        # Additional markers for music discovery script
-        self.music_discovery_patterns = [
-            re.compile(r'Found (\d+) unique artists'),
-            re.compile(r'Finished processing .+ in \d+\.\d+ seconds'),
-            re.compile(r'Total source artists with recommendations: (\d+)'),
-            re.compile(r'Music discovery complete!')
-        ]
-
     # Helper method to safely emit signals for output
     def safe_emit_output(self, message):
         """Safely emit output signals with proper error handling."""
         try:
-            # Always print to console first
-            print(f"WORKER: {message}")
+            # Print to console first when debugging
+            if self.VERBOSE:
+                print("WORKER:", message)
             
-            # Emit signals - these will be connected with Qt.QueuedConnection
+            # One signal feeds both the debug log and the output tab, so each chunk
+            # crosses to the main thread once
             self.output_text.emit(message)
-            self.console_output.emit(message)
         except Exception as e:
             print(f"Error emitting output: {e} - Message was: {message}")
 
@@ -458,31 +630,13 @@ class ScriptWorker(QThread):
         Returns:
             str: Path to Python executable or "python" if not found
         """
-        # Try to locate virtual environment in the script directory
-        if os.name == 'nt':  # Windows
-            venv_paths = [
-                os.path.join(script_dir, 'venv', 'Scripts', 'python.exe'),
-                os.path.join(script_dir, '.venv', 'Scripts', 'python.exe'),
-                os.path.join(script_dir, 'env', 'Scripts', 'python.exe'),
-                os.path.join(script_dir, '.env', 'Scripts', 'python.exe')
-            ]
-        else:  # Linux/Mac
-            venv_paths = [
-                os.path.join(script_dir, 'venv', 'bin', 'python'),
-                os.path.join(script_dir, '.venv', 'bin', 'python'),
-                os.path.join(script_dir, 'env', 'bin', 'python'),
-                os.path.join(script_dir, '.env', 'bin', 'python')
-            ]
-            
-        # Check each possible venv path
-        for path in venv_paths:
-            if os.path.exists(path):
-                self.safe_emit_output(f"Found virtual environment Python at: {path}")
-                return path
-                
-        # If no venv found, use system Python
-        self.safe_emit_output("No virtual environment found, using system Python")
-        return "python"
+        python_exe = locate_venv_python(script_dir)
+        if python_exe != "python":
+            self.safe_emit_output(f"Found virtual environment Python at: {python_exe}")
+        else:
+            # If no venv found, use system Python
+            self.safe_emit_output("No virtual environment found, using system Python")
+        return python_exe
 
     def run(self):
         """Run the script in a separate thread with non-blocking I/O handling."""
@@ -507,125 +661,64 @@ class ScriptWorker(QThread):
             cwd_msg = f"Working directory: {script_dir}"
             self.safe_emit_output(cwd_msg)
             
-            # Set up startupinfo to hide console window (Windows only)
-            startupinfo = None
-            creationflags = 0
-            if os.name == 'nt':  # Windows
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                startupinfo.wShowWindow = 0  # SW_HIDE
-                creationflags = subprocess.CREATE_NO_WINDOW
+            # QProcess delivers output through readyRead signals, so this thread's own
+            # event loop does all the I/O - no reader threads or polling. On Windows it
+            # already starts the child without a console window when we have none.
+            # The process belongs to this thread; stop() reaches it via queued calls.
+            self.process = QProcess()
+            self.process.setWorkingDirectory(script_dir)
+            stdout_buffer = bytearray()
+            stderr_buffer = bytearray()
+            
+            # Lambdas (not bound methods) so the slots run here rather than being queued
+            # to the thread that owns this QThread object
+            self.process.readyReadStandardOutput.connect(
+                lambda: self.handle_output(self.process.readAllStandardOutput(), stdout_buffer, self.handle_stdout_lines)
+            )
+            self.process.readyReadStandardError.connect(
+                lambda: self.handle_output(self.process.readAllStandardError(), stderr_buffer, self.handle_stderr_lines)
+            )
+            
+            # Progress updates that arrive too close together are coalesced; this timer,
+            # also running on this thread's event loop, sends the latest one when due
+            self.progress_timer = QTimer()
+            self.progress_timer.setSingleShot(True)
+            self.progress_timer.timeout.connect(lambda: self.flush_progress(force=True))
             
-            # Prepare queues for thread-safe communication
-            stdout_queue = queue.Queue()
-            stderr_queue = queue.Queue()
+            event_loop = QEventLoop()
+            self.process.finished.connect(event_loop.quit)
             
             # Start the process with explicit error handling
-            try:
-                # Start the process
-                self.process = subprocess.Popen(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    encoding='utf-8',
-                    errors='replace',
-                    bufsize=1,  # Line buffered
-                    cwd=script_dir,
-                    startupinfo=startupinfo,
-                    creationflags=creationflags
-                )
-                self.safe_emit_output(f"Process started with PID: {self.process.pid}")
-            except Exception as e:
-                error_msg = f"Failed to start process: {str(e)}"
+            self.process.start(python_exe, [self.script_path] + self.extra_args)
+            if not self.process.waitForStarted():
+                error_msg = f"Failed to start process: {self.process.errorString()}"
                 self.safe_emit_output(error_msg)
                 self.running = False
                 self.script_finished.emit(False)
                 return
-
-            # Thread for reading stdout
-            def enqueue_stdout():
-                try:
-                    for line in iter(self.process.stdout.readline, ''):
-                        if line.strip():  # Only queue non-empty lines
-                            stdout_queue.put(line.strip())
-                    self.process.stdout.close()
-                except Exception as e:
-                    stdout_queue.put(f"STDOUT Error: {e}")
-
-            # Thread for reading stderr
-            def enqueue_stderr():
-                try:
-                    for line in iter(self.process.stderr.readline, ''):
-                        if line.strip():  # Only queue non-empty lines
-                            stderr_queue.put(line.strip())
-                    self.process.stderr.close()
-                except Exception as e:
-                    stderr_queue.put(f"STDERR Error: {e}")
-
-            # Create and start reader threads
-            stdout_thread = threading.Thread(target=enqueue_stdout)
-            stderr_thread = threading.Thread(target=enqueue_stderr)
-            
-            stdout_thread.daemon = True
-            stderr_thread.daemon = True
+            self.safe_emit_output(f"Process started with PID: {self.process.processId()}")
             
-            stdout_thread.start()
-            stderr_thread.start()
+            # Run until the process exits (stop() terminates it)
+            if self.process.state() != QProcess.NotRunning:
+                event_loop.exec_()
             
-            # Initial delay to ensure process has started
-            time.sleep(0.2)
-            
-            # Check if process immediately failed
-            if self.process.poll() is not None:
-                self.safe_emit_output(f"Process exited immediately with code: {self.process.returncode}")
-                self.running = False
-                self.script_finished.emit(False)
-                return
-            
-            # Monitor and process output
-            while self.running and self.process.poll() is None:
-                # Process stdout
-                try:
-                    while not stdout_queue.empty():
-                        line = stdout_queue.get_nowait()
-                        if line:
-                            self.safe_emit_output(line)
-                            self.update_progress_from_line(line)
-                except queue.Empty:
-                    pass
-                
-                # Process stderr
-                try:
-                    while not stderr_queue.empty():
-                        line = stderr_queue.get_nowait()
-                        if line:
-                            error_msg = f"ERROR: {line}"
-                            self.safe_emit_output(error_msg)
-                except queue.Empty:
-                    pass
-                
-                # Prevent tight loop
-                time.sleep(0.1)
-            
-            # Wait for threads to finish
-            stdout_thread.join(timeout=2.0)
-            stderr_thread.join(timeout=2.0)
-            
-            # Get return code
-            return_code = self.process.poll() or 0
-            
-            # Final processing of any remaining output
-            while not stdout_queue.empty():
-                line = stdout_queue.get()
+            # Handle output that arrived with the exit, plus any unterminated last lines
+            self.handle_output(self.process.readAllStandardOutput(), stdout_buffer, self.handle_stdout_lines)
+            self.handle_output(self.process.readAllStandardError(), stderr_buffer, self.handle_stderr_lines)
+            for buffer, handler in ((stdout_buffer, self.handle_stdout_lines), (stderr_buffer, self.handle_stderr_lines)):
+                line = buffer.decode('utf-8', errors='replace').strip()
                 if line:
-                    self.safe_emit_output(line)
+                    handler([line])
             
-            while not stderr_queue.empty():
-                line = stderr_queue.get()
-                if line:
-                    error_msg = f"ERROR: {line}"
-                    self.safe_emit_output(error_msg)
+            # Make sure the final progress update isn't left waiting on the timer
+            self.flush_progress(force=True)
+            self.progress_timer.stop()
+            
+            # A crash (including being killed) counts as a failure whatever the exit code
+            if self.process.exitStatus() == QProcess.CrashExit:
+                return_code = -1
+            else:
+                return_code = self.process.exitCode()
             
             # Log completion status
             finish_msg = f"Process finished with return code: {return_code}"
@@ -642,6 +735,126 @@ class ScriptWorker(QThread):
         finally:
             self.running = False
 
+    def handle_output(self, data, buffer, line_handler):
+        """
+        Split newly read process output into complete lines and handle each one.
+        
+        Args:
+            data (QByteArray): Bytes just read from the process
+            buffer (bytearray): Carry-over of any incomplete line from the previous read
+            line_handler (callable): Called once with the list of non-empty, stripped lines
+        """
+        buffer.extend(bytes(data))
+        *raw_lines, remainder = buffer.split(b'\n')
+        buffer[:] = remainder
+        
+        lines = [raw_line.decode('utf-8', errors='replace').strip() for raw_line in raw_lines]
+        lines = [line for line in lines if line]  # Only handle non-empty lines
+        if lines:
+            line_handler(lines)
+
+    def handle_stdout_lines(self, lines):
+        """
+        Emit a chunk of script output and update progress from each of its lines.
+        
+        The chunk goes out as one output signal, and routine progress updates are
+        held back until the whole chunk is parsed so only the latest one is emitted.
+        
+        Args:
+            lines (list): Complete lines read in one go from the script's stdout
+        """
+        self.safe_emit_output("\n".join(lines))
+        
+        self.batching_progress = True
+        try:
+            for line in lines:
+                self.update_progress_from_line(line)
+        finally:
+            self.batching_progress = False
+            self.flush_progress()
+
+    def handle_stderr_lines(self, lines):
+        """Emit a chunk of script error output."""
+        self.safe_emit_output("\n".join(f"ERROR: {line}" for line in lines))
+
+    def emit_progress(self, value: int, status: str):
+        """
+        Queue a routine progress update, coalesced to at most one per PROGRESS_EMIT_INTERVAL.
+        
+        Only the latest update is kept: when several arrive within one interval (or
+        within one chunk of output), the UI gets the newest value and status once,
+        rather than repainting for changes nobody could see. Updates reaching 0% or
+        100% are sent straight away, so a later update can never replace them.
+        
+        Args:
+            value (int): Progress value (0-100)
+            status (str): Status message
+        """
+        if value in (0, 100):
+            self.emit_progress_now(value, status)
+            return
+        
+        self.pending_progress = (value, status)
+        
+        # While a chunk is being parsed, wait until its last line has been seen
+        if not self.batching_progress:
+            self.flush_progress()
+
+    def emit_progress_now(self, value: int, status: str):
+        """
+        Emit a progress update immediately, e.g. for a phase transition.
+        
+        Any routine update still held back goes out first so the UI still sees the
+        updates in the order the script produced them.
+        
+        Args:
+            value (int): Progress value (0-100, or -1 for status only)
+            status (str): Status message
+        """
+        self.flush_progress(force=True)
+        self.send_progress(value, status)
+
+    def flush_progress(self, force: bool = False):
+        """
+        Emit the routine progress update held back, if any.
+        
+        Unless forced, an update arriving too soon after the previous one is left
+        pending, and the progress timer sends it once the interval is up - or a newer
+        update replaces it first.
+        
+        Args:
+            force (bool): Emit even if the interval since the last update hasn't passed
+        """
+        if self.pending_progress is None:
+            return
+        
+        now = time.monotonic()
+        remaining = self.PROGRESS_EMIT_INTERVAL - (now - self.last_progress_emit)
+        if not force and remaining > 0:
+            if self.progress_timer is not None and not self.progress_timer.isActive():
+                self.progress_timer.start(max(1, int(remaining * 1000)))
+            return
+        
+        value, status = self.pending_progress
+        self.pending_progress = None
+        if self.progress_timer is not None:
+            self.progress_timer.stop()
+        self.send_progress(value, status)
+
+    def send_progress(self, value: int, status: str):
+        """
+        Emit a progress update unless it repeats the last one exactly.
+        
+        Args:
+            value (int): Progress value (0-100, or -1 for status only)
+            status (str): Status message
+        """
+        if (value, status) == self.last_progress_sent:
+            return
+        self.last_progress_sent = (value, status)
+        self.last_progress_emit = time.monotonic()
+        self.update_progress.emit(value, status)
+
     def update_progress_from_line(self, line: str) -> bool:
         """
         Extract progress information from log lines with improved status messaging.
@@ -653,26 +866,33 @@ class ScriptWorker(QThread):
             bool: True if progress was updated, False otherwise
         """
         try:
-            # Initialize tracking variables if not already done
-            if not hasattr(self, 'original_total_artists'):
-                self.original_total_artists = 0  # Total artists reported initially
-                self.max_artist_count = 0  # Maximum artist count seen
-                self.current_value = 0  # Current progress value
-                self.various_artists_phase = False  # Track if we're in various artists phase
+            # Most output lines carry no progress information - reject them before any
+            # regex work. Only the phase 1 completion phrases can matter without a keyword.
+            # Each pattern below is likewise only searched when its literal text is present.
+            if len(line) < self.MIN_PROGRESS_LINE_LENGTH:
+                return False
+            if (not any(keyword in line for keyword in self.PROGRESS_KEYWORDS)
+                    and (self.various_artists_phase or not self.PHASE1_COMPLETE_PATTERN.search(line))):
+                return False
+            
+            # Bind the methods and patterns used below once, rather than looking them
+            # up on self for every check
+            emit, emit_now, log = self.emit_progress, self.emit_progress_now, self.safe_emit_output
+            patterns = self.LINE_PATTERNS
             
             # VERY EXPLICIT progress reset for various artists processing
             if "RESET_PROGRESS_BAR_NOW" in line and "VARIOUS_ARTISTS_PROCESSING" in line:
-                self.safe_emit_output("EXPLICIT PROGRESS RESET DETECTED - Resetting for Various Artists Processing")
+                log("EXPLICIT PROGRESS RESET DETECTED - Resetting for Various Artists Processing")
                 
                 # Send a strong signal to the UI to reset everything for phase 2
                 # We need to send 100% to first bar to ensure it shows as complete
-                self.update_progress.emit(100, "Primary Artists Discovery Complete")
+                emit_now(100, "Primary Artists Discovery Complete")
                 
                 # Small delay to allow UI to update the first progress bar
                 time.sleep(0.1)
                 
                 # Now send the signal to start the second phase
-                self.update_progress.emit(0, "Starting Various Artists Processing")
+                emit_now(0, "Starting Various Artists Processing")
                 
                 # Set the phase flag
                 self.various_artists_phase = True
@@ -691,27 +911,20 @@ class ScriptWorker(QThread):
             completed_phase1 = False
             
             # Check for messages that indicate completed artist processing
-            if not self.various_artists_phase and any(phrase in line.lower() for phrase in [
-                "finished processing all artists",
-                "primary artists phase complete",
-                "completed primary artist discovery",
-                "phase 1 complete",
-                "artist processing complete",
-                "processed all artists successfully"
-            ]):
+            if not self.various_artists_phase and self.PHASE1_COMPLETE_PATTERN.search(line):
                 completed_phase1 = True
-                self.safe_emit_output("Detected phase 1 completion message - Transitioning to Various Artists phase")
+                log("Detected phase 1 completion message - Transitioning to Various Artists phase")
             
             # Check for 100% progress report in phase 1
-            progress_100_match = re.search(r'Progress: 100(?:\.0+)?% \((\d+)/(\d+)', line)
+            progress_100_match = patterns['progress_100'].search(line) if "Progress: 100" in line else None
             if not self.various_artists_phase and progress_100_match:
                 completed_phase1 = True
-                self.safe_emit_output("Detected 100% progress in phase 1 - Transitioning to Various Artists phase")
+                log("Detected 100% progress in phase 1 - Transitioning to Various Artists phase")
             
             # If we detected phase 1 completion, transition to phase 2
             if completed_phase1:
                 # Send completion signal for phase 1
-                self.update_progress.emit(100, "Primary Artists Discovery Complete")
+                emit_now(100, "Primary Artists Discovery Complete")
                 
                 # Small delay to allow UI to update
                 time.sleep(0.1)
@@ -721,22 +934,22 @@ class ScriptWorker(QThread):
                 self.current_value = 0
                 
                 # Signal the start of various artists phase
-                self.update_progress.emit(0, "Starting Various Artists Processing")
+                emit_now(0, "Starting Various Artists Processing")
                 return True
                 
             # Reset counter for compilation album processing
             if "Progress: 0% (0/" in line and "compilation albums)" in line:
                 # This reinforces the reset and specifically sets the status text to remove any previous artist reference
-                self.update_progress.emit(0, "Processing compilation albums")
+                emit_now(0, "Processing compilation albums")
                 return True
                 
             # Compilation album progress pattern: (N/M compilation albums)
-            compilation_progress_match = re.search(r'Progress: (\d+(?:\.\d+)?)% \((\d+)/(\d+) compilation albums\)', line)
+            compilation_progress_match = patterns['compilation_progress'].search(line) if "compilation albums)" in line else None
             if compilation_progress_match:
                 # If we're not yet in various artists phase, switch to it
                 if not self.various_artists_phase:
-                    self.safe_emit_output("Detected compilation album processing - Transitioning to Various Artists phase")
-                    self.update_progress.emit(100, "Primary Artists Discovery Complete")
+                    log("Detected compilation album processing - Transitioning to Various Artists phase")
+                    emit_now(100, "Primary Artists Discovery Complete")
                     time.sleep(0.1)
                     self.various_artists_phase = True
                     
@@ -746,7 +959,7 @@ class ScriptWorker(QThread):
                 
                 # Set progress value and explicitly update status text to show compilation album progress
                 int_percentage = int(percentage)
-                self.update_progress.emit(int_percentage, f"Processing compilation album {current} of {total}")
+                emit(int_percentage, f"Processing compilation album {current} of {total}")
                 self.current_value = int_percentage
                 return True
 
@@ -754,26 +967,27 @@ class ScriptWorker(QThread):
             if "Processing compilation album:" in line:
                 # If we're not yet in various artists phase, switch to it
                 if not self.various_artists_phase:
-                    self.safe_emit_output("Detected compilation album - Transitioning to Various Artists phase")
-                    self.update_progress.emit(100, "Primary Artists Discovery Complete")
+                    log("Detected compilation album - Transitioning to Various Artists phase")
+                    emit_now(100, "Primary Artists Discovery Complete")
                     time.sleep(0.1)
                     self.various_artists_phase = True
                     
-                album_match = re.search(r'Processing compilation album: (.+)', line)
-                if album_match:
-                    album_name = album_match.group(1)
+                # The album name is everything after the fixed prefix
+                album_name = line.partition("Processing compilation album: ")[2]
+                if album_name:
                     # Update status text to show current album name
-                    self.update_progress.emit(-1, f"Processing compilation album: {album_name}")
+                    emit_now(-1, f"Processing compilation album: {album_name}")
                     return True
             
             # If we've detected we're in various artists phase, direct updates to the second progress bar
             if self.various_artists_phase:
                 # If we're in phase 2 but see a generic progress update, use it for the second bar
-                generic_progress_match = re.search(r'Progress: (\d+\.\d+)%', line)
-                if generic_progress_match and not compilation_progress_match:  # Make sure we didn't already match above
+                # (compilation progress has already returned above, so this is only the fallback)
+                generic_progress_match = patterns['generic_progress'].search(line) if "Progress: " in line else None
+                if generic_progress_match:
                     percentage = float(generic_progress_match.group(1))
                     int_percentage = min(int(percentage), 100)  # Cap at 100
-                    self.update_progress.emit(int_percentage, f"Various Artists: {int_percentage}% complete")
+                    emit(int_percentage, f"Various Artists: {int_percentage}% complete")
                     self.current_value = int_percentage
                     return True
                     
@@ -785,7 +999,7 @@ class ScriptWorker(QThread):
             # First, check for genre-related progress indicators
             
             # Check for genre progress pattern: Processing: X% (Y/Z genres)
-            genre_progress_match = re.search(r'Processing: (\d+)% \((\d+)/(\d+) genres\)', line)
+            genre_progress_match = patterns['genre_progress'].search(line) if "genres)" in line else None
             if genre_progress_match:
                 percentage = int(genre_progress_match.group(1))
                 current = int(genre_progress_match.group(2))
@@ -800,7 +1014,7 @@ class ScriptWorker(QThread):
                 
                 # For progress percentage, we'll use the overall genre percentage
                 # but we'll show both genre progress and cumulative artist progress in the status
-                self.update_progress.emit(
+                emit(
                     percentage, 
                     f"Genres: {current}/{total} ({percentage}%) - Artists: {self.processed_artists_in_genres}/{self.total_artists_in_genres}"
                 )
@@ -810,17 +1024,17 @@ class ScriptWorker(QThread):
             # First phase processing for primary artists
             
             # Check for total artists initialization
-            total_artists_match = re.search(r'JSON file contains (\d+) total unique artists to process', line)
+            total_artists_match = patterns['total_artists'].search(line) if "JSON file contains" in line else None
             if total_artists_match:
                 total = int(total_artists_match.group(1))
                 self.total_artists = total
                 self.original_total_artists = total
-                self.safe_emit_output(f"Initialized total artists to {total}")
-                self.update_progress.emit(0, f"Beginning to process {total} artists")
+                log(f"Initialized total artists to {total}")
+                emit_now(0, f"Beginning to process {total} artists")
                 return True
             
             # Store original artist count when found in FLAC files
-            flac_artists_match = re.search(r'Found (\d+) unique artists in (\d+) valid FLAC files', line)
+            flac_artists_match = patterns['flac_artists'].search(line) if "valid FLAC files" in line else None
             if flac_artists_match:
                 artists_count = int(flac_artists_match.group(1))
                 files_count = flac_artists_match.group(2)
@@ -829,13 +1043,13 @@ class ScriptWorker(QThread):
                 if self.original_total_artists == 0:
                     self.original_total_artists = artists_count
                     self.max_artist_count = artists_count
-                    self.safe_emit_output(f"Initial artist count: {artists_count}")
+                    log(f"Initial artist count: {artists_count}")
                 
-                self.update_progress.emit(5, f"Found {artists_count} artists in {files_count} files")
+                emit_now(5, f"Found {artists_count} artists in {files_count} files")
                 return True
             
             # Specifically look for progress lines with detailed format
-            progress_match = re.search(r'Progress: (\d+\.\d+)% \((\d+)/(\d+) artists\)', line)
+            progress_match = patterns['artist_progress'].search(line) if "artists)" in line else None
             if progress_match:
                 percentage = float(progress_match.group(1))
                 current = int(progress_match.group(2))
@@ -854,50 +1068,49 @@ class ScriptWorker(QThread):
                     status_text = f"Processing artist {current} of {self.max_artist_count}"
                     # Round percentage to integer and emit progress update
                     int_percentage = int(corrected_percentage)
-                    self.update_progress.emit(int_percentage, status_text)
+                    emit(int_percentage, status_text)
                 else:
                     # Regular case
                     int_percentage = int(percentage)
-                    self.update_progress.emit(int_percentage, f"Processing: {current}/{total} artists")
+                    emit(int_percentage, f"Processing: {current}/{total} artists")
                 
                 # Store current value for future comparisons
                 self.current_value = int(corrected_percentage)
                 
                 # If we've reached 100%, this might be the end of phase 1
                 if int_percentage >= 100:
-                    self.safe_emit_output("Primary artists phase reached 100% - Preparing for transition")
+                    log("Primary artists phase reached 100% - Preparing for transition")
                     # Don't trigger transition here, let the UI handle it
                 
                 return True
             
             # Detect scanning library
             if "Scanning music library in" in line:
-                dir_match = re.search(r'Scanning music library in (.+?)\.\.\.', line)
-                if dir_match:
-                    music_dir = dir_match.group(1)
-                    self.update_progress.emit(2, f"Scanning library in {music_dir}")
+                # The directory sits between the fixed prefix and the trailing "..."
+                music_dir, ellipsis, _ = line.partition("Scanning music library in ")[2].partition("...")
+                if ellipsis and music_dir:
+                    emit_now(2, f"Scanning library in {music_dir}")
                     return True
             
             # Track number of FLAC files
-            flac_files_match = re.search(r'Found (\d+) FLAC files to analyze', line)
-            if flac_files_match:
-                flac_count = flac_files_match.group(1)
-                self.update_progress.emit(3, f"Found {flac_count} FLAC files")
-                return True
+            if "FLAC files to analyze" in line:
+                flac_count = line.partition(" FLAC files to analyze")[0].rpartition("Found ")[2]
+                if flac_count.isdigit():
+                    emit_now(3, f"Found {flac_count} FLAC files")
+                    return True
             
             # Detect artist directory counting
             if "Found" in line and "artist directories with" in line:
-                dirs_match = re.search(r'Found (\d+) artist directories with (\d+) potential album directories', line)
+                dirs_match = patterns['artist_directories'].search(line)
                 if dirs_match:
                     artists = dirs_match.group(1)
                     albums = dirs_match.group(2)
-                    self.update_progress.emit(5, f"Found {artists} artists with {albums} albums")
+                    emit_now(5, f"Found {artists} artists with {albums} albums")
                     return True
             
-            # Detect processing a specific artist
-            artist_processing = re.search(r'=== PROCESSING: (.+?) ===', line)
-            if artist_processing:
-                artist_name = artist_processing.group(1)
+            # Detect processing a specific artist: "=== PROCESSING: <name> ==="
+            artist_name, marker_end, _ = line.partition("=== PROCESSING: ")[2].partition(" ===")
+            if marker_end and artist_name:
                 
                 # Track current artist number (auto-incremented)
                 if hasattr(self, 'current_artist_number'):
@@ -926,11 +1139,11 @@ class ScriptWorker(QThread):
                 
                 # Update with both the status text AND adjusted percentage
                 status_text = f"Processing artist: {artist_name} ({self.current_artist_number}/{self.max_artist_count})"
-                self.update_progress.emit(adjusted_percentage, status_text)
+                emit(adjusted_percentage, status_text)
                 return True
             
             # Additional processing: track if we're processing additional artists
-            additional_match = re.search(r'Processing (\d+) additional artists', line)
+            additional_match = patterns['additional_artists'].search(line) if "additional artists" in line else None
             if additional_match:
                 additional_count = int(additional_match.group(1))
                 total_processed = self.max_artist_count
@@ -941,26 +1154,27 @@ class ScriptWorker(QThread):
                 
                 # Update status but keep percentage as is
                 status_text = f"Processing additional artists (total: {total_to_process})"
-                self.update_progress.emit(self.current_value, status_text)
+                emit_now(self.current_value, status_text)
                 return True
             
-            # Detect Spotify progress format
-            spotify_progress_match = re.search(r'Progress: (\d+\.\d+)%', line)
-            if spotify_progress_match and not progress_match:  # Make sure we didn't already match above
+            # Detect Spotify progress format - every more specific progress pattern has
+            # already returned above, so this is only the fallback
+            spotify_progress_match = patterns['generic_progress'].search(line) if "Progress: " in line else None
+            if spotify_progress_match:
                 percentage = float(spotify_progress_match.group(1))
                 int_percentage = int(percentage)
-                self.update_progress.emit(int_percentage, f"Processing: {int_percentage}% complete")
+                emit(int_percentage, f"Processing: {int_percentage}% complete")
                 self.current_value = int_percentage
                 return True
             
             # Detect saving recommendations
             if "Saving recommendations" in line:
-                self.update_progress.emit(98, "Saving recommendations to file")
+                emit_now(98, "Saving recommendations to file")
                 return True
             
             # Detect completion of music discovery
             if "Music discovery complete" in line:
-                self.update_progress.emit(100, "Music Discovery completed successfully")
+                emit_now(100, "Music Discovery completed successfully")
                 return True
             
             # Return false if no progress was detected
@@ -973,29 +1187,61 @@ class ScriptWorker(QThread):
             return False
         
     def stop(self):
-        """Stop the running process safely."""
+        """
+        Stop the running process without blocking the caller.
+        
+        Returns straight away; the worker's finished signal fires once the process
+        has exited and run() has wrapped up.
+        """
+        if not self.process or not self.running:
+            return
         self.running = False
-        if self.process:
-            try:
-                self.process.terminate()
-                # Give it a moment to terminate gracefully
-                for _ in range(10):
-                    if self.process.poll() is not None:
-                        self.safe_emit_output("Process terminated gracefully")
-                        break
-                    time.sleep(0.1)
-                
-                # Force kill if still running
-                if self.process.poll() is None:
-                    self.process.kill()
-                    self.safe_emit_output("Process killed forcefully")
-            except Exception as e:
-                self.safe_emit_output(f"Error stopping process: {str(e)}")
+        try:
+            # The QProcess belongs to the worker thread, so ask its event loop to
+            # stop it rather than calling it from this thread
+            if sys.platform == 'win32':
+                # terminate() posts WM_CLOSE, which a console Python child ignores
+                QMetaObject.invokeMethod(self.process, "kill", Qt.QueuedConnection)
+                self.safe_emit_output("Process killed forcefully")
+            else:
+                QMetaObject.invokeMethod(self.process, "terminate", Qt.QueuedConnection)
+                # Give it a moment to terminate gracefully before forcing it
+                QTimer.singleShot(1000, self.force_kill)
+        except Exception as e:
+            self.safe_emit_output(f"Error stopping process: {str(e)}")
+    
+    def force_kill(self):
+        """Kill the process if it is still running after a terminate request."""
+        if self.isRunning() and self.process:
+            QMetaObject.invokeMethod(self.process, "kill", Qt.QueuedConnection)
+            self.safe_emit_output("Process killed forcefully")
 
 
 class SpotifyLauncher(QMainWindow):
     """Main window for the Spotify Launcher application."""
     
+    # Status patterns used by the progress slots, compiled once rather than looked up
+    # in the re module's cache on every progress update
+    STATUS_PATTERNS = {
+        # Directory-count progress that carries no useful status
+        'directory_progress': re.compile(r'directories\)$'),
+        # Same patterns the worker parses the script output with
+        'compilation_progress': ScriptWorker.LINE_PATTERNS['compilation_progress'],
+        'artist_directories': ScriptWorker.LINE_PATTERNS['artist_directories'],
+        # Worker status: Processing: X/Y artists
+        'artist_count': re.compile(r'Processing: (\d+)/(\d+) artists'),
+        # Genres: X/Y (Z%) - Artists: A/B
+        'genres_artists': re.compile(r'Genres: (\d+)/(\d+) \((\d+)%\) - Artists: (\d+)/(\d+)'),
+        # Genre X: Y/Z artists - Overall: A/B artists
+        'genre_artists': re.compile(r'Genre (.+?): (\d+)/(\d+) artists - Overall: (\d+)/(\d+) artists'),
+        # Processing: X.X% (Y/Z artists)
+        'artist_percentage': re.compile(r'Processing: (\d+\.\d+)% \((\d+)/(\d+) artists\)'),
+        # Any Progress: X% line
+        'progress_percentage': re.compile(r'Progress: (\d+(?:\.\d+)?)%'),
+        # ANSI colour codes
+        'ansi_colour': re.compile(r'\033\[\d+m'),
+    }
+    
     def __init__(self):
         """Initialize the Spotify Launcher."""
         super().__init__()
@@ -1149,21 +1395,28 @@ class SpotifyLauncher(QMainWindow):
         # Tabbed console output section
         self.output_tabs = QTabWidget()
         
-        # Tab for Music Discovery output
-        self.discovery_output = QTextEdit()
+        # Tab for Music Discovery output - plain text widgets, as the logs never use
+        # rich text and plain text layout is much cheaper for constant appends
+        self.discovery_output = QPlainTextEdit()
         self.discovery_output.setReadOnly(True)
+        self.discovery_output.setUndoRedoEnabled(False)
+        self.discovery_output.setMaximumBlockCount(LOG_MAX_BLOCKS)
         self.discovery_output.setFont(QFont("Consolas", 9))
         self.output_tabs.addTab(self.discovery_output, "Music Discovery Output")
         
         # Tab for Spotify Client output
-        self.spotify_output = QTextEdit()
+        self.spotify_output = QPlainTextEdit()
         self.spotify_output.setReadOnly(True)
+        self.spotify_output.setUndoRedoEnabled(False)
+        self.spotify_output.setMaximumBlockCount(LOG_MAX_BLOCKS)
         self.spotify_output.setFont(QFont("Consolas", 9))
         self.output_tabs.addTab(self.spotify_output, "Spotify Client Output")
         
         # Tab for debug output (hidden by default)
-        self.debug_output = QTextEdit()
+        self.debug_output = QPlainTextEdit()
         self.debug_output.setReadOnly(True)
+        self.debug_output.setUndoRedoEnabled(False)
+        self.debug_output.setMaximumBlockCount(LOG_MAX_BLOCKS)
         self.debug_output.setFont(QFont("Consolas", 9))
         
         # Add the output tabs to the main layout
@@ -1185,9 +1438,11 @@ class SpotifyLauncher(QMainWindow):
         # Store process references
         self.discovery_worker = None
         self.spotify_worker = None
+        self.stopping_workers = False  # Set once closing has asked the workers to stop
         
         # Create thread-safe logger
         self.logger = ThreadSafeLogger()
+        self.logger.bind_parent(self)
         handler = GuiLogHandler(lambda msg: self.logger.log_discovery(msg, self.discovery_output))
         handler.setLevel(logging.INFO)  # Or DEBUG if needed
         formatter = logging.Formatter('%(message)s')
@@ -1255,7 +1510,7 @@ class SpotifyLauncher(QMainWindow):
             current_widget = self.output_tabs.widget(index)
             
             # Ensure scroll to bottom for text edit widgets
-            if isinstance(current_widget, QTextEdit):
+            if isinstance(current_widget, QPlainTextEdit):
                 # Use the scrollbar directly for safe scrolling
                 scroll_bar = current_widget.verticalScrollBar()
                 if scroll_bar:
@@ -1335,12 +1590,49 @@ class SpotifyLauncher(QMainWindow):
         tab_selected = "#1F1F1F"         # Selected tab
         tab_hover = "#333333"            # Hovered tab
         
-        # Set main window background color
-        self.central_widget.setStyleSheet(f"background-color: {dark_bg};")
+        # Everything below goes into one stylesheet on the main window, so Qt resolves
+        # the styles once and child widgets pick them up through the cascade instead
+        # of each widget carrying (and re-polishing for) its own copy. Each rule is
+        # scoped by object name to the widgets it used to be set on, so other widgets
+        # in the window, and dialogs parented to it, are left alone.
+        themed_widgets = {
+            "discoveryButton": self.discovery_button,
+            "spotifyButton": self.spotify_button,
+            "discoveryOutput": self.discovery_output,
+            "spotifyOutput": self.spotify_output,
+            "debugOutput": self.debug_output,
+            "outputTabs": self.output_tabs,
+            "discoveryPhase1Label": self.discovery_phase1_label,
+            "discoveryPhase2Label": self.discovery_phase2_label,
+            "spotifyPhase1Label": self.spotify_phase1_label,
+            "spotifyPhase2Label": self.spotify_phase2_label,
+            "discoveryStatus": self.discovery_status,
+            "discoveryStatus2": self.discovery_status2,
+            "spotifyStatus1": self.spotify_status1,
+            "spotifyStatus2": self.spotify_status2,
+            "discoveryProgress": self.discovery_progress,
+            "discoveryProgress2": self.discovery_progress2,
+            "spotifyProgress1": self.spotify_progress1,
+            "spotifyProgress2": self.spotify_progress2,
+            "mainMenuBar": self.menuBar(),
+            "centralWidget": self.central_widget,
+        }
+        for name, widget in themed_widgets.items():
+            widget.setObjectName(name)
+        
+        def select(widget_type, names, suffix=""):
+            """Selector list matching the named widgets of one type."""
+            return ", ".join(f"{widget_type}#{name}{suffix}" for name in names)
+        
+        buttons = ("discoveryButton", "spotifyButton")
+        text_edits = ("discoveryOutput", "spotifyOutput", "debugOutput")
+        labels = ("discoveryPhase1Label", "discoveryPhase2Label", "spotifyPhase1Label", "spotifyPhase2Label",
+                  "discoveryStatus", "discoveryStatus2", "spotifyStatus1", "spotifyStatus2")
+        progress_bars = ("discoveryProgress", "discoveryProgress2", "spotifyProgress1", "spotifyProgress2")
         
         # Style for rounded buttons with Spotify green
         button_style = f"""
-            QPushButton {{
+            {select("QPushButton", buttons)} {{
                 border-radius: 8px;
                 background-color: {spotify_green};
                 border: none;
@@ -1349,23 +1641,23 @@ class SpotifyLauncher(QMainWindow):
                 font-weight: bold;
             }}
             
-            QPushButton:hover {{
+            {select("QPushButton", buttons, ":hover")} {{
                 background-color: {spotify_green_hover};
             }}
             
-            QPushButton:pressed {{
+            {select("QPushButton", buttons, ":pressed")} {{
                 background-color: {spotify_green_pressed};
             }}
             
-            QPushButton:disabled {{
+            {select("QPushButton", buttons, ":disabled")} {{
                 background-color: #444444;
                 color: #777777;
             }}
         """
         
-        # Style for text areas (QTextEdit)
+        # Style for text areas (QPlainTextEdit)
         textedit_style = f"""
-            QTextEdit {{
+            {select("QPlainTextEdit", text_edits)} {{
                 border-radius: 4px;
                 border: 1px solid {border_color};
                 padding: 5px;
@@ -1374,24 +1666,15 @@ class SpotifyLauncher(QMainWindow):
             }}
         """
         
-        # Apply styles to buttons
-        self.discovery_button.setStyleSheet(button_style)
-        self.spotify_button.setStyleSheet(button_style)
-        
-        # Apply styles to text areas
-        self.discovery_output.setStyleSheet(textedit_style)
-        self.spotify_output.setStyleSheet(textedit_style)
-        self.debug_output.setStyleSheet(textedit_style)
-        
-        # Style for the tab widget to match the dark theme
+        # Style for the tab widget to match the dark theme; its tab bar is a child
         tab_style = f"""
-            QTabWidget::pane {{
+            QTabWidget#outputTabs::pane {{
                 border-radius: 4px;
                 border: 1px solid {border_color};
                 background-color: {dark_accent};
             }}
             
-            QTabBar::tab {{
+            #outputTabs QTabBar::tab {{
                 border-radius: 4px 4px 0 0;
                 padding: 5px 10px;
                 margin-right: 2px;
@@ -1399,60 +1682,55 @@ class SpotifyLauncher(QMainWindow):
                 color: {muted_text};
             }}
             
-            QTabBar::tab:selected {{
+            #outputTabs QTabBar::tab:selected {{
                 background-color: {tab_selected};
                 color: {text_color};
             }}
             
-            QTabBar::tab:hover:!selected {{
+            #outputTabs QTabBar::tab:hover:!selected {{
                 background-color: {tab_hover};
             }}
         """
-        self.output_tabs.setStyleSheet(tab_style)
         
         # Style for labels
         label_style = f"""
-            QLabel {{
+            {select("QLabel", labels)} {{
                 color: {text_color};
             }}
         """
-        self.spotify_phase1_label.setStyleSheet(label_style)
-        self.spotify_phase2_label.setStyleSheet(label_style)
-        self.discovery_phase1_label.setStyleSheet(label_style)
-        self.discovery_phase2_label.setStyleSheet(label_style)
-        self.discovery_status.setStyleSheet(label_style)
-        self.discovery_status2.setStyleSheet(label_style)
-        self.spotify_status1.setStyleSheet(label_style)
-        self.spotify_status2.setStyleSheet(label_style)
         
         # NOTE: We're no longer modifying the title label here since it already has Spotify green styling
         
-        # Update menu bar to dark theme
+        # Update menu bar to dark theme; its menus are children of the menu bar
         menubar_style = f"""
-            QMenuBar {{
+            QMenuBar#mainMenuBar {{
                 background-color: {dark_bg};
                 color: {text_color};
             }}
-            QMenuBar::item {{
+            QMenuBar#mainMenuBar::item {{
                 background-color: {dark_bg};
                 color: {text_color};
             }}
-            QMenuBar::item:selected {{
+            QMenuBar#mainMenuBar::item:selected {{
                 background-color: {dark_accent};
             }}
-            QMenu {{
+            #mainMenuBar QMenu {{
                 background-color: {dark_bg};
                 color: {text_color};
                 border: 1px solid {border_color};
             }}
-            QMenu::item:selected {{
+            #mainMenuBar QMenu::item:selected {{
                 background-color: {dark_accent};
             }}
         """
-        self.menuBar().setStyleSheet(menubar_style)
         
-        # Set window background and title bar color
-        self.setStyleSheet(f"""
+        # Window and status bar backgrounds. The central widget's background also
+        # covers every widget inside it, as its own selector-less rule used to; it
+        # comes first so the more specific rules after it still win
+        window_style = f"""
+            #centralWidget, #centralWidget QWidget {{
+                background-color: {dark_bg};
+            }}
             QMainWindow {{
                 background-color: {dark_bg};
             }}
@@ -1460,11 +1738,11 @@ class SpotifyLauncher(QMainWindow):
                 background-color: {dark_bg};
                 color: {text_color};
             }}
-        """)
+        """
 
         # Style all progress bars with dark theme
         progress_bar_style = f"""
-            QProgressBar {{
+            {select("QProgressBar", progress_bars)} {{
                 border: 1px solid {border_color};
                 border-radius: 5px;
                 text-align: center;
@@ -1474,18 +1752,19 @@ class SpotifyLauncher(QMainWindow):
                 background-color: {progress_bg};
             }}
 
-            QProgressBar::chunk {{
+            {select("QProgressBar", progress_bars, "::chunk")} {{
                 background-color: {spotify_green};
                 width: 10px;
                 margin: 0.5px;
             }}
         """
         
-        # Apply the style to all progress bars
-        self.discovery_progress.setStyleSheet(progress_bar_style)
-        self.discovery_progress2.setStyleSheet(progress_bar_style)
-        self.spotify_progress1.setStyleSheet(progress_bar_style)
-        self.spotify_progress2.setStyleSheet(progress_bar_style)
+        # Apply the whole theme in one go (the progress bars' own segment colours and
+        # the title's green still take precedence over these window-level rules)
+        self.setStyleSheet("".join([
+            window_style, button_style, textedit_style, tab_style,
+            label_style, menubar_style, progress_bar_style
+        ]))
     
     def print_banner(self):
         """Print a colorful banner in the log."""
@@ -1833,8 +2112,7 @@ class SpotifyLauncher(QMainWindow):
             # Connect signals
             self.spotify_worker.update_progress.connect(self.update_spotify_progress)
             self.spotify_worker.script_finished.connect(self.spotify_finished)
-            self.spotify_worker.output_text.connect(self.log_status)
-            self.spotify_worker.console_output.connect(self.log_spotify_output)
+            self.spotify_worker.output_text.connect(self.log_spotify_worker_output)
             
             # Add arguments for API credentials if they're not the defaults
             extra_args = []
@@ -1984,8 +2262,7 @@ class SpotifyLauncher(QMainWindow):
             # Connect signals - need to ensure proper Qt connection type
             self.discovery_worker.update_progress.connect(self.update_discovery_progress, Qt.QueuedConnection)
             self.discovery_worker.script_finished.connect(self.discovery_finished, Qt.QueuedConnection)
-            self.discovery_worker.output_text.connect(self.log_status, Qt.QueuedConnection)
-            self.discovery_worker.console_output.connect(self.log_discovery_output, Qt.QueuedConnection)
+            self.discovery_worker.output_text.connect(self.log_discovery_worker_output, Qt.QueuedConnection)
 
             # Add arguments for music directory, MusicBrainz email, and to save recommendations in music directory
             self.discovery_worker.extra_args = ["--dir", music_dir, "--save-in-music-dir", "--email", musicbrainz_email]
@@ -2518,6 +2795,9 @@ class SpotifyLauncher(QMainWindow):
             self.toggle_debug_action.setChecked(current_visible)
             return
         
+        # Debugging the GUI also wants the console echo of every message and output line
+        ThreadSafeLogger.VERBOSE = ScriptWorker.VERBOSE = checked
+        
         # The tab is always there, we just need to handle showing/hiding it
         if checked:
             if self.output_tabs.indexOf(self.debug_output) == -1:
@@ -2728,6 +3008,19 @@ class SpotifyLauncher(QMainWindow):
         self.log_status(f"Script not found: {script_name}")
         return None
 
+    def timestamp_lines(self, message: str) -> str:
+        """
+        Prefix every line of a message with the current time for the output tabs.
+        
+        Args:
+            message (str): One line, or a chunk of newline-separated lines
+            
+        Returns:
+            str: The message with each line timestamped
+        """
+        timestamp = log_timestamp()
+        return "\n".join(f"[{timestamp}] {line}" for line in message.split("\n"))
+
     def log_status(self, message: str):
         """
         Thread-safe logging to add a message to the debug output.
@@ -2736,15 +3029,14 @@ class SpotifyLauncher(QMainWindow):
             message (str): Message to log
         """
         try:
-            # Always print to console as a backup
-            print(f"DEBUG: {message}")
+            # Print to console as a backup when debugging
+            if ThreadSafeLogger.VERBOSE:
+                print("DEBUG:", message)
             
             # Direct approach when in the main thread
             if QThread.currentThread() == QApplication.instance().thread():
                 if hasattr(self, 'debug_output') and self.debug_output is not None:
-                    timestamp = time.strftime("%H:%M:%S", time.localtime())
-                    formatted_message = f"[{timestamp}] {message}"
-                    self.debug_output.append(formatted_message)
+                    self.debug_output.appendPlainText(self.timestamp_lines(message))
                     self.debug_output.ensureCursorVisible()
             else:
                 # Use the logger when in a worker thread
@@ -2754,9 +3046,9 @@ class SpotifyLauncher(QMainWindow):
                     # Fallback using signals/slots
                     QMetaObject.invokeMethod(
                         self.debug_output,
-                        "append",
+                        "appendPlainText",
                         Qt.QueuedConnection,
-                        QArgument("QString", f"[{time.strftime('%H:%M:%S', time.localtime())}] {message}")
+                        QArgument("QString", self.timestamp_lines(message))
                     )
                     QMetaObject.invokeMethod(
                         self.debug_output,
@@ -2777,11 +3069,11 @@ class SpotifyLauncher(QMainWindow):
         try:
             # Direct approach when in the main thread
             if QThread.currentThread() == QApplication.instance().thread():
-                timestamp = time.strftime("%H:%M:%S", time.localtime())
-                formatted_message = f"[{timestamp}] {message}"
-                self.discovery_output.append(formatted_message)
+                self.discovery_output.appendPlainText(self.timestamp_lines(message))
                 self.discovery_output.ensureCursorVisible()
                 
+                # A chunk of output updates the status from its last line
+                message = message.rsplit("\n", 1)[-1]
                 # Update the appropriate status label based on the current phase
                 if self.discovery_various_artists_active:
                     # Update the second phase status label for various artists processing
@@ -2804,9 +3096,9 @@ class SpotifyLauncher(QMainWindow):
                     # Use invokeMethod directly as fallback
                     QMetaObject.invokeMethod(
                         self.discovery_output,
-                        "append",
+                        "appendPlainText",
                         Qt.QueuedConnection,
-                        QArgument("QString", f"[{time.strftime('%H:%M:%S', time.localtime())}] {message}")
+                        QArgument("QString", self.timestamp_lines(message))
                     )
                     QMetaObject.invokeMethod(
                         self.discovery_output,
@@ -2817,6 +3109,26 @@ class SpotifyLauncher(QMainWindow):
             # Last resort fallback
             print(f"Error in log_discovery_output: {e} - Message was: {message}")
 
+    def log_discovery_worker_output(self, message: str):
+        """
+        Log output from the Music Discovery worker to the debug log and its output tab.
+        
+        Args:
+            message (str): Line or chunk of lines from the worker
+        """
+        self.log_status(message)
+        self.log_discovery_output(message)
+
+    def log_spotify_worker_output(self, message: str):
+        """
+        Log output from the Spotify Client worker to the debug log and its output tab.
+        
+        Args:
+            message (str): Line or chunk of lines from the worker
+        """
+        self.log_status(message)
+        self.log_spotify_output(message)
+
     def log_spotify_output(self, message: str):
         """
         Thread-safe logging to add a message to the Spotify Client output.
@@ -2827,14 +3139,12 @@ class SpotifyLauncher(QMainWindow):
         try:
             # Direct approach when in the main thread
             if QThread.currentThread() == QApplication.instance().thread():
-                timestamp = time.strftime("%H:%M:%S", time.localtime())
-                formatted_message = f"[{timestamp}] {message}"
-                self.spotify_output.append(formatted_message)
+                self.spotify_output.appendPlainText(self.timestamp_lines(message))
                 self.spotify_output.ensureCursorVisible()
                 
-                # Update appropriate status label
+                # Update appropriate status label from the last line of the chunk
                 status_label = self.spotify_status2 if self.phase2_active else self.spotify_status1
-                status_label.setText(self.truncate_status(message))
+                status_label.setText(self.truncate_status(message.rsplit("\n", 1)[-1]))
             else:
                 # Use the logger when in a worker thread
                 if hasattr(self, 'logger') and self.logger is not None:
@@ -2846,9 +3156,9 @@ class SpotifyLauncher(QMainWindow):
                     # Use invokeMethod directly as fallback
                     QMetaObject.invokeMethod(
                         self.spotify_output,
-                        "append",
+                        "appendPlainText",
                         Qt.QueuedConnection,
-                        QArgument("QString", f"[{time.strftime('%H:%M:%S', time.localtime())}] {message}")
+                        QArgument("QString", self.timestamp_lines(message))
                     )
                     QMetaObject.invokeMethod(
                         self.spotify_output,
@@ -3072,7 +3382,7 @@ class SpotifyLauncher(QMainWindow):
             self.log_status(f"Progress update received: value={value}, status={status}")
             
             # IGNORE all directory-based progress that only has numbers
-            if "directories" in status and re.search(r'directories\)$', status):
+            if "directories" in status and self.STATUS_PATTERNS['directory_progress'].search(status):
                 self.log_status("Ignoring directory progress")
                 return
             
@@ -3107,7 +3417,7 @@ class SpotifyLauncher(QMainWindow):
             # If we're in various artists processing mode, update the second progress bar
             if self.discovery_various_artists_active:
                 # Check for compilation album progress pattern: (N/M compilation albums)
-                compilation_progress_match = re.search(r'Progress: (\d+(?:\.\d+)?)% \((\d+)/(\d+) compilation albums\)', status)
+                compilation_progress_match = self.STATUS_PATTERNS['compilation_progress'].search(status)
                 if compilation_progress_match:
                     percentage = float(compilation_progress_match.group(1))
                     current = int(compilation_progress_match.group(2))
@@ -3121,9 +3431,8 @@ class SpotifyLauncher(QMainWindow):
 
                 # Processing compilation album specific line
                 if "Processing compilation album:" in status:
-                    album_match = re.search(r'Processing compilation album: (.+)', status)
-                    if album_match:
-                        album_name = album_match.group(1)
+                    album_name = status.partition("Processing compilation album: ")[2]
+                    if album_name:
                         # Update status text to show current album name
                         self.discovery_status2.setText(f"Processing compilation album: {album_name}")
                         return
@@ -3157,7 +3466,7 @@ class SpotifyLauncher(QMainWindow):
                     return
                 
                 # Advanced artist processing pattern matching
-                artist_match = re.search(r'Processing: (\d+)/(\d+) artists', status)
+                artist_match = self.STATUS_PATTERNS['artist_count'].search(status)
 
                 if artist_match:
                     current = int(artist_match.group(1))
@@ -3204,17 +3513,16 @@ class SpotifyLauncher(QMainWindow):
 
                 # Detect artist directory counting
                 if "Found" in status and "artist directories with" in status:
-                    dirs_match = re.search(r'Found (\d+) artist directories with (\d+) potential album directories', status)
+                    dirs_match = self.STATUS_PATTERNS['artist_directories'].search(status)
                     if dirs_match:
                         artists = dirs_match.group(1)
                         albums = dirs_match.group(2)
                         self.discovery_status.setText(f"Found {artists} artists with {albums} albums")
                         return
                 
-                # Detect processing a specific artist
-                artist_processing = re.search(r'=== PROCESSING: (.+?) ===', status)
-                if artist_processing:
-                    artist_name = artist_processing.group(1)
+                # Detect processing a specific artist: "=== PROCESSING: <name> ==="
+                artist_name, marker_end, _ = status.partition("=== PROCESSING: ")[2].partition(" ===")
+                if marker_end and artist_name:
                     
                     # Truncate long artist names for display
                     if len(artist_name) > 30:
@@ -3336,7 +3644,7 @@ class SpotifyLauncher(QMainWindow):
                 # Check for specific progress patterns in phase 2
                 
                 # Check for "Genres: X/Y (Z%) - Artists: A/B" format
-                genres_artists_match = re.search(r'Genres: (\d+)/(\d+) \((\d+)%\) - Artists: (\d+)/(\d+)', status)
+                genres_artists_match = self.STATUS_PATTERNS['genres_artists'].search(status)
                 if genres_artists_match:
                     percentage = int(genres_artists_match.group(3))
                     # Update progress bar for Phase 2
@@ -3346,7 +3654,7 @@ class SpotifyLauncher(QMainWindow):
                     return
                 
                 # Check for "Genre X: Y/Z artists - Overall: A/B artists" format
-                genre_artists_match = re.search(r'Genre (.+?): (\d+)/(\d+) artists - Overall: (\d+)/(\d+) artists', status)
+                genre_artists_match = self.STATUS_PATTERNS['genre_artists'].search(status)
                 if genre_artists_match:
                     overall_current = int(genre_artists_match.group(4))
                     overall_total = int(genre_artists_match.group(5))
@@ -3379,7 +3687,7 @@ class SpotifyLauncher(QMainWindow):
                 # We're in phase 1
                 
                 # Check for artist progress pattern
-                artist_match = re.search(r'Processing: (\d+\.\d+)% \((\d+)/(\d+) artists\)', status)
+                artist_match = self.STATUS_PATTERNS['artist_percentage'].search(status)
                 if artist_match:
                     percentage = float(artist_match.group(1))
                     current = int(artist_match.group(2))
@@ -3393,9 +3701,9 @@ class SpotifyLauncher(QMainWindow):
                     self.spotify_status1.setText(self.truncate_status(status_text))
                     return
                 
-                # Check for simple percentage in status
-                percentage_match = re.search(r'Progress: (\d+(?:\.\d+)?)%', status)
-                if percentage_match and not artist_match:  # Only if we didn't already match above
+                # Check for simple percentage in status (artist progress has already returned above)
+                percentage_match = self.STATUS_PATTERNS['progress_percentage'].search(status)
+                if percentage_match:
                     percentage = float(percentage_match.group(1))
                     self.spotify_progress1.setValue(int(percentage))
                     
@@ -3531,7 +3839,7 @@ class SpotifyLauncher(QMainWindow):
             
     def truncate_status(self, status: str, max_length: int = 70) -> str:
         # Remove any ANSI color codes that might be in the text
-        status = re.sub(r'\033\[\d+m', '', status)
+        status = self.STATUS_PATTERNS['ansi_colour'].sub('', status)
         
         # Filter out common prefixes that don't add value in the status display
         prefixes_to_remove = [
@@ -3573,12 +3881,19 @@ class SpotifyLauncher(QMainWindow):
         Args:
             event: Close event
         """
-        # Terminate any running processes
-        if self.discovery_worker and self.discovery_worker.isRunning():
-            self.discovery_worker.stop()
-            
-        if self.spotify_worker and self.spotify_worker.isRunning():
-            self.spotify_worker.stop()
+        # Terminate any running processes, closing again once they have finished
+        # rather than blocking the UI while they exit
+        running_workers = [worker for worker in (self.discovery_worker, self.spotify_worker)
+                           if worker and worker.isRunning()]
+        if running_workers and not self.stopping_workers:
+            self.stopping_workers = True
+            for worker in running_workers:
+                worker.finished.connect(self.close)
+                worker.stop()
+        
+        if any(worker.isRunning() for worker in running_workers):
+            event.ignore()
+            return
             
         event.accept()
 
@@ -0,0 +1,66 @@
+"""Tests for ScriptWorker progress coalescing in spotifylauncher."""
+
+import pytest
+
+QtCore = pytest.importorskip("PyQt5.QtCore")
+import spotifylauncher  # noqa: E402
+
+
+@pytest.fixture
+def worker():
+    """A ScriptWorker recording every progress update it emits."""
+    app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+    worker = spotifylauncher.ScriptWorker("script.py", "Test Script")
+    worker.emitted = []
+    worker.update_progress.connect(lambda value, status: worker.emitted.append((value, status)))
+    yield worker
+    app.processEvents()
+
+
+def test_chunk_keeps_100_percent_update_followed_by_progress(worker):
+    """A 100% line followed by another progress line in one chunk still emits the 100%."""
+    worker.various_artists_phase = True
+
+    worker.handle_stdout_lines([
+        "Progress: 100.0% (5/5 compilation albums)",
+        "Progress: 40.0% (2/5 compilation albums)",
+    ])
+
+    assert (100, "Processing compilation album 5 of 5") in worker.emitted
+
+
+def test_chunk_coalesces_routine_progress_updates(worker):
+    """Routine updates within one chunk collapse to the latest one."""
+    worker.various_artists_phase = True
+
+    worker.handle_stdout_lines([
+        "Progress: 20.0% (1/5 compilation albums)",
+        "Progress: 40.0% (2/5 compilation albums)",
+    ])
+
+    assert worker.emitted == [(40, "Processing compilation album 2 of 5")]
+
+
+def test_flush_holds_update_inside_emit_interval(worker):
+    """An update arriving within PROGRESS_EMIT_INTERVAL of the last one is held until forced."""
+    worker.emit_progress(10, "First")
+    worker.emit_progress(20, "Second")
+
+    worker.flush_progress()
+    assert worker.emitted == [(10, "First")]
+    assert worker.pending_progress == (20, "Second")
+
+    worker.flush_progress(force=True)
+    assert worker.emitted == [(10, "First"), (20, "Second")]
+    assert worker.pending_progress is None
+
+
+def test_flush_sends_update_once_emit_interval_has_passed(worker):
+    """A held update goes out unforced once the interval since the last update is up."""
+    worker.emit_progress(10, "First")
+    worker.emit_progress(20, "Second")
+
+    worker.last_progress_emit -= worker.PROGRESS_EMIT_INTERVAL
+    worker.flush_progress()
+
+    assert worker.emitted == [(10, "First"), (20, "Second")]